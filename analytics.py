@@ -0,0 +1,208 @@
+import os
+from datetime import datetime
+
+from sqlalchemy import case, extract, func, insert, literal, select, union_all
+from sqlalchemy.orm import Session
+
+import models
+from cache import TTLCache
+
+# Analítica del pipeline calculada en la base (GROUP BY / funciones de ventana):
+# - embudo Nuevo -> Contactado -> Interesado -> Cliente (y en qué etapa se
+#   pierden los prospectos "Perdido"),
+# - tiempo en cada etapa, a partir de prospect_status_history,
+# - avance de tareas por asignado.
+# A Python solo llegan las filas ya agregadas (decenas, no millones). El
+# resultado se guarda en una caché con TTL: el reporte no necesita ser exacto
+# al segundo y así un dashboard con varios usuarios no repite las agregaciones.
+
+ANALYTICS_CACHE_TTL = float(os.getenv("ANALYTICS_CACHE_TTL", "300"))
+ANALYTICS_CACHE_SIZE = int(os.getenv("ANALYTICS_CACHE_SIZE", "64"))
+
+# Etapas del embudo en orden; "Perdido" es una salida desde cualquiera de ellas
+FUNNEL_STAGES = [s for s in models.PROSPECT_STATUSES if s != "Perdido"]
+LOST_STATUS = "Perdido"
+
+_cache = TTLCache(maxsize=ANALYTICS_CACHE_SIZE, ttl=ANALYTICS_CACHE_TTL)
+
+History = models.ProspectStatusHistory
+
+
+def cache_stats() -> dict:
+    return _cache.stats()
+
+
+# --- Escritura del historial ---
+
+def record_status(db: Session, prospect_id: int, from_status, to_status: str, user_id: int = None):
+    if from_status == to_status:
+        return
+    db.execute(insert(History).values(
+        prospect_id=prospect_id, from_status=from_status, to_status=to_status,
+        changed_at=datetime.utcnow(), changed_by_id=user_id,
+    ))
+
+
+def record_imported(db: Session, prospects):
+    # Alta masiva: un solo INSERT multi-fila por bloque
+    rows = [{"prospect_id": p.id, "from_status": None, "to_status": p.status,
+             "changed_at": p.created_at or datetime.utcnow(), "changed_by_id": p.created_by_id} for p in prospects]
+    if rows:
+        db.execute(insert(History), rows)
+
+
+# --- Consultas ---
+
+def _days_between(db: Session, start, end):
+    if db.get_bind().dialect.name == "postgresql":
+        return extract("epoch", end - start) / 86400.0
+    return func.julianday(end) - func.julianday(start)
+
+
+def _stage_rank(column):
+    return case({stage: rank for rank, stage in enumerate(FUNNEL_STAGES)}, value=column, else_=-1)
+
+
+def funnel(db: Session, since: datetime = None) -> list:
+    """Prospectos por etapa: cuántos están, cuántos llegaron y la conversión."""
+    P = models.Prospect
+    reached = (
+        select(History.prospect_id, func.max(_stage_rank(History.to_status)).label("reached"))
+        .group_by(History.prospect_id)
+        .subquery()
+    )
+    query = (
+        select(P.status, reached.c.reached, func.count().label("n"))
+        .select_from(P)
+        .outerjoin(reached, reached.c.prospect_id == P.id)
+        .group_by(P.status, reached.c.reached)
+    )
+    if since:
+        query = query.where(P.created_at >= since)
+
+    current = {status: 0 for status in models.PROSPECT_STATUSES}
+    reached_at_least = [0] * len(FUNNEL_STAGES)
+    lost_at = [0] * len(FUNNEL_STAGES)
+    for status, rank, count in db.execute(query):
+        current[status] = current.get(status, 0) + count
+        if rank is None or rank < 0:
+            # Sin historial: la etapa actual es lo más lejos que se sabe que llegó
+            rank = FUNNEL_STAGES.index(status) if status in FUNNEL_STAGES else 0
+        for stage in range(rank + 1):
+            reached_at_least[stage] += count
+        if status == LOST_STATUS:
+            lost_at[rank] += count
+
+    rows = []
+    for index, stage in enumerate(FUNNEL_STAGES):
+        previous = reached_at_least[index - 1] if index else None
+        rows.append({
+            "status": stage,
+            "current": current.get(stage, 0),
+            "reached": reached_at_least[index],
+            "conversion": round(reached_at_least[index] / previous, 4) if previous else None,
+            "lost": lost_at[index],
+        })
+    rows.append({"status": LOST_STATUS, "current": current.get(LOST_STATUS, 0),
+                 "reached": current.get(LOST_STATUS, 0), "conversion": None, "lost": None})
+    return rows
+
+
+def _round_days(value):
+    # Postgres devuelve numeric (Decimal), SQLite float
+    return round(float(value), 2) if value is not None else None
+
+
+def stage_times(db: Session, since: datetime = None, now: datetime = None) -> list:
+    """Días en cada etapa: promedio/máximo de las ya terminadas y antigüedad de las actuales."""
+    now = now or datetime.utcnow()
+    left_at = func.lead(History.changed_at).over(
+        partition_by=History.prospect_id, order_by=(History.changed_at, History.id)
+    )
+    periods = select(History.to_status, History.changed_at, left_at.label("left_at"))
+    if since:
+        periods = periods.join(models.Prospect, models.Prospect.id == History.prospect_id).where(
+            models.Prospect.created_at >= since
+        )
+    periods = periods.subquery()
+
+    finished = _days_between(db, periods.c.changed_at, periods.c.left_at)
+    open_for = _days_between(db, periods.c.changed_at, literal(now))
+    is_open = periods.c.left_at.is_(None)
+    query = (
+        select(
+            periods.c.to_status,
+            func.count(periods.c.left_at),
+            func.avg(finished),
+            func.max(finished),
+            func.sum(case((is_open, 1), else_=0)),
+            func.avg(case((is_open, open_for))),
+        )
+        .group_by(periods.c.to_status)
+    )
+    by_status = {row[0]: row for row in db.execute(query)}
+    result = []
+    for status in models.PROSPECT_STATUSES:
+        _, completed, avg_days, max_days, current, avg_current = by_status.get(status, (status, 0, None, None, 0, None))
+        result.append({
+            "status": status,
+            "completed": completed or 0,
+            "avg_days": _round_days(avg_days),
+            "max_days": _round_days(max_days),
+            "current": current or 0,
+            "avg_current_days": _round_days(avg_current),
+        })
+    return result
+
+
+def assignee_completion(db: Session, now: datetime = None) -> list:
+    """Tareas por asignado y estado, vencidas y tasa de completado (incluye las archivadas)."""
+    now = now or datetime.utcnow()
+    T, U, A = models.Task, models.User, models.task_assignments
+    AT, AA = models.ArchivedTask, models.archived_task_assignments
+    assigned = union_all(
+        select(A.c.user_id, T.status, T.end_date).join(T, T.id == A.c.task_id),
+        select(AA.c.user_id, AT.status, AT.end_date).join(AT, AT.id == AA.c.task_id),
+    ).subquery()
+
+    def count_status(status):
+        return func.sum(case((assigned.c.status == status, 1), else_=0))
+
+    query = (
+        select(
+            U.id, U.username, func.count(),
+            count_status(models.TaskStatus.TODO.value),
+            count_status(models.TaskStatus.IN_PROGRESS.value),
+            count_status(models.TaskStatus.DONE.value),
+            func.sum(case(((assigned.c.end_date < now) & (assigned.c.status != models.TaskStatus.DONE.value), 1),
+                          else_=0)),
+        )
+        .select_from(assigned)
+        .join(U, U.id == assigned.c.user_id)
+        .group_by(U.id, U.username)
+        .order_by(U.username)
+    )
+    return [
+        {
+            "user_id": user_id, "username": username, "total": total, "todo": todo or 0,
+            "in_progress": in_progress or 0, "done": done or 0, "overdue": overdue or 0,
+            "completion_rate": round((done or 0) / total, 4) if total else None,
+        }
+        for user_id, username, total, todo, in_progress, done, overdue in db.execute(query)
+    ]
+
+
+def pipeline_report(db: Session, since: datetime = None) -> dict:
+    key = ("pipeline", since)
+    report = _cache.get(key)
+    if report is None:
+        now = datetime.utcnow()
+        report = {
+            "generated_at": now,
+            "since": since,
+            "funnel": funnel(db, since),
+            "stage_times": stage_times(db, since, now),
+            "assignees": assignee_completion(db, now),
+        }
+        _cache.set(key, report)
+    return report
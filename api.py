@@ -0,0 +1,401 @@
+import hashlib
+from datetime import datetime, time, timedelta
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+import analytics
+import auth
+import bulk
+import ics
+import models
+import queries
+import search
+from database import get_db, request_session
+from schemas import ArchivedSubTaskOut, ArchivedTaskOut, BulkDelete, PipelineReport, ProspectOut, SearchHit, TaskOut
+
+# API JSON versionada sobre los mismos modelos y consultas que las vistas HTML.
+# Cada respuesta lleva un ETag calculado a partir de (id, updated_at) de las
+# filas devueltas: un cliente que hace polling con If-None-Match recibe 304 sin
+# que se carguen ni serialicen las filas completas.
+
+router = APIRouter(prefix="/api/v1", tags=["api"])
+
+MAX_LIMIT = 200
+
+
+def _parse_fields(fields: str, schema):
+    # ?fields=id,name,status -> solo esos campos en cada item
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - set(schema.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Campos desconocidos: {', '.join(sorted(unknown))}")
+    return requested
+
+
+def _etag(request: Request, versions, next_cursor: str = None) -> str:
+    # En listados paginados entra también el cursor siguiente: si aparecen filas
+    # después de una última página completa, la página no cambia pero ya no es
+    # la última ("next_cursor" deja de ser null)
+    digest = hashlib.sha1(request.url.query.encode())
+    for version in versions:
+        digest.update(repr(tuple(version)).encode())
+    digest.update(repr(next_cursor).encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in [tag.strip() for tag in header.split(",")]
+
+
+def _not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def _json(payload, etag: str) -> JSONResponse:
+    # no-cache: el cliente puede guardar la respuesta pero debe revalidarla
+    return JSONResponse(jsonable_encoder(payload), headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+
+def _dump(rows, schema, fields):
+    return [schema.model_validate(row).model_dump(include=fields) for row in rows]
+
+
+# --- Prospectos ---
+
+@router.get("/prospects")
+def list_prospects(
+    request: Request,
+    after: str = None,
+    limit: int = Query(queries.PAGE_SIZE, ge=1, le=MAX_LIMIT),
+    status: str = None,
+    industry: str = None,
+    creator_id: int = None,
+    fields: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    selected = _parse_fields(fields, ProspectOut)
+    filters = {"status": status, "industry": industry, "creator_id": creator_id}
+
+    # Primero solo las versiones de la página (consulta liviana sobre el índice)
+    P = models.Prospect
+    versions_query = queries.filter_prospects(db.query(P.id, P.created_at, P.updated_at), **filters)
+    versions, next_cursor = queries.keyset_page(versions_query, queries.PROSPECT_ORDER, after, limit, descending=True)
+    etag = _etag(request, [(v.id, v.updated_at) for v in versions], next_cursor)
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+
+    prospects, next_cursor = queries.prospects_page(db, cursor=after, limit=limit, **filters)
+    etag = _etag(request, [(p.id, p.updated_at) for p in prospects], next_cursor)
+    return _json({"items": _dump(prospects, ProspectOut, selected), "next_cursor": next_cursor}, etag)
+
+
+@router.post("/prospects/import")
+def import_prospects(
+    file: UploadFile = File(...),
+    format: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Alta masiva desde CSV/JSONL; devuelve el reporte con errores por línea
+    fmt = format or ("jsonl" if (file.filename or "").endswith((".jsonl", ".ndjson")) else "csv")
+    if fmt not in bulk.FORMATS:
+        raise HTTPException(status_code=400, detail=f"Formato no soportado: {fmt}")
+    return bulk.import_prospects(db, file.file, fmt, created_by_id=current_user.id)
+
+
+@router.post("/prospects/delete")
+def delete_prospects(
+    payload: BulkDelete,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Notas, tareas e historial caen con ellos en la base (ON DELETE CASCADE)
+    ids = bulk.delete_prospects(db, payload.ids)
+    db.commit()
+    return {"deleted": len(ids), "ids": ids}
+
+
+@router.get("/prospects/export")
+def export_prospects(
+    format: str = "csv",
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    if format not in bulk.FORMATS:
+        raise HTTPException(status_code=400, detail=f"Formato no soportado: {format}")
+
+    # El generador abre su propia sesión: vive mientras dure el streaming
+    # (en una réplica, si hay: es la lectura más pesada de la API)
+    def stream():
+        db = request_session()
+        try:
+            yield from bulk.export_prospects(db, format)
+        finally:
+            db.close()
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="prospectos.{format}"'}
+    return StreamingResponse(stream(), media_type=media_type, headers=headers)
+
+
+# --- Opciones de los <select> (búsqueda por nombre, ver queries.prospect_choices) ---
+
+def _choices(rows, next_cursor, name):
+    return {"items": [{"id": row.id, "name": getattr(row, name)} for row in rows], "next_cursor": next_cursor}
+
+
+@router.get("/prospects/choices")
+def prospect_choices(
+    q: str = None,
+    after: str = None,
+    limit: int = Query(queries.CHOICES_LIMIT, ge=1, le=MAX_LIMIT),
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    return _choices(*queries.prospect_choices(db, q=q, cursor=after, limit=limit), "name")
+
+
+@router.get("/users/choices")
+def user_choices(
+    q: str = None,
+    after: str = None,
+    limit: int = Query(queries.CHOICES_LIMIT, ge=1, le=MAX_LIMIT),
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    return _choices(*queries.user_choices(db, q=q, cursor=after, limit=limit), "username")
+
+
+@router.get("/prospects/{prospect_id}")
+def get_prospect(
+    request: Request,
+    prospect_id: int,
+    fields: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    selected = _parse_fields(fields, ProspectOut)
+    prospect = db.get(models.Prospect, prospect_id)
+    if not prospect:
+        raise HTTPException(status_code=404, detail="Prospecto no encontrado")
+    etag = _etag(request, [(prospect.id, prospect.updated_at)])
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+    return _json(ProspectOut.model_validate(prospect).model_dump(include=selected), etag)
+
+
+# --- Tareas ---
+
+@router.get("/tasks")
+def list_tasks(
+    request: Request,
+    after: str = None,
+    limit: int = Query(queries.PAGE_SIZE, ge=1, le=MAX_LIMIT),
+    status: str = None,
+    prospect_id: int = None,
+    assignee_id: int = None,
+    industry: str = None,
+    creator_id: int = None,
+    fields: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    selected = _parse_fields(fields, TaskOut)
+    filters = {"prospect_id": prospect_id, "assignee_id": assignee_id, "industry": industry, "creator_id": creator_id}
+
+    T = models.Task
+    versions_query = db.query(T.id, T.updated_at)
+    if status:
+        versions_query = versions_query.filter(T.status == status)
+    versions_query = queries.filter_tasks(versions_query, **filters)
+    versions, next_cursor = queries.keyset_page(versions_query, queries.TASK_ORDER, after, limit)
+    etag = _etag(request, versions, next_cursor)
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+
+    tasks, next_cursor = queries.tasks_page(db, cursor=after, limit=limit, status=status, **filters)
+    etag = _etag(request, [(t.id, t.updated_at) for t in tasks], next_cursor)
+    return _json({"items": _dump(tasks, TaskOut, selected), "next_cursor": next_cursor}, etag)
+
+
+@router.post("/tasks/delete")
+def delete_tasks(
+    payload: BulkDelete,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    ids = bulk.delete_tasks(db, payload.ids)
+    db.commit()
+    return {"deleted": len(ids), "ids": ids}
+
+
+@router.get("/tasks/{task_id}")
+def get_task(
+    request: Request,
+    task_id: int,
+    fields: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    selected = _parse_fields(fields, TaskOut)
+    task = queries.task_detail(db, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Tarea no encontrada")
+    etag = _etag(request, [(task.id, task.updated_at)])
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+    return _json(TaskOut.model_validate(task).model_dump(include=selected), etag)
+
+
+# --- Calendario ---
+
+@router.get("/calendar")
+def calendar(
+    request: Request,
+    start: datetime = None,
+    end: datetime = None,
+    after: str = None,
+    limit: int = Query(queries.PAGE_SIZE, ge=1, le=MAX_LIMIT),
+    prospect_id: int = None,
+    assignee_id: int = None,
+    fields: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Tareas con fecha de entrega en [start, end), ordenadas por fecha
+    selected = _parse_fields(fields, TaskOut)
+    filters = {"prospect_id": prospect_id, "assignee_id": assignee_id}
+
+    T = models.Task
+    versions_query = queries.filter_tasks(queries.filter_calendar(db.query(T.id, T.end_date, T.updated_at), start, end), **filters)
+    versions, next_cursor = queries.keyset_page(versions_query, queries.CALENDAR_ORDER, after, limit)
+    etag = _etag(request, [(v.id, v.updated_at) for v in versions], next_cursor)
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+
+    tasks, next_cursor = queries.calendar_page(db, start, end, cursor=after, limit=limit, **filters)
+    etag = _etag(request, [(t.id, t.updated_at) for t in tasks], next_cursor)
+    return _json({"items": _dump(tasks, TaskOut, selected), "next_cursor": next_cursor}, etag)
+
+
+
+# Ventana del feed .ics relativa a hoy (los clientes lo consultan periódicamente)
+FEED_PAST_DAYS = 90
+FEED_FUTURE_DAYS = 365
+
+
+@router.get("/calendar.ics")
+def calendar_feed(
+    request: Request,
+    token: str,
+    assignee_id: int = None,
+    prospect_id: int = None,
+    status: str = None,
+    db: Session = Depends(get_db)
+):
+    # Autenticado por el token de la URL (ver auth.create_feed_token)
+    if not auth.get_feed_user(db, token):
+        raise HTTPException(status_code=401, detail="Token de feed inválido")
+
+    today = datetime.combine(datetime.utcnow().date(), time.min)
+    start, end = today - timedelta(days=FEED_PAST_DAYS), today + timedelta(days=FEED_FUTURE_DAYS)
+    filters = {"assignee_id": assignee_id, "prospect_id": prospect_id}
+
+    # Versión de la ventana con un solo agregado: si no cambió, 304 sin generar el feed.
+    # Sin Last-Modified: borrar una tarea no cambia max(updated_at), y un cliente
+    # que solo envía If-Modified-Since seguiría mostrándola. Solo vale el ETag
+    # (cantidad, id máximo y última modificación).
+    count, max_id, last_modified = queries.calendar_version(db, start, end, status, **filters)
+    etag = _etag(request, [(start, count, max_id, last_modified)])
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    def stream():
+        session = request_session()
+        try:
+            yield from ics.feed(session, start, end, status, **filters)
+        finally:
+            session.close()
+
+    headers["Content-Disposition"] = 'inline; filename="crm.ics"'
+    return StreamingResponse(stream(), media_type="text/calendar; charset=utf-8", headers=headers)
+
+# --- Búsqueda ---
+
+@router.get("/search")
+def search_documents(
+    q: str,
+    page: int = Query(1, ge=1, le=search.MAX_PAGE),
+    limit: int = Query(search.PAGE_SIZE, ge=1, le=MAX_LIMIT),
+    kind: str = Query(None, pattern="^(prospect|note|task)$"),
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Paginación por offset: el orden es por relevancia, no hay clave estable para keyset
+    hits, has_more = search.search(db, q, page=page, page_size=limit, kind=kind)
+    return {"items": [SearchHit(**hit).model_dump() for hit in hits], "page": page, "has_more": has_more}
+
+
+# --- Archivo (tareas y subtareas completadas antiguas, ver archive.py) ---
+
+@router.get("/archive/tasks")
+def list_archived_tasks(
+    request: Request,
+    after: str = None,
+    limit: int = Query(queries.PAGE_SIZE, ge=1, le=MAX_LIMIT),
+    prospect_id: int = None,
+    assignee_id: int = None,
+    fields: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    selected = _parse_fields(fields, ArchivedTaskOut)
+    tasks, next_cursor = queries.archived_tasks_page(db, cursor=after, limit=limit,
+                                                     prospect_id=prospect_id, assignee_id=assignee_id)
+    # Lo archivado no se modifica: la versión es (id, archived_at)
+    etag = _etag(request, [(t.id, t.archived_at) for t in tasks], next_cursor)
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+    return _json({"items": _dump(tasks, ArchivedTaskOut, selected), "next_cursor": next_cursor}, etag)
+
+
+@router.get("/archive/subtasks")
+def list_archived_subtasks(
+    request: Request,
+    after: str = None,
+    limit: int = Query(queries.PAGE_SIZE, ge=1, le=MAX_LIMIT),
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Las subtareas son personales: solo las del usuario actual
+    subtasks, next_cursor = queries.archived_subtasks_page(db, current_user.id, cursor=after, limit=limit)
+    etag = _etag(request, [(s.id, s.archived_at) for s in subtasks], next_cursor)
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+    return _json({"items": _dump(subtasks, ArchivedSubTaskOut, None), "next_cursor": next_cursor}, etag)
+
+
+# --- Analítica ---
+
+@router.get("/analytics/pipeline", response_model=PipelineReport)
+def pipeline_analytics(
+    response: Response,
+    since: datetime = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Embudo, tiempo por etapa y avance por asignado, agregados en SQL y
+    # cacheados ANALYTICS_CACHE_TTL segundos (generated_at indica la antigüedad)
+    response.headers["Cache-Control"] = f"private, max-age={int(analytics.ANALYTICS_CACHE_TTL)}"
+    return analytics.pipeline_report(db, since)
@@ -0,0 +1,186 @@
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+import events
+import models
+import search
+from database import IS_SERVERLESS, SessionLocal
+
+# Archivado de tareas y subtareas completadas.
+# Las que llevan más de ARCHIVE_AFTER_DAYS en "done" (por updated_at) se mueven
+# a archived_tasks / archived_task_assignments / archived_subtasks: el tablero,
+# el detalle de prospecto y el perfil solo leen las tablas vivas, que quedan
+# acotadas a lo activo y lo completado reciente.
+# - Por bloques de ARCHIVE_BATCH_SIZE, cada uno en su propia transacción
+#   (bloqueos cortos, sin una transacción gigante la primera vez).
+# - En segundo plano cada ARCHIVE_INTERVAL segundos (hilo por proceso; 0 lo
+#   apaga, por defecto apagado en serverless) o desde cron:
+#       python archive.py
+# Las tareas archivadas salen del índice de búsqueda y se consultan en
+# /planning/archivo y /api/v1/archive/...
+
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+ARCHIVE_INTERVAL = float(os.getenv("ARCHIVE_INTERVAL", "0" if IS_SERVERLESS else "3600"))
+
+DONE = models.TaskStatus.DONE.value
+
+T, S, A = models.Task, models.SubTask, models.task_assignments
+AT, AS, AA = models.ArchivedTask, models.ArchivedSubTask, models.archived_task_assignments
+
+TASK_COLUMNS = ("id", "title", "description", "status", "start_date", "end_date", "created_at", "updated_at",
+                "prospect_id")
+SUBTASK_COLUMNS = ("id", "title", "status", "created_at", "updated_at", "user_id", "task_id")
+
+_lock = threading.Lock()
+_stats = {"runs": 0, "tasks": 0, "subtasks": 0, "errors": 0, "last_run": None}
+
+
+def stats() -> dict:
+    with _lock:
+        return dict(_stats)
+
+
+def _candidates(db: Session, model, cutoff: datetime, limit: int) -> list:
+    # Los ids no se reutilizan (AUTOINCREMENT en SQLite, migración 0011): un id
+    # archivado no puede volver a aparecer en las tablas vivas
+    query = select(model.id).where(model.status == DONE, model.updated_at < cutoff)
+    return list(db.scalars(query.order_by(model.id).limit(limit)))
+
+
+def _copy(db: Session, source, target, columns, where, archived_at: datetime):
+    db.execute(
+        insert(target).from_select(
+            list(columns) + ["archived_at"],
+            select(*[getattr(source, c) for c in columns], literal(archived_at)).where(where),
+        )
+    )
+
+
+def _delete(db: Session, table, where):
+    # Sin sincronizar la sesión: las filas archivadas no se cargaron en ella
+    db.execute(delete(table).where(where).execution_options(synchronize_session=False))
+
+
+def archive_tasks_batch(db: Session, cutoff: datetime, limit: int = ARCHIVE_BATCH_SIZE) -> int:
+    """Mueve un bloque de tareas completadas (con asignaciones y subtareas) al archivo."""
+    task_ids = _candidates(db, T, cutoff, limit)
+    if not task_ids:
+        return 0
+    now = datetime.utcnow()
+    # Para que los tableros abiertos quiten las tarjetas (evento "archived")
+    owners = {}
+    for task_id, user_id in db.execute(select(A.c.task_id, A.c.user_id).where(A.c.task_id.in_(task_ids))):
+        owners.setdefault(task_id, []).append(user_id)
+    prospects = dict(db.execute(select(T.id, T.prospect_id).where(T.id.in_(task_ids))).all())
+
+    _copy(db, T, AT, TASK_COLUMNS, T.id.in_(task_ids), now)
+    db.execute(insert(AA).from_select(["task_id", "user_id"],
+                                      select(A.c.task_id, A.c.user_id).where(A.c.task_id.in_(task_ids))))
+    _copy(db, S, AS, SUBTASK_COLUMNS, S.task_id.in_(task_ids), now)
+    _delete(db, S, S.task_id.in_(task_ids))
+    _delete(db, A, A.c.task_id.in_(task_ids))
+    _delete(db, T, T.id.in_(task_ids))
+    search.remove_tasks(db, task_ids)
+    for task_id in task_ids:
+        events.emit(db, "task", "archived", task_id, prospects.get(task_id), owners.get(task_id, ()))
+    # Las tareas completadas no cuentan como abiertas: los contadores del dashboard no cambian
+    return len(task_ids)
+
+
+def archive_subtasks_batch(db: Session, cutoff: datetime, limit: int = ARCHIVE_BATCH_SIZE) -> int:
+    """Mueve un bloque de subtareas completadas cuya tarea padre sigue activa."""
+    sub_ids = _candidates(db, S, cutoff, limit)
+    if not sub_ids:
+        return 0
+    _copy(db, S, AS, SUBTASK_COLUMNS, S.id.in_(sub_ids), datetime.utcnow())
+    _delete(db, S, S.id.in_(sub_ids))
+    return len(sub_ids)
+
+
+def run(after_days: int = None, batch_size: int = None, max_batches: int = None) -> dict:
+    """Una pasada completa: archiva por bloques hasta que no quede nada pendiente."""
+    after_days = ARCHIVE_AFTER_DAYS if after_days is None else after_days
+    batch_size = batch_size or ARCHIVE_BATCH_SIZE
+    cutoff = datetime.utcnow() - timedelta(days=after_days)
+    moved = {"tasks": 0, "subtasks": 0}
+    db = SessionLocal()
+    try:
+        for kind, archive_batch in (("tasks", archive_tasks_batch), ("subtasks", archive_subtasks_batch)):
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                try:
+                    count = archive_batch(db, cutoff, batch_size)
+                    db.commit()
+                except SQLAlchemyError as exc:
+                    # P. ej. dos procesos archivando el mismo bloque: el otro ya lo movió
+                    db.rollback()
+                    with _lock:
+                        _stats["errors"] += 1
+                    print(f"WARNING: Archive batch of {kind} failed. {exc}")
+                    break
+                moved[kind] += count
+                batches += 1
+                if count < batch_size:
+                    break
+    finally:
+        db.close()
+    with _lock:
+        _stats["runs"] += 1
+        _stats["tasks"] += moved["tasks"]
+        _stats["subtasks"] += moved["subtasks"]
+        _stats["last_run"] = datetime.utcnow()
+    if moved["tasks"] or moved["subtasks"]:
+        print(f"INFO: Archived {moved['tasks']} tasks and {moved['subtasks']} subtasks "
+              f"completed more than {after_days} days ago.")
+    return moved
+
+
+# --- Pasadas en segundo plano ---
+
+_worker = None
+_stop = threading.Event()
+
+
+def _loop(interval: float):
+    # Desfase inicial al azar: con varios workers no archivan todos a la vez
+    if _stop.wait(random.uniform(0, min(interval, 60))):
+        return
+    while not _stop.is_set():
+        started = time.monotonic()
+        try:
+            run()
+        except Exception as exc:
+            print(f"WARNING: Archive pass failed. {exc}")
+        _stop.wait(max(interval - (time.monotonic() - started), 1))
+
+
+def start_worker(interval: float = None):
+    global _worker
+    interval = ARCHIVE_INTERVAL if interval is None else interval
+    if interval <= 0 or _worker is not None:
+        return
+    _stop.clear()
+    _worker = threading.Thread(target=_loop, args=(interval,), name="archive-worker", daemon=True)
+    _worker.start()
+    print(f"INFO: Archiving done tasks older than {ARCHIVE_AFTER_DAYS} days every {interval:g} s.")
+
+
+def stop_worker():
+    global _worker
+    _stop.set()
+    _worker = None
+
+
+if __name__ == "__main__":
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    result = run(after_days=days)
+    print(f"Tareas archivadas: {result['tasks']}, subtareas: {result['subtasks']}")
@@ -0,0 +1,95 @@
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+
+from templating import PRODUCTION
+
+# Archivos estáticos con huella de contenido.
+# - static_url('js/app.js') (global de Jinja) devuelve /static/js/app.<hash>.js,
+#   con el hash del contenido actual del archivo.
+# - StaticAssets sirve esa URL desde el archivo original (no hay copias con
+#   hash en disco: nada que generar en el build ni que escribir en serverless)
+#   con "Cache-Control: immutable" de un año: el navegador no vuelve a pedirlo.
+#   Un cambio en el archivo cambia el hash y con él la URL.
+# - Las URL sin hash (o con un hash viejo, de una página cacheada antes de un
+#   deploy) se sirven con "no-cache": el navegador revalida con ETag.
+
+BASE_DIR = Path(__file__).resolve().parent
+STATIC_DIR = BASE_DIR / "static"
+STATIC_PREFIX = "/static"
+
+# En desarrollo el hash se recalcula si el archivo cambió (mtime/tamaño);
+# en producción se calcula una vez por proceso
+ASSETS_AUTO_RELOAD = os.getenv("ASSETS_AUTO_RELOAD", "0" if PRODUCTION else "1") == "1"
+IMMUTABLE_MAX_AGE = int(os.getenv("STATIC_MAX_AGE", str(365 * 24 * 3600)))
+
+HASH_LENGTH = 12
+# js/app.0123456789ab.js -> (js/app, 0123456789ab, .js)
+_HASHED_RE = re.compile(r"^(.+)\.([0-9a-f]{%d})(\.[^./]+)$" % HASH_LENGTH)
+
+_hashes = {}  # ruta relativa -> (mtime_ns, tamaño, hash)
+_lock = threading.Lock()
+
+
+def _resolve(path: str):
+    # Solo archivos dentro de STATIC_DIR
+    full = (STATIC_DIR / path).resolve()
+    if STATIC_DIR.resolve() not in full.parents or not full.is_file():
+        return None
+    return full
+
+
+def digest(path: str):
+    """Hash del contenido de static/<path>, o None si el archivo no existe."""
+    cached = _hashes.get(path)
+    if cached is not None and not ASSETS_AUTO_RELOAD:
+        return cached[2]
+    full = _resolve(path)
+    if full is None:
+        return None
+    stat = full.stat()
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    value = hashlib.sha1(full.read_bytes()).hexdigest()[:HASH_LENGTH]
+    with _lock:
+        _hashes[path] = (stat.st_mtime_ns, stat.st_size, value)
+    return value
+
+
+def url(path: str) -> str:
+    path = path.lstrip("/")
+    value = digest(path)
+    if value is None:
+        return f"{STATIC_PREFIX}/{path}"
+    stem, ext = os.path.splitext(path)
+    return f"{STATIC_PREFIX}/{stem}.{value}{ext}"
+
+
+def install(env):
+    """Registra static_url() como global de Jinja (lo usa layout.html)."""
+    env.globals["static_url"] = url
+
+
+class StaticAssets(StaticFiles):
+    """StaticFiles que entiende las URL con hash y fija Cache-Control."""
+
+    async def get_response(self, path: str, scope):
+        match = _HASHED_RE.match(path.replace(os.sep, "/"))
+        immutable = False
+        if match:
+            original = match[1] + match[3]
+            current = await anyio.to_thread.run_sync(digest, original)
+            if current is not None:
+                immutable = current == match[2]
+                path = original
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = (
+                f"public, max-age={IMMUTABLE_MAX_AGE}, immutable" if immutable else "no-cache"
+            )
+        return response
@@ -1,10 +1,16 @@
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy import event
 from sqlalchemy.orm import Session
+from cache import TTLCache
 from database import get_db
 from models import User
 
@@ -13,16 +19,51 @@ SECRET_KEY = "tu_clave_secreta_super_segura_cambiala_en_prod"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 # 1 día
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+# passlib/bcrypt y jose se importan en el primer uso y no en el arranque:
+# en serverless cada cold start paga los imports antes de la primera respuesta.
+_pwd_context = None
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+def password_context():
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
+
+# bcrypt tarda cientos de ms por hash: corre siempre en un executor dedicado
+# para no bloquear el event loop ni ocupar el threadpool de las rutas.
+# Sus hilos bajan de prioridad en el SO (nice PASSWORD_HASH_NICE, Linux): con
+# pocos CPUs el hash compite por el núcleo con el event loop y las páginas
+# esperarían su turno del planificador; así el hash usa el CPU que sobra.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(2, os.cpu_count() or 1))))
+PASSWORD_HASH_NICE = int(os.getenv("PASSWORD_HASH_NICE", "10"))
+
+def _lower_hash_thread_priority():
+    # Solo en Linux la prioridad es por hilo (id nativo del hilo); en otros
+    # sistemas ese id no es un pid y no se toca nada
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), PASSWORD_HASH_NICE)
+    except OSError:
+        pass
+
+_password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt", initializer=_lower_hash_thread_priority
+)
+
+async def verify_password(plain_password, hashed_password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, password_context().verify, plain_password, hashed_password)
+
+async def get_password_hash(password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, password_context().hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    from jose import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -32,25 +73,99 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(request: Request, db: Session = Depends(get_db)):
+# Identidad del usuario autenticado. Se guarda en caché por "sub" del token
+# para que las peticiones autenticadas no consulten la tabla users cada vez.
+@dataclass(frozen=True)
+class CurrentUser:
+    id: int
+    username: str
+    is_active: bool
+
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "1024"))
+user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+def invalidate_user(username: str):
+    user_cache.delete(username)
+
+def user_cache_stats() -> dict:
+    return user_cache.stats()
+
+@event.listens_for(User.is_active, "set")
+def _on_user_active_changed(target, value, oldvalue, initiator):
+    # Desactivar (o reactivar) un usuario invalida su identidad en caché
+    if target.username:
+        invalidate_user(target.username)
+
+def get_current_user(request: Request, db: Session = Depends(get_db)) -> Optional[CurrentUser]:
     token = request.cookies.get("access_token")
     if not token:
         return None
+    from jose import JWTError, jwt
     
     # El token en cookie suele venir como "Bearer <token>" o solo <token>.
     # Aquí asumimos que guardamos solo el token limpio.
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
-        if username is None:
+        if username is None or payload.get("scope"):
+            # Los tokens con scope (p.ej. el del feed .ics) no valen como sesión
             return None
     except JWTError:
         return None
     
+    return _load_identity(db, username)
+
+def _load_identity(db: Session, username: str) -> Optional[CurrentUser]:
+    identity = user_cache.get(username)
+    if identity is not None:
+        return identity
+
     user = db.query(User).filter(User.username == username).first()
-    return user
+    if not user:
+        return None
+    identity = CurrentUser(id=user.id, username=user.username, is_active=user.is_active)
+    user_cache.set(username, identity)
+    return identity
+
+# Token del feed .ics: los clientes de calendario no envían la cookie de sesión,
+# así que la URL del feed lleva su propio token firmado, con "scope" propio para
+# que no sirva como token de sesión. Los clientes sincronizan la URL desde sus
+# servidores: el token lleva la versión del usuario (regenerar el enlace desde
+# el perfil revoca los anteriores) y vence a los FEED_TOKEN_DAYS días.
+FEED_TOKEN_SCOPE = "calendar-feed"
+FEED_TOKEN_DAYS = int(os.getenv("FEED_TOKEN_DAYS", "365"))
+
+def create_feed_token(username: str, version: int) -> str:
+    from jose import jwt
+    expire = datetime.utcnow() + timedelta(days=FEED_TOKEN_DAYS)
+    return jwt.encode({"sub": username, "scope": FEED_TOKEN_SCOPE, "ver": version, "exp": expire},
+                      SECRET_KEY, algorithm=ALGORITHM)
+
+def feed_token_for(db: Session, user_id: int) -> str:
+    username, version = db.query(User.username, User.feed_token_version).filter(User.id == user_id).one()
+    return create_feed_token(username, version)
+
+def regenerate_feed_token(db: Session, user_id: int):
+    db.query(User).filter(User.id == user_id).update(
+        {User.feed_token_version: User.feed_token_version + 1}, synchronize_session=False
+    )
+
+def get_feed_user(db: Session, token: str) -> Optional[CurrentUser]:
+    from jose import JWTError, jwt
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("scope") != FEED_TOKEN_SCOPE or not payload.get("sub") or "exp" not in payload:
+        return None
+    # Sin la caché de identidad: un enlace regenerado deja de valer al instante en todos los procesos
+    user = db.query(User).filter(User.username == payload["sub"]).first()
+    if user is None or not user.is_active or user.feed_token_version != payload.get("ver"):
+        return None
+    return CurrentUser(id=user.id, username=user.username, is_active=user.is_active)
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)):
+async def get_current_active_user(current_user: CurrentUser = Depends(get_current_user)):
     if not current_user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
     if not current_user.is_active:
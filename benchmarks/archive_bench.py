@@ -0,0 +1,138 @@
+"""Latencia del tablero a medida que crece el historial de tareas completadas.
+
+Sobre una base sembrada a escala 1k se agregan, por etapas, tareas completadas
+antiguas (con asignados y subtareas) y en cada etapa se mide la mediana de:
+  - /planning, /planning?assignee_id=1: columnas del kanban,
+  - /prospectos/1: detalle de prospecto (carga todas sus tareas),
+  - /profile: tareas asignadas y subtareas del usuario.
+Se comparan dos procesos, cada uno con su propia base:
+  - sin archivo: el historial se queda en las tablas vivas,
+  - con archivo: después de cada etapa corre archive.run() (lo que haría el
+    worker en segundo plano) y el historial pasa a las tablas de archivo.
+
+Uso:
+    python benchmarks/archive_bench.py [--steps 0,10000,50000] [--requests 20]
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+HERE = Path(__file__).resolve()
+PAGES = ("/planning", "/planning?assignee_id=1", "/prospectos/1", "/profile")
+
+
+def grow_history(conn, n: dict, start_id: int, count: int, rnd):
+    # Tareas completadas hace 60-700 días, repartidas entre prospectos y usuarios
+    from sqlalchemy import text
+
+    now = datetime.utcnow()
+    for first in range(start_id, start_id + count, 5000):
+        ids = range(first, min(first + 5000, start_id + count))
+        tasks, assignments, subtasks = [], [], []
+        for i in ids:
+            done_at = now - timedelta(days=rnd.randint(60, 700))
+            tasks.append({"id": i, "title": f"Histórica {i}", "p": rnd.randint(1, n["prospects"]),
+                          "created_at": done_at - timedelta(days=rnd.randint(1, 30)), "updated_at": done_at})
+            for user_id in rnd.sample(range(1, n["users"] + 1), rnd.randint(1, 2)):
+                assignments.append({"u": user_id, "t": i})
+            if i % 2 == 0:
+                subtasks.append({"t": i, "u": rnd.randint(1, n["users"]), "at": done_at})
+        conn.execute(
+            text("INSERT INTO tasks (id, title, status, created_at, updated_at, position, prospect_id) "
+                 "VALUES (:id, :title, 'done', :created_at, :updated_at, :id, :p)"),
+            tasks,
+        )
+        conn.execute(text("INSERT INTO task_assignments (user_id, task_id) VALUES (:u, :t)"), assignments)
+        conn.execute(
+            text("INSERT INTO subtasks (title, status, created_at, updated_at, user_id, task_id) "
+                 "VALUES ('revisión', 'done', :at, :at, :u, :t)"),
+            subtasks,
+        )
+
+
+def child(steps: list, requests: int, archived: bool):
+    sys.path.insert(0, str(HERE.parent))
+    import seed  # fija DATABASE_URL a una base temporal y apaga el worker de archivado
+
+    import httpx
+
+    import archive
+    import database
+    import main
+    import migrate
+
+    migrate.upgrade_database()
+    n = seed.seed(seed.SCALES["1k"], verbose=False)
+    rnd = random.Random(42)
+
+    async def measure():
+        token = main.auth.create_access_token({"sub": "user1"})
+        transport = httpx.ASGITransport(app=main.app)
+        result = {}
+        async with httpx.AsyncClient(transport=transport, base_url="http://archive",
+                                     cookies={"access_token": token}) as client:
+            for path in PAGES:
+                timings = []
+                for _ in range(requests + 1):
+                    start = time.perf_counter()
+                    response = await client.get(path)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    if response.status_code >= 400:
+                        raise SystemExit(f"{path} devolvió {response.status_code}")
+                result[path] = statistics.median(timings[1:])
+        return result
+
+    results, total, next_id = {}, 0, n["tasks"] + 1
+    for step in steps:
+        if step > total:
+            with database.engine.begin() as conn:
+                grow_history(conn, n, next_id, step - total, rnd)
+            next_id += step - total
+            total = step
+        if archived:
+            archive.run()
+        results[str(step)] = asyncio.run(measure())
+    print(json.dumps(results))
+
+
+def run_child(steps: list, requests: int, archived: bool) -> dict:
+    args = [sys.executable, str(HERE), "--child", "--steps", ",".join(map(str, steps)), "--requests", str(requests)]
+    if archived:
+        args.append("--archived")
+    output = subprocess.run(args, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia del tablero vs historial de tareas completadas")
+    parser.add_argument("--steps", default="0,10000,50000", help="tareas completadas antiguas en cada etapa")
+    parser.add_argument("--requests", type=int, default=20, help="peticiones medidas por página")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--archived", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    steps = sorted(int(s) for s in args.steps.split(","))
+    if args.child:
+        child(steps, args.requests, args.archived)
+        return
+
+    results = {"sin archivo": run_child(steps, args.requests, False),
+               "con archivo": run_child(steps, args.requests, True)}
+    print(f"\nMediana en ms de {args.requests} peticiones, escala 1k + historial completado\n")
+    print(f"{'página':<26}{'historial':>10}" + "".join(f"{name:>14}" for name in results))
+    for path in PAGES:
+        for step in steps:
+            row = f"{path:<26}{step:>10}"
+            for name in results:
+                row += f"{results[name][str(step)][path]:>14.1f}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
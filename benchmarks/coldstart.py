@@ -0,0 +1,133 @@
+"""Medición del cold start: tiempo de import y tiempo hasta la primera respuesta.
+
+Cada muestra es un proceso nuevo (como una instancia serverless recién creada)
+que importa main, corre el startup de la app y atiende una primera petición
+autenticada en proceso (httpx + ASGI). Se informan medianas de:
+  - proceso: desde lanzar el intérprete hasta tener la respuesta (medido afuera),
+  - import:  import main,
+  - startup: startup_event (chequeo/migración del esquema, contadores),
+  - primera: la primera petición (incluye crear el entorno de Jinja y compilar
+             o cargar las plantillas).
+
+Compara el arranque anterior (MIGRATE_ON_STARTUP=always, plantillas fuente)
+con el actual (revisión al día sin Alembic, plantillas precompiladas en un
+directorio temporal) y con el desplegado: como en Vercel (VERCEL=1, sin paso de
+build), con las plantillas precompiladas versionadas en templates_compiled/.
+Falla si alguna configuración que debería usar plantillas precompiladas termina
+en las fuente (p. ej. templates_compiled/ vieja).
+
+Uso:
+    python benchmarks/coldstart.py [--runs 7] [--path /planning]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve()
+
+
+def child(path: str):
+    # Corre en el proceso medido: nada importado antes de esta función
+    started = time.perf_counter()
+    sys.path.insert(0, str(HERE.parent.parent))
+    import main
+
+    imported = time.perf_counter()
+    import httpx
+
+    async def run():
+        await main.startup_event()
+        ready = time.perf_counter()
+        token = main.auth.create_access_token({"sub": "user1"})
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://cold",
+                                     cookies={"access_token": token}) as client:
+            response = await client.get(path)
+        return ready, response.status_code
+
+    ready, status = asyncio.run(run())
+    from jinja2 import ModuleLoader
+
+    precompiled = isinstance(main.templates.env.loader, ModuleLoader)
+    done = time.perf_counter()
+    print(json.dumps({
+        "import": (imported - started) * 1000,
+        "startup": (ready - imported) * 1000,
+        "first": (done - ready) * 1000,
+        "status": status,
+        "precompiled": precompiled,
+    }))
+
+
+def sample(env: dict, path: str) -> dict:
+    launched = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, str(HERE), "--child", path], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    elapsed = (time.perf_counter() - launched) * 1000
+    result = json.loads(output.strip().splitlines()[-1])
+    if result["status"] >= 400:
+        raise SystemExit(f"La primera petición devolvió {result['status']}")
+    result["process"] = elapsed
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start de la app")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--path", default="/planning", help="primera petición (autenticada como user1)")
+    parser.add_argument("--child", metavar="PATH", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child)
+        return
+
+    sys.path.insert(0, str(HERE.parent))
+    import seed  # fija DATABASE_URL a una base temporal
+
+    import migrate
+    import templating
+
+    migrate.upgrade_database()
+    seed.seed(seed.SCALES["1k"], verbose=False)
+
+    compiled_dir = tempfile.mkdtemp()
+    templating.COMPILED_DIR = Path(compiled_dir)
+    templating.build()
+
+    base_env = {key: value for key, value in os.environ.items()
+                if key not in ("TEMPLATES_COMPILED_DIR", "VERCEL", "MIGRATE_ON_STARTUP")}
+    base_env["SLOW_REQUEST_MS"] = "60000"
+    # (entorno, se esperan plantillas precompiladas)
+    configs = {
+        "anterior": ({**base_env, "MIGRATE_ON_STARTUP": "always", "TEMPLATES_COMPILED_DIR": tempfile.mkdtemp()}, False),
+        "actual": ({**base_env, "MIGRATE_ON_STARTUP": "auto", "TEMPLATES_COMPILED_DIR": compiled_dir}, True),
+        "desplegado": ({**base_env, "VERCEL": "1"}, True),
+    }
+    print(f"\nPrimera petición: GET {args.path}, {args.runs} procesos por configuración (medianas, ms)\n")
+    print(f"{'':<11} {'proceso':>9} {'import':>9} {'startup':>9} {'primera':>9}  plantillas")
+    failures = []
+    for name, (env, expect_precompiled) in configs.items():
+        sample(env, args.path)  # descartar: calienta caché de disco y __pycache__
+        runs = [sample(env, args.path) for _ in range(args.runs)]
+        medians = {key: statistics.median(r[key] for r in runs) for key in ("process", "import", "startup", "first")}
+        precompiled = all(r["precompiled"] for r in runs)
+        print(f"{name:<11} {medians['process']:>9.1f} {medians['import']:>9.1f} "
+              f"{medians['startup']:>9.1f} {medians['first']:>9.1f}  {'precompiladas' if precompiled else 'fuente'}")
+        if expect_precompiled and not precompiled:
+            failures.append(f"{name}: se usaron las plantillas fuente (correr python templating.py build)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Benchmark de los endpoints de main.py con concurrencia.
+
+Siembra una base temporal (benchmarks/seed.py), levanta la app en proceso y la
+recorre con un cliente ASGI (httpx) lanzando peticiones concurrentes. Por
+escenario informa throughput, latencia p50/p95/p99 y consultas SQL por
+petición (leídas de la cabecera Server-Timing).
+
+Con --baseline compara contra un archivo guardado y termina con código 1 si
+algún escenario empeora más que la tolerancia: sirve como gate de regresión.
+Las latencias dependen de la máquina (regenerar la línea base en la misma
+donde corre el gate); las consultas por petición no, y se comparan exactas.
+
+Uso:
+    python benchmarks/harness.py --scale 1k --concurrency 8 --requests 200
+    python benchmarks/harness.py --scale 1k --baseline benchmarks/baseline.json
+    python benchmarks/harness.py --scale 1k --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import seed  # antes que database/main: fija DATABASE_URL a la base del benchmark
+
+# Bajo carga casi todo supera el umbral del log de lentas: no ensuciar la salida
+os.environ.setdefault("SLOW_REQUEST_MS", "60000")
+
+import httpx
+
+import database
+import migrate
+
+QUERIES_RE = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+# Escenarios: nombre -> (método, función que arma la URL a partir de un Random)
+# Los ids se eligen al azar (con semilla) dentro del rango sembrado.
+def scenarios(n: dict):
+    return {
+        "dashboard": ("GET", lambda r: "/"),
+        "prospectos": ("GET", lambda r: "/prospectos"),
+        "prospectos_filtro": ("GET", lambda r: f"/prospectos?status={r.choice(seed.STATUSES)}"),
+        "prospecto_detalle": ("GET", lambda r: f"/prospectos/{r.randint(1, n['prospects'])}"),
+        "planning": ("GET", lambda r: "/planning"),
+        "planning_asignado": ("GET", lambda r: f"/planning?assignee_id={r.randint(1, n['users'])}"),
+        "calendar": ("GET", lambda r: "/calendar"),
+        "task_modal": ("GET", lambda r: f"/tasks/{r.randint(1, n['tasks'])}/modal"),
+        "profile": ("GET", lambda r: "/profile"),
+        "buscar": ("GET", lambda r: f"/buscar?q={r.choice(seed.WORDS)}"),
+        "api_prospects": ("GET", lambda r: "/api/v1/prospects"),
+        "api_tasks": ("GET", lambda r: "/api/v1/tasks?status=todo"),
+        "api_calendar": ("GET", lambda r: "/api/v1/calendar"),
+        "api_analytics": ("GET", lambda r: "/api/v1/analytics/pipeline"),
+    }
+
+
+def _percentile(values, p):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _run(client, method, make_url, total, concurrency, rnd, data=None):
+    latencies, queries, errors = [], [], 0
+    semaphore = asyncio.Semaphore(concurrency)
+    urls = [make_url(rnd) for _ in range(total)]
+
+    async def one(url):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.request(method, url, data=data)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+            match = QUERIES_RE.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(url) for url in urls))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": round(total / elapsed, 1),
+        "p50": round(_percentile(latencies, 50), 2),
+        "p95": round(_percentile(latencies, 95), 2),
+        "p99": round(_percentile(latencies, 99), 2),
+        "queries": round(statistics.mean(queries), 1) if queries else None,
+    }
+
+
+async def benchmark(n: dict, total: int, concurrency: int, only=None, login_requests: int = 20) -> dict:
+    import main
+
+    await main.startup_event()
+    transport = httpx.ASGITransport(app=main.app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        login = {"username": "user1", "password": seed.PASSWORD}
+        response = await client.post("/login", data=login)
+        client.cookies.set("access_token", response.cookies["access_token"])
+
+        for name, (method, make_url) in scenarios(n).items():
+            if only and name not in only:
+                continue
+            rnd = random.Random(name)
+            await _run(client, method, make_url, min(5, total), 1, rnd)  # calentamiento
+            results[name] = await _run(client, method, make_url, total, concurrency, rnd)
+            print(_format(name, results[name]))
+
+        # Logins concurrentes: bcrypt corre en su propio executor (auth.py)
+        if not only or "login" in only:
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as anonymous:
+                results["login"] = await _run(
+                    anonymous, "POST", lambda r: "/login", login_requests, concurrency, random.Random(0), data=login
+                )
+            print(_format("login", results["login"]))
+    return results
+
+
+def _format(name, r):
+    return (f"{name:<20} {r['rps']:>8.1f} req/s   p50 {r['p50']:>8.2f}   p95 {r['p95']:>8.2f}   "
+            f"p99 {r['p99']:>8.2f} ms   {r['queries'] if r['queries'] is not None else '-':>5} q/req"
+            + (f"   {r['errors']} errores" if r["errors"] else ""))
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Devuelve la lista de regresiones respecto de la línea base."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if current["p95"] > previous["p95"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95']} -> {current['p95']} ms")
+        if current["queries"] is not None and previous.get("queries") is not None \
+                and current["queries"] > previous["queries"]:
+            regressions.append(f"{name}: consultas por petición {previous['queries']} -> {current['queries']}")
+        if current["errors"] > previous.get("errors", 0):
+            regressions.append(f"{name}: errores {previous.get('errors', 0)} -> {current['errors']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de endpoints del CRM")
+    parser.add_argument("--scale", choices=seed.SCALES, default="1k")
+    parser.add_argument("--requests", type=int, default=200, help="peticiones por escenario")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--only", nargs="*", help="solo estos escenarios")
+    parser.add_argument("--baseline", type=Path, help="archivo de línea base con el que comparar")
+    parser.add_argument("--save-baseline", type=Path, help="guardar los resultados como línea base")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="empeoramiento de p95 permitido (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    migrate.upgrade_database()
+    n = seed.seed(seed.SCALES[args.scale])
+    print(f"\nEscala {args.scale} ({database.engine.dialect.name}), {args.requests} peticiones por escenario, "
+          f"concurrencia {args.concurrency}\n")
+    results = asyncio.run(benchmark(n, args.requests, args.concurrency, set(args.only or ())))
+
+    if args.save_baseline:
+        stored = json.loads(args.save_baseline.read_text()) if args.save_baseline.exists() else {}
+        stored[args.scale] = results
+        args.save_baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"\nLínea base guardada en {args.save_baseline} ({args.scale})")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text()).get(args.scale, {})
+        if not baseline:
+            print(f"\nLa línea base no tiene resultados para la escala {args.scale}")
+            sys.exit(1)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nREGRESIONES:")
+            for regression in regressions:
+                print(f"- {regression}")
+            sys.exit(1)
+        print(f"\nSin regresiones respecto de {args.baseline} (tolerancia p95 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Latencia de las escrituras con el trabajo diferido inline o en segundo plano.
+
+Sobre una base sembrada a escala 1k se mide la mediana y el p95 de:
+  - POST /prospectos/nuevo,
+  - POST /prospectos/{id}/update,
+  - POST /tasks/{id}/update,
+cada una con su indexación de búsqueda (trabajo "search.index" de jobs.py).
+Se comparan procesos separados:
+  - inline:      JOBS_WORKERS=0, el trabajo corre tras el commit dentro de la petición,
+  - memory:      cola en memoria con workers,
+  - db:          cola persistente (tabla jobs) con workers; el INSERT del
+                 trabajo va en la transacción de la escritura.
+Para las colas se informa además la espera en cola y la duración de los
+trabajos (histogramas de /metrics).
+
+Uso:
+    python benchmarks/jobs_bench.py [--requests 100]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve()
+MODES = {
+    "inline": {"JOBS_WORKERS": "0", "JOBS_BACKEND": "memory"},
+    "memory": {"JOBS_WORKERS": "2", "JOBS_BACKEND": "memory"},
+    "db": {"JOBS_WORKERS": "2", "JOBS_BACKEND": "db"},
+}
+
+
+def child(requests: int):
+    sys.path.insert(0, str(HERE.parent))
+    os.environ.setdefault("SLOW_REQUEST_MS", "60000")
+    import seed  # fija DATABASE_URL a una base temporal
+
+    import httpx
+
+    import jobs
+    import metrics
+    import migrate
+
+    migrate.upgrade_database()
+    n = seed.seed(seed.SCALES["1k"], verbose=False)
+
+    async def measure():
+        import main
+
+        token = main.auth.create_access_token({"sub": "user1"})
+        transport = httpx.ASGITransport(app=main.app)
+        writes = {
+            "POST /prospectos/nuevo": lambda i: ("/prospectos/nuevo", {"name": f"Nuevo {i}", "industry": "retail"}),
+            "POST /prospectos/{id}/update": lambda i: (f"/prospectos/{i % n['prospects'] + 1}/update",
+                                                       {"name": f"Editado {i}", "status": "Contactado"}),
+            "POST /tasks/{id}/update": lambda i: (f"/tasks/{i % n['tasks'] + 1}/update",
+                                                  {"title": f"Tarea editada {i}", "description": "revisar"}),
+        }
+        result = {}
+        await main.startup_event()
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://jobs",
+                                         cookies={"access_token": token}) as client:
+                for name, build in writes.items():
+                    timings = []
+                    for i in range(requests):
+                        path, data = build(i)
+                        start = time.perf_counter()
+                        response = await client.post(path, data=data)
+                        timings.append((time.perf_counter() - start) * 1000)
+                        if response.status_code >= 400:
+                            raise SystemExit(f"{path} devolvió {response.status_code}")
+                    timings.sort()
+                    result[name] = (statistics.median(timings), timings[int(len(timings) * 0.95) - 1])
+        finally:
+            jobs.drain()
+            main.shutdown_event()
+        return result
+
+    result = asyncio.run(measure())
+    waits = metrics.registry.job_waits.get("search.index", [0, 0])
+    durations = metrics.registry.job_durations.get("search.index", [0, 0])
+    jobs_summary = {
+        "count": durations[-1],
+        "wait_ms": waits[-2] / waits[-1] * 1000 if waits[-1] else 0.0,
+        "run_ms": durations[-2] / durations[-1] * 1000 if durations[-1] else 0.0,
+    }
+    print(json.dumps({"requests": result, "jobs": jobs_summary}))
+
+
+def run_child(mode: str, requests: int) -> dict:
+    env = {**os.environ, **MODES[mode]}
+    args = [sys.executable, str(HERE), "--child", "--requests", str(requests)]
+    output = subprocess.run(args, check=True, capture_output=True, text=True, env=env).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia de escrituras con trabajos diferidos")
+    parser.add_argument("--requests", type=int, default=100, help="peticiones medidas por escritura")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.requests)
+        return
+
+    results = {mode: run_child(mode, args.requests) for mode in MODES}
+    print(f"\nMediana / p95 en ms de {args.requests} peticiones, escala 1k\n")
+    print(f"{'escritura':<30}" + "".join(f"{mode:>18}" for mode in MODES))
+    for name in results["inline"]["requests"]:
+        row = f"{name:<30}"
+        for mode in MODES:
+            median, p95 = results[mode]["requests"][name]
+            row += f"{median:>9.1f} /{p95:>6.1f}"
+        print(row)
+    print(f"\n{'search.index':<30}" + "".join(f"{mode:>18}" for mode in MODES))
+    for key, label in (("count", "trabajos"), ("wait_ms", "espera media (ms)"), ("run_ms", "duración media (ms)")):
+        row = f"{label:<30}"
+        for mode in MODES:
+            value = results[mode]["jobs"][key]
+            row += f"{value:>18.1f}" if isinstance(value, float) else f"{value:>18}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
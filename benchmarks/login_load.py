@@ -0,0 +1,152 @@
+"""Latencia de GET / mientras hay logins concurrentes (bcrypt fuera del event loop).
+
+Sobre una base sembrada a escala 1k se mide GET / (dashboard) dos veces:
+  - en reposo,
+  - mientras --logins clientes hacen POST /login en bucle.
+bcrypt corre en su propio executor (auth.PASSWORD_HASH_WORKERS) y las rutas
+síncronas en el threadpool: una ráfaga de logins no debe bloquear el event
+loop ni quitarle hilos a las páginas. Se informa p50/p95/p99 de GET / en
+cada fase, los logins por segundo y el mayor retraso observado del event loop
+(una tarea que duerme 5 ms y mide cuánto tarda en despertar).
+
+Termina con código 1 si el p99 bajo carga supera --max-ratio veces el p99 en
+reposo (más 2 ms de margen para las medidas muy chicas) o si el retraso del
+event loop bajo carga supera --max-loop-lag ms.
+
+Uso:
+    python benchmarks/login_load.py [--logins 8] [--requests 200] [--max-ratio 2.5] [--max-loop-lag 10]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import seed  # antes que database/main: fija DATABASE_URL a la base del benchmark
+
+os.environ.setdefault("SLOW_REQUEST_MS", "60000")
+
+import httpx  # noqa: E402
+
+import migrate  # noqa: E402
+
+LOOP_PROBE_INTERVAL = 0.005
+
+
+def _percentile(values, p):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summary(latencies) -> dict:
+    return {
+        "p50": statistics.median(latencies),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+    }
+
+
+async def _dashboard(client, total: int) -> list:
+    latencies = []
+    for _ in range(total):
+        start = time.perf_counter()
+        response = await client.get("/")
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            raise SystemExit(f"GET / devolvió {response.status_code}")
+    return latencies
+
+
+async def _login_loop(client, stop: asyncio.Event, counter: list):
+    login = {"username": "user1", "password": seed.PASSWORD}
+    while not stop.is_set():
+        response = await client.post("/login", data=login)
+        if response.status_code >= 400:
+            raise SystemExit(f"POST /login devolvió {response.status_code}")
+        counter[0] += 1
+
+
+async def _loop_probe(stop: asyncio.Event, lag: list):
+    # Si algo bloquea el event loop, la tarea despierta tarde
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(LOOP_PROBE_INTERVAL)
+        lag[0] = max(lag[0], (time.perf_counter() - start - LOOP_PROBE_INTERVAL) * 1000)
+
+
+async def run(requests: int, logins: int) -> dict:
+    import main
+
+    await main.startup_event()
+    transport = httpx.ASGITransport(app=main.app)
+    token = main.auth.create_access_token({"sub": "user1"})
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://login",
+                                     cookies={"access_token": token}) as client, \
+                httpx.AsyncClient(transport=transport, base_url="http://login") as anonymous:
+            # Calienta cachés y pool, y los imports diferidos de passlib/bcrypt y jose
+            # (ver auth.py): el primer login los paga una sola vez
+            await _dashboard(client, 10)
+            await anonymous.post("/login", data={"username": "user1", "password": seed.PASSWORD})
+
+            stop, idle_lag = asyncio.Event(), [0.0]
+            probe = asyncio.create_task(_loop_probe(stop, idle_lag))
+            idle = await _dashboard(client, requests)
+            stop.set()
+            await probe
+
+            stop, load_lag, counter = asyncio.Event(), [0.0], [0]
+            probe = asyncio.create_task(_loop_probe(stop, load_lag))
+            loops = [asyncio.create_task(_login_loop(anonymous, stop, counter)) for _ in range(logins)]
+            await asyncio.sleep(0.2)  # que los logins ya estén en marcha
+            start = time.perf_counter()
+            loaded = await _dashboard(client, requests)
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await asyncio.gather(probe, *loops)
+    finally:
+        main.shutdown_event()
+    return {
+        "idle": {**_summary(idle), "loop_lag": idle_lag[0]},
+        "load": {**_summary(loaded), "loop_lag": load_lag[0]},
+        "logins_per_second": counter[0] / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia de GET / con logins concurrentes")
+    parser.add_argument("--logins", type=int, default=8, help="clientes haciendo login en bucle")
+    parser.add_argument("--requests", type=int, default=200, help="peticiones GET / medidas por fase")
+    parser.add_argument("--max-ratio", type=float, default=2.5,
+                        help="máximo p99 bajo carga / p99 en reposo antes de fallar")
+    parser.add_argument("--max-loop-lag", type=float, default=10.0,
+                        help="máximo retraso del event loop bajo carga (ms) antes de fallar")
+    args = parser.parse_args()
+
+    migrate.upgrade_database()
+    seed.seed(seed.SCALES["1k"], verbose=False)
+    result = asyncio.run(run(args.requests, args.logins))
+
+    print(f"\nGET / ({args.requests} peticiones por fase), {args.logins} clientes de login en la fase con carga\n")
+    print(f"{'fase':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'lag loop ms':>14}")
+    for phase in ("idle", "load"):
+        row = result[phase]
+        print(f"{phase:<12}{row['p50']:>10.1f}{row['p95']:>10.1f}{row['p99']:>10.1f}{row['loop_lag']:>14.1f}")
+    print(f"\nlogins/s durante la fase con carga: {result['logins_per_second']:.1f}")
+
+    failures = []
+    limit = result["idle"]["p99"] * args.max_ratio + 2
+    if result["load"]["p99"] > limit:
+        failures.append(f"p99 bajo carga {result['load']['p99']:.1f} ms > {limit:.1f} ms")
+    if result["load"]["loop_lag"] > args.max_loop_lag:
+        failures.append(f"retraso del event loop {result['load']['loop_lag']:.1f} ms > {args.max_loop_lag:.1f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
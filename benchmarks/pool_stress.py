@@ -0,0 +1,77 @@
+"""Prueba de estrés del pool de conexiones.
+
+Lanza N hilos que abren sesiones y ejecutan consultas cortas durante unos
+segundos, y muestra las métricas del pool (database.pool_stats()).
+
+Uso:
+    python benchmarks/pool_stress.py [hilos] [segundos]
+    BENCH_DATABASE_URL=postgresql://... DB_POOL_MODE=serverless python benchmarks/pool_stress.py 50 10
+Sin BENCH_DATABASE_URL usa una base SQLite temporal (modo WAL).
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/pool.db"
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeout  # noqa: E402
+
+import database  # noqa: E402
+
+
+def worker(stop: threading.Event, latencies: list, errors: list, write: bool):
+    while not stop.is_set():
+        start = time.perf_counter()
+        db = database.SessionLocal()
+        try:
+            if write:
+                db.execute(text("INSERT INTO pool_stress (value) VALUES (1)"))
+                db.commit()
+            else:
+                db.execute(text("SELECT COUNT(*) FROM pool_stress")).scalar()
+        except (OperationalError, PoolTimeout) as e:
+            errors.append(type(e).__name__)
+        finally:
+            db.close()
+        latencies.append(time.perf_counter() - start)
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    with database.engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS pool_stress (value INTEGER)"))
+
+    stop = threading.Event()
+    latencies, errors = [], []
+    pool = [
+        # 1 de cada 4 hilos escribe, el resto lee
+        threading.Thread(target=worker, args=(stop, latencies, errors, i % 4 == 0))
+        for i in range(threads)
+    ]
+    for t in pool:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in pool:
+        t.join()
+
+    latencies.sort()
+    pct = lambda p: latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000
+    print(f"threads={threads} seconds={seconds} ops={len(latencies)} ops/s={len(latencies) / seconds:.0f}")
+    print(f"latency p50={pct(0.50):.2f}ms p95={pct(0.95):.2f}ms p99={pct(0.99):.2f}ms")
+    print(f"errors={len(errors)} {sorted(set(errors))}")
+    print(f"pool={database.pool_stats()}")
+
+    with database.engine.begin() as conn:
+        conn.execute(text("DROP TABLE pool_stress"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Planes de consulta de los caminos calientes antes y después de los índices.
+
+Crea una base SQLite temporal, aplica las migraciones hasta la revisión sin
+índices, carga datos sintéticos y muestra el plan de cada consulta; luego
+aplica el resto de migraciones y vuelve a mostrar los planes.
+
+Uso: python benchmarks/query_plans.py [filas]
+Con BENCH_DATABASE_URL apuntando a un Postgres vacío se usa EXPLAIN ANALYZE allí.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/plans.db"
+
+from sqlalchemy import text  # noqa: E402
+
+import database  # noqa: E402
+import migrate  # noqa: E402
+
+BEFORE_REVISION = "0002_stat_counters"
+
+# Forma de las consultas de queries.py / stats.py con parámetros típicos
+HOT_QUERIES = {
+    "prospectos por estado": (
+        "SELECT * FROM prospects WHERE status = :status ORDER BY created_at DESC, id DESC LIMIT 51",
+        {"status": "Contactado"},
+    ),
+    "columna kanban": (
+        "SELECT * FROM tasks WHERE status = :status AND id > :after ORDER BY id LIMIT 51",
+        {"status": "todo", "after": 1000},
+    ),
+    "calendario (rango)": (
+        "SELECT * FROM tasks WHERE end_date >= :start AND end_date < :end ORDER BY end_date",
+        {"start": datetime(2026, 3, 1), "end": datetime(2026, 4, 1)},
+    ),
+    "tareas de un prospecto": (
+        "SELECT * FROM tasks WHERE prospect_id = :pid",
+        {"pid": 42},
+    ),
+    "tareas asignadas a un usuario": (
+        "SELECT tasks.* FROM tasks WHERE EXISTS (SELECT 1 FROM task_assignments ta "
+        "WHERE ta.task_id = tasks.id AND ta.user_id = :uid)",
+        {"uid": 3},
+    ),
+    "subtareas de un usuario": (
+        "SELECT * FROM subtasks WHERE user_id = :uid",
+        {"uid": 3},
+    ),
+}
+
+
+def seed(conn, rows: int):
+    rnd = random.Random(1)
+    statuses = ["Nuevo", "Contactado", "Interesado", "Cliente", "Perdido"]
+    task_statuses = ["todo", "in_progress", "done"]
+    base = datetime(2025, 1, 1)
+    users = 20
+    conn.execute(text("INSERT INTO users (id, username, is_active) VALUES (:id, :u, 1)"),
+                 [{"id": i, "u": f"user{i}"} for i in range(1, users + 1)])
+    conn.execute(
+        text("INSERT INTO prospects (id, name, status, industry, created_at, created_by_id) "
+             "VALUES (:id, :name, :status, :industry, :created_at, :creator)"),
+        [{"id": i, "name": f"Empresa {i}", "status": rnd.choice(statuses), "industry": f"rubro{i % 15}",
+          "created_at": base + timedelta(minutes=i), "creator": rnd.randint(1, users)} for i in range(1, rows + 1)],
+    )
+    conn.execute(
+        text("INSERT INTO tasks (id, title, status, end_date, prospect_id) VALUES (:id, :t, :s, :e, :p)"),
+        [{"id": i, "t": f"Tarea {i}", "s": rnd.choice(task_statuses),
+          "e": base + timedelta(days=rnd.randint(0, 730)), "p": rnd.randint(1, rows)} for i in range(1, rows + 1)],
+    )
+    conn.execute(text("INSERT INTO task_assignments (user_id, task_id) VALUES (:u, :t)"),
+                 [{"u": rnd.randint(1, users), "t": i} for i in range(1, rows + 1)])
+    conn.execute(text("INSERT INTO subtasks (id, title, status, user_id, task_id) VALUES (:id, :t, 'todo', :u, :task)"),
+                 [{"id": i, "t": f"Sub {i}", "u": rnd.randint(1, users), "task": i} for i in range(1, rows + 1)])
+
+
+def show_plans(label: str):
+    print(f"\n=== {label} ===")
+    sqlite = database.engine.dialect.name == "sqlite"
+    prefix = "EXPLAIN QUERY PLAN " if sqlite else "EXPLAIN ANALYZE "
+    with database.engine.connect() as conn:
+        for name, (sql, params) in HOT_QUERIES.items():
+            plan = conn.execute(text(prefix + sql), params).fetchall()
+            start = time.perf_counter()
+            for _ in range(5):
+                conn.execute(text(sql), params).fetchall()
+            elapsed = (time.perf_counter() - start) / 5 * 1000
+            print(f"- {name} ({elapsed:.2f} ms)")
+            for row in plan:
+                print(f"    {row[-1]}")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    migrate.upgrade_database(BEFORE_REVISION)
+    with database.engine.begin() as conn:
+        seed(conn, rows)
+    show_plans(f"Sin índices ({BEFORE_REVISION}, {rows} filas)")
+    migrate.upgrade_database()
+    show_plans("Con índices (head)")
+
+
+if __name__ == "__main__":
+    main()
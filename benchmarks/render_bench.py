@@ -0,0 +1,161 @@
+"""Tiempo de render por template con distintas configuraciones del entorno de Jinja.
+
+Cada configuración corre en un proceso nuevo (como un cold start) sobre una base
+sembrada a escala 1k:
+  - fuente:        plantillas fuente, sin caché de bytecode, auto_reload
+                   (el entorno por defecto de antes),
+  - bytecode:      plantillas fuente con la caché de bytecode ya llena y
+                   auto_reload apagado (producción sin paso de build),
+  - precompiladas: módulos generados por `python templating.py build`.
+
+Para cada template se informa:
+  - carga:   get_template() en el proceso nuevo (leer + parsear + compilar, o
+             leer bytecode, o importar el módulo precompilado),
+  - primera: el render de la primera petición (incluye cargar lo que la
+             página extiende/incluye: layout y componentes),
+  - mediana: render de las peticiones siguientes (Server-Timing, tpl).
+Los componentes se renderizan directo, sin la caché de fragmentos.
+
+Uso:
+    python benchmarks/render_bench.py [--requests 30]
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve()
+TPL_RE = re.compile(r"tpl;dur=([\d.]+)")
+
+# Página -> template que renderiza
+PAGES = {
+    "/login": "login.html",
+    "/": "dashboard.html",
+    "/prospectos": "prospects.html",
+    "/prospectos/1": "prospect_detail.html",
+    "/planning": "planning.html",
+    "/calendar": "calendar.html",
+    "/profile": "profile.html",
+    "/buscar?q=cliente": "search.html",
+    "/tasks/1/modal": "components/task_modal.html",
+}
+COMPONENTS = ("components/task_card.html", "components/prospect_row.html", "components/subtask_card.html")
+
+
+def child(requests: int):
+    sys.path.insert(0, str(HERE.parent.parent))
+    import httpx
+
+    import main
+    import models
+    from database import SessionLocal
+
+    results = {}
+    env = main.templates.env
+    loads = {}
+    for name in list(PAGES.values()) + list(COMPONENTS):
+        start = time.perf_counter()
+        env.get_template(name)
+        loads[name] = (time.perf_counter() - start) * 1000
+    # Los parents/includes se resuelven al renderizar: se vacía el caché del
+    # entorno para que "primera" mida la cadena completa como en un cold start
+    env.cache.clear()
+
+    async def run():
+        await main.startup_event()
+        token = main.auth.create_access_token({"sub": "user1"})
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://render",
+                                     cookies={"access_token": token}) as client:
+            for path, name in PAGES.items():
+                timings = []
+                for _ in range(requests + 1):
+                    response = await client.get(path)
+                    if response.status_code >= 400:
+                        raise SystemExit(f"{path} devolvió {response.status_code}")
+                    timings.append(float(TPL_RE.search(response.headers["server-timing"]).group(1)))
+                results[name] = {"load": loads[name], "first": timings[0], "median": statistics.median(timings[1:])}
+
+    asyncio.run(run())
+
+    db = SessionLocal()
+    try:
+        contexts = {
+            "components/task_card.html": {"task": db.get(models.Task, 1), "redirect_mode": False},
+            "components/prospect_row.html": {"prospect": db.get(models.Prospect, 1)},
+            "components/subtask_card.html": {"sub": db.get(models.SubTask, 1)},
+        }
+        for name in COMPONENTS:
+            template = env.get_template(name)
+            template.render(**contexts[name])  # carga las relaciones perezosas fuera de la medición
+            timings = []
+            for _ in range(requests * 10):
+                start = time.perf_counter()
+                template.render(**contexts[name])
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = {"load": loads[name], "first": None, "median": statistics.median(timings)}
+    finally:
+        db.close()
+    print(json.dumps(results))
+
+
+def run_config(env: dict, requests: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, str(HERE), "--child", str(requests)], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render por template del CRM")
+    parser.add_argument("--requests", type=int, default=30, help="renders medidos por página")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child is not None:
+        child(args.child)
+        return
+
+    sys.path.insert(0, str(HERE.parent))
+    import seed  # fija DATABASE_URL a una base temporal
+
+    import migrate
+    import templating
+
+    migrate.upgrade_database()
+    seed.seed(seed.SCALES["1k"], verbose=False)
+
+    compiled_dir = tempfile.mkdtemp()
+    templating.COMPILED_DIR = Path(compiled_dir)
+    templating.build()
+
+    base_env = {**os.environ, "SLOW_REQUEST_MS": "60000", "TEMPLATES_COMPILED_DIR": tempfile.mkdtemp()}
+    configs = {
+        "fuente": {**base_env, "TEMPLATES_BYTECODE_DIR": "off", "TEMPLATES_AUTO_RELOAD": "1"},
+        "bytecode": {**base_env, "TEMPLATES_BYTECODE_DIR": tempfile.mkdtemp(), "TEMPLATES_AUTO_RELOAD": "0"},
+        "precompiladas": {**base_env, "TEMPLATES_COMPILED_DIR": compiled_dir},
+    }
+    results = {}
+    for name, env in configs.items():
+        run_config(env, 1)  # descartar: llena la caché de bytecode y calienta el disco
+        results[name] = run_config(env, args.requests)
+
+    print(f"\nms por template: carga / primera / mediana de {args.requests}\n")
+    print(f"{'template':<30}" + "".join(f"{name:>24}" for name in configs))
+    for template in list(PAGES.values()) + list(COMPONENTS):
+        row = f"{template:<30}"
+        for name in configs:
+            r = results[name][template]
+            first = f"{r['first']:.1f}" if r["first"] is not None else "-"
+            row += f"{r['load']:.1f} / {first} / {r['median']:.2f}".rjust(24)
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
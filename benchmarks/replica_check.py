@@ -0,0 +1,136 @@
+"""Comprobación del enrutado a réplicas con dos bases SQLite locales.
+
+La "réplica" es una copia de la base primaria (API de backup de sqlite3) que
+solo se actualiza cuando el script la vuelve a copiar: una réplica con retraso
+de replicación controlado. Recorre la app con un cliente ASGI (httpx) y
+comprueba, en orden:
+  1. los GET leen de la réplica (métricas de enrutado) y sus consultas
+     cuentan en Server-Timing,
+  2. tras un POST la cookie de primaria hace visible lo recién escrito,
+  3. vencida la cookie se vuelve a la réplica (que aún no lo tiene) y
+     /tasks/cards sigue leyendo de la primaria,
+  4. una réplica caída (sin conexiones y sin archivo) cae a la primaria,
+  5. al volver la réplica, pasado REPLICA_CHECK_INTERVAL, se usa de nuevo.
+Termina con código 1 si algún paso falla.
+
+Uso:
+    python benchmarks/replica_check.py
+"""
+import asyncio
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+WORK_DIR = Path(tempfile.mkdtemp())
+PRIMARY = WORK_DIR / "primary.db"
+REPLICA_DIR = WORK_DIR / "replica"
+REPLICA = REPLICA_DIR / "replica.db"
+PIN_SECONDS = 1
+QUERIES_RE = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+CHECK_INTERVAL = 0.5
+
+# Antes de importar seed/database: fijan las URLs de la primaria y la réplica
+os.environ["BENCH_DATABASE_URL"] = f"sqlite:///{PRIMARY}"
+os.environ["DATABASE_REPLICA_URLS"] = f"sqlite:///{REPLICA}"
+os.environ["REPLICA_PIN_SECONDS"] = str(PIN_SECONDS)
+os.environ["REPLICA_CHECK_INTERVAL"] = str(CHECK_INTERVAL)
+os.environ.setdefault("SLOW_REQUEST_MS", "60000")
+
+import seed  # noqa: E402
+
+import httpx  # noqa: E402
+
+import database  # noqa: E402
+import migrate  # noqa: E402
+
+
+def replicate():
+    # "Aplica" en la réplica todo lo escrito en la primaria hasta ahora
+    REPLICA_DIR.mkdir(exist_ok=True)
+    source, target = sqlite3.connect(PRIMARY), sqlite3.connect(REPLICA)
+    with target:
+        source.backup(target)
+    source.close()
+    target.close()
+
+
+def routed():
+    return dict(database.routing_metrics)
+
+
+failures = []
+
+
+def check(name: str, ok: bool):
+    print(f"{'OK  ' if ok else 'FAIL'} {name}")
+    if not ok:
+        failures.append(name)
+
+
+async def run():
+    import main
+
+    token = main.auth.create_access_token({"sub": "user1"})
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://replica",
+                                 cookies={"access_token": token}) as client:
+        before = routed()
+        response = await client.get("/prospectos")
+        check("GET /prospectos lee de la réplica",
+              response.status_code == 200 and routed()["replica_sessions"] > before["replica_sessions"])
+        queries = QUERIES_RE.search(response.headers.get("server-timing", ""))
+        check("las consultas en la réplica cuentan en Server-Timing", queries is not None and int(queries.group(1)) > 0)
+
+        response = await client.post("/prospectos/nuevo", data={"name": "Recién creado"})
+        check("POST deja la cookie de primaria", database.REPLICA_PIN_COOKIE in response.cookies)
+        response = await client.get("/prospectos?status=Nuevo")
+        check("con la cookie, el prospecto nuevo se ve (primaria)", "Recién creado" in response.text)
+
+        response = await client.post("/tasks/create", data={"title": "Tarea recién creada", "assignee_ids": ["1"]})
+        with database.engine.connect() as connection:
+            task_id = connection.exec_driver_sql("SELECT max(id) FROM tasks").scalar()
+        time.sleep(PIN_SECONDS + 0.2)
+        response = await client.get("/prospectos?status=Nuevo")
+        check("vencida la cookie, la réplica aún no lo tiene", "Recién creado" not in response.text)
+        response = await client.get(f"/tasks/cards?ids={task_id}")
+        check("/tasks/cards lee de la primaria", response.status_code == 200 and len(response.json()["tasks"]) == 1)
+
+        replicate()
+        response = await client.get("/prospectos?status=Nuevo")
+        check("replicado, la réplica lo muestra", "Recién creado" in response.text)
+
+        # Caída: el servidor de la réplica cierra las conexiones y no acepta nuevas
+        REPLICA_DIR.rename(WORK_DIR / "replica_down")
+        database.replicas[0].engine.dispose()
+        time.sleep(CHECK_INTERVAL + 0.1)
+        before = routed()
+        response = await client.get("/prospectos")
+        check("réplica caída: la petición responde desde la primaria",
+              response.status_code == 200 and routed()["primary_sessions"] > before["primary_sessions"]
+              and not database.replicas[0].healthy)
+
+        (WORK_DIR / "replica_down").rename(REPLICA_DIR)
+        time.sleep(CHECK_INTERVAL + 0.1)
+        before = routed()
+        await client.get("/prospectos")
+        check("réplica de vuelta: se vuelve a usar",
+              routed()["replica_sessions"] > before["replica_sessions"] and database.replicas[0].healthy)
+        print("\n" + "\n".join(line for line in (await client.get("/metrics")).text.splitlines()
+                               if line.startswith("crm_db_replica") or line.startswith("crm_db_primary")))
+
+
+def main():
+    migrate.upgrade_database()
+    seed.seed(seed.SCALES["1k"], verbose=False)
+    replicate()
+    asyncio.run(run())
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
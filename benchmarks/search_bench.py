@@ -0,0 +1,133 @@
+"""Latencia de la búsqueda de texto completo sobre un dataset sintético.
+
+Aplica las migraciones en una base temporal, carga prospectos, notas y tareas
+con texto aleatorio (por defecto 1M de documentos en total), reconstruye el
+índice con search.rebuild() y mide varias consultas típicas. Como referencia
+compara con un LIKE '%término%' sobre notes.content (lo que habría que hacer
+sin índice).
+
+Uso: python benchmarks/search_bench.py [documentos] [repeticiones]
+Con BENCH_DATABASE_URL apuntando a un Postgres vacío se mide el camino tsvector/GIN.
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/search.db"
+
+from sqlalchemy import text  # noqa: E402
+
+import database  # noqa: E402
+import migrate  # noqa: E402
+import search  # noqa: E402
+
+CHUNK = 10_000
+
+WORDS = (
+    "reunión propuesta presupuesto cliente llamada seguimiento contrato factura diseño web "
+    "campaña redes sociales marketing logo branding catálogo tienda envío pedido pago "
+    "cotización visita oficina proveedor entrega revisión cambios urgente pendiente "
+    "aprobado rechazado descuento anual mensual soporte hosting dominio correo fotografía "
+    "video evento lanzamiento producto servicio agencia restaurante clínica hotel inmobiliaria"
+).split()
+RARE = "zarzaparrilla"
+
+QUERIES = {
+    "término frecuente": ("cliente", None),
+    "término raro": (RARE, None),
+    "prefijo": ("presu", None),
+    "varios términos": ("propuesta diseño web", None),
+    "filtro por tipo": ("seguimiento", "task"),
+    "página profunda": ("cliente", None, 10),
+}
+
+
+def _sentence(rnd, n):
+    words = [rnd.choice(WORDS) for _ in range(n)]
+    # ~1 de cada 10.000 documentos contiene el término raro
+    if rnd.random() < 0.0001:
+        words.insert(rnd.randrange(n), RARE)
+    return " ".join(words)
+
+
+def seed(documents: int):
+    rnd = random.Random(1)
+    prospects = max(documents // 4, 1)
+    notes = documents // 2
+    tasks = documents - prospects - notes
+    now = datetime.utcnow()
+    with database.engine.begin() as conn:
+        for start in range(1, prospects + 1, CHUNK):
+            conn.execute(
+                text("INSERT INTO prospects (id, name, industry, contact_name, email, status, created_at, updated_at) "
+                     "VALUES (:id, :name, :industry, :contact, :email, 'Nuevo', :now, :now)"),
+                [{"id": i, "name": f"Empresa {rnd.choice(WORDS)} {i}", "industry": rnd.choice(WORDS),
+                  "contact": f"Contacto {i}", "email": f"contacto{i}@empresa{i}.com", "now": now}
+                 for i in range(start, min(start + CHUNK, prospects + 1))],
+            )
+        for start in range(1, notes + 1, CHUNK):
+            conn.execute(
+                text("INSERT INTO notes (id, content, prospect_id, created_at) VALUES (:id, :content, :p, :now)"),
+                [{"id": i, "content": _sentence(rnd, 25), "p": rnd.randint(1, prospects), "now": now}
+                 for i in range(start, min(start + CHUNK, notes + 1))],
+            )
+        for start in range(1, tasks + 1, CHUNK):
+            conn.execute(
+                text("INSERT INTO tasks (id, title, description, status, prospect_id, created_at, updated_at) "
+                     "VALUES (:id, :title, :description, 'todo', :p, :now, :now)"),
+                [{"id": i, "title": _sentence(rnd, 4), "description": _sentence(rnd, 15),
+                  "p": rnd.randint(1, prospects), "now": now}
+                 for i in range(start, min(start + CHUNK, tasks + 1))],
+            )
+    return prospects, notes, tasks
+
+
+def _measure(fn, repetitions):
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    migrate.upgrade_database()
+
+    start = time.perf_counter()
+    prospects, notes, tasks = seed(documents)
+    print(f"Datos: {prospects} prospectos, {notes} notas, {tasks} tareas ({time.perf_counter() - start:.1f} s)")
+
+    db = database.SessionLocal()
+    try:
+        start = time.perf_counter()
+        search.rebuild(db, batch_size=CHUNK)
+        elapsed = time.perf_counter() - start
+        print(f"Índice reconstruido en {elapsed:.1f} s ({documents / elapsed:,.0f} docs/s)")
+
+        print(f"\nConsultas ({database.engine.dialect.name}, {repetitions} repeticiones, p50 / p95 en ms):")
+        for name, (query, kind, *page) in QUERIES.items():
+            page = page[0] if page else 1
+            hits, _ = search.search(db, query, page=page, kind=kind)
+            p50, p95 = _measure(lambda: search.search(db, query, page=page, kind=kind), repetitions)
+            print(f"- {name:<18} {p50:8.2f} / {p95:8.2f}   ({len(hits)} resultados en la página)")
+
+        like = text("SELECT id FROM notes WHERE content LIKE :pattern LIMIT 21")
+        p50, p95 = _measure(lambda: db.execute(like, {"pattern": f"%{RARE}%"}).fetchall(), min(repetitions, 5))
+        print(f"- {'LIKE sin índice':<18} {p50:8.2f} / {p95:8.2f}   (referencia, término raro en notas)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Generador de datos sintéticos para los benchmarks.
+
+Carga users, prospects (con su historial de estados), notes, tasks,
+task_assignments y subtasks a la escala
+pedida con INSERTs por bloques (executemany) y reconstruye los contadores del
+dashboard y el índice de búsqueda. Es determinista: la misma escala produce
+siempre los mismos datos.
+
+Uso:
+    BENCH_DATABASE_URL=sqlite:///./bench.db python benchmarks/seed.py [1k|100k|1M]
+Aplica las migraciones antes de sembrar. Sin BENCH_DATABASE_URL usa una base
+SQLite temporal (útil solo desde benchmarks/harness.py).
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ["DATABASE_URL"] = os.getenv("BENCH_DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+# Sin archivado en segundo plano: movería las tareas completadas sembradas a mitad de la medición
+os.environ.setdefault("ARCHIVE_INTERVAL", "0")
+
+from sqlalchemy import text  # noqa: E402
+
+import database  # noqa: E402
+
+# Escala = nº de prospectos; el resto de tablas se deriva de ella
+SCALES = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+CHUNK = 10_000
+
+PASSWORD = "bench"
+STATUSES = ["Nuevo", "Contactado", "Interesado", "Cliente", "Perdido"]
+TASK_STATUSES = ["todo", "in_progress", "done"]
+INDUSTRIES = ["retail", "salud", "educación", "gastronomía", "inmobiliaria", "turismo", "tecnología", "legal"]
+WORDS = (
+    "reunión propuesta presupuesto cliente llamada seguimiento contrato factura diseño web "
+    "campaña redes sociales marketing logo catálogo tienda pedido pago visita entrega revisión"
+).split()
+
+
+def sizes(prospects: int) -> dict:
+    return {
+        "users": max(20, prospects // 1000),
+        "prospects": prospects,
+        "notes": prospects,
+        "tasks": prospects,
+        "subtasks": prospects // 2,
+    }
+
+
+def _chunks(total: int):
+    for start in range(1, total + 1, CHUNK):
+        yield range(start, min(start + CHUNK, total + 1))
+
+
+def _text(rnd, n):
+    return " ".join(rnd.choice(WORDS) for _ in range(n))
+
+
+def _history(rnd, prospect: dict) -> list:
+    # Recorrido del embudo hasta el estado actual; "Perdido" sale de una etapa al azar
+    status = prospect["status"]
+    funnel = STATUSES[:-1]
+    path = funnel[:funnel.index(status) + 1] if status in funnel else funnel[:rnd.randint(1, 3)] + [status]
+    changed_at, rows, previous = prospect["created_at"], [], None
+    for step in path:
+        rows.append({"p": prospect["id"], "from": previous, "to": step, "at": changed_at, "by": prospect["creator"]})
+        previous = step
+        changed_at += timedelta(days=rnd.randint(1, 30), seconds=rnd.randint(0, 86399))
+    return rows
+
+
+def seed(prospects: int, verbose: bool = True) -> dict:
+    # Import diferido: auth trae passlib/bcrypt, solo hace falta para el hash
+    import auth
+
+    n = sizes(prospects)
+    rnd = random.Random(prospects)
+    history_rnd = random.Random(-prospects)  # aparte: no altera el resto de los datos
+    base = datetime.utcnow().replace(microsecond=0) - timedelta(days=365)
+    password_hash = auth.password_context().hash(PASSWORD)  # mismo hash para todos: bcrypt es lento
+    started = time.perf_counter()
+
+    with database.engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO users (id, username, email, hashed_password, is_active) VALUES (:id, :u, :e, :h, :a)"),
+            [{"id": i, "u": f"user{i}", "e": f"user{i}@bench.local", "h": password_hash, "a": True}
+             for i in range(1, n["users"] + 1)],
+        )
+        for ids in _chunks(n["prospects"]):
+            rows = [{"id": i, "name": f"Empresa {i}", "industry": rnd.choice(INDUSTRIES), "contact": f"Contacto {i}",
+                     "email": f"contacto{i}@empresa{i}.com", "phone": f"+56 9 {i:08d}", "status": rnd.choice(STATUSES),
+                     "created_at": base + timedelta(seconds=i * 30), "creator": rnd.randint(1, n["users"])} for i in ids]
+            conn.execute(
+                text("INSERT INTO prospects (id, name, industry, contact_name, email, phone, status, created_at, "
+                     "updated_at, created_by_id) VALUES (:id, :name, :industry, :contact, :email, :phone, :status, "
+                     ":created_at, :created_at, :creator)"),
+                rows,
+            )
+            conn.execute(
+                text("INSERT INTO prospect_status_history (prospect_id, from_status, to_status, changed_at, "
+                     "changed_by_id) VALUES (:p, :from, :to, :at, :by)"),
+                [entry for row in rows for entry in _history(history_rnd, row)],
+            )
+        for ids in _chunks(n["notes"]):
+            conn.execute(
+                text("INSERT INTO notes (id, content, prospect_id, created_at) VALUES (:id, :content, :p, :created_at)"),
+                [{"id": i, "content": _text(rnd, 20), "p": rnd.randint(1, n["prospects"]),
+                  "created_at": base + timedelta(seconds=i * 30)} for i in ids],
+            )
+        for ids in _chunks(n["tasks"]):
+            rows, assignments = [], []
+            for i in ids:
+                rows.append({"id": i, "title": _text(rnd, 4), "description": _text(rnd, 12),
+                             "status": rnd.choice(TASK_STATUSES), "start": base + timedelta(days=rnd.randint(0, 700)),
+                             "p": rnd.randint(1, n["prospects"]), "created_at": base + timedelta(seconds=i * 30)})
+                rows[-1]["end"] = rows[-1]["start"] + timedelta(days=rnd.randint(1, 30))
+                for user_id in rnd.sample(range(1, n["users"] + 1), rnd.randint(1, 3)):
+                    assignments.append({"u": user_id, "t": i})
+            conn.execute(
+                text("INSERT INTO tasks (id, title, description, status, start_date, end_date, created_at, updated_at, "
+                     "prospect_id) VALUES (:id, :title, :description, :status, :start, :end, :created_at, "
+                     ":created_at, :p)"),
+                rows,
+            )
+            conn.execute(text("INSERT INTO task_assignments (user_id, task_id) VALUES (:u, :t)"), assignments)
+        for ids in _chunks(n["subtasks"]):
+            conn.execute(
+                text("INSERT INTO subtasks (id, title, status, created_at, updated_at, user_id, task_id) "
+                     "VALUES (:id, :title, :status, :created_at, :created_at, :u, :t)"),
+                [{"id": i, "title": _text(rnd, 3), "status": rnd.choice(TASK_STATUSES), "created_at": base,
+                  "u": rnd.randint(1, n["users"]), "t": rnd.randint(1, n["tasks"])} for i in ids],
+            )
+    if verbose:
+        print(f"Datos: {n} ({time.perf_counter() - started:.1f} s)")
+
+    import search
+    import stats
+
+    db = database.SessionLocal()
+    try:
+        started = time.perf_counter()
+        stats.rebuild(db)
+        search.rebuild(db, batch_size=CHUNK)
+        if verbose:
+            print(f"Contadores e índice de búsqueda: {time.perf_counter() - started:.1f} s")
+    finally:
+        db.close()
+    return n
+
+
+def main():
+    scale = sys.argv[1] if len(sys.argv) > 1 else "1k"
+    if scale not in SCALES:
+        print(f"Escala desconocida: {scale} (opciones: {', '.join(SCALES)})")
+        sys.exit(1)
+    import migrate
+
+    migrate.upgrade_database()
+    seed(SCALES[scale])
+    print(f"INFO: Base sembrada en {database.DATABASE_URL}")
+
+
+if __name__ == "__main__":
+    main()
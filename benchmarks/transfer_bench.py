@@ -0,0 +1,98 @@
+"""Bytes transferidos por página: compresión y caché de estáticos.
+
+Sobre una base sembrada a escala 1k se recorren las páginas principales como
+lo haría un navegador:
+  - primera visita: el HTML y todos los estáticos (/static/...) que enlaza,
+  - visita repetida: el HTML de nuevo; de los estáticos solo se piden los que
+    no se guardaron como immutable (con If-None-Match, 304 si no cambiaron).
+Se repite con Accept-Encoding identity, gzip y br (br solo si el paquete
+"brotli" está instalado) y se informa, por página, los bytes de cada visita y
+la mediana del tiempo de respuesta del HTML (incluye la compresión).
+
+Uso:
+    python benchmarks/transfer_bench.py [--requests 20]
+"""
+import argparse
+import asyncio
+import re
+import statistics
+import time
+
+import seed  # antes que database/main: fija DATABASE_URL a la base del benchmark
+
+import httpx
+
+import compression
+import migrate
+
+PAGES = ("/login", "/", "/prospectos", "/prospectos/1", "/planning", "/calendar", "/profile", "/api/v1/tasks")
+STATIC_RE = re.compile(r'(?:src|href)="(/static/[^"]+)"')
+
+
+def _wire_size(response: httpx.Response) -> int:
+    # Bytes del cuerpo tal como viajaron (antes de descomprimir) más cabeceras
+    headers = sum(len(k) + len(v) + 4 for k, v in response.headers.raw)
+    return int(response.headers.get("content-length", len(response.content))) + headers
+
+
+async def visit(client, path: str, encoding: str, cache: dict) -> int:
+    """Bytes de una visita a la página; cache guarda los estáticos ya descargados."""
+    headers = {"Accept-Encoding": encoding}
+    response = await client.get(path, headers=headers)
+    total = _wire_size(response)
+    for asset in STATIC_RE.findall(response.text):
+        cached = cache.get(asset)
+        if cached and "immutable" in cached.headers.get("cache-control", ""):
+            continue
+        conditional = dict(headers)
+        if cached and cached.headers.get("etag"):
+            conditional["If-None-Match"] = cached.headers["etag"]
+        asset_response = await client.get(asset, headers=conditional)
+        total += _wire_size(asset_response)
+        if asset_response.status_code == 200:
+            cache[asset] = asset_response
+    return total
+
+
+async def run(requests: int):
+    import main
+
+    token = main.auth.create_access_token({"sub": "user1"})
+    transport = httpx.ASGITransport(app=main.app)
+    encodings = ("identity",) + compression.ENCODINGS[::-1]
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://transfer",
+                                 cookies={"access_token": token}) as client:
+        for path in PAGES:
+            for encoding in encodings:
+                cache = {}
+                first = await visit(client, path, encoding, cache)
+                repeat = await visit(client, path, encoding, cache)
+                timings = []
+                for _ in range(requests):
+                    start = time.perf_counter()
+                    await client.get(path, headers={"Accept-Encoding": encoding})
+                    timings.append((time.perf_counter() - start) * 1000)
+                results[(path, encoding)] = (first, repeat, statistics.median(timings))
+    return encodings, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes transferidos por página con compresión y caché de estáticos")
+    parser.add_argument("--requests", type=int, default=20, help="peticiones medidas por página y codificación")
+    args = parser.parse_args()
+
+    migrate.upgrade_database()
+    seed.seed(seed.SCALES["1k"], verbose=False)
+    encodings, results = asyncio.run(run(args.requests))
+
+    print(f"\nBytes por visita (HTML + estáticos + cabeceras) y mediana de {args.requests} peticiones del HTML\n")
+    print(f"{'página':<16}{'codificación':>14}{'1ª visita':>12}{'repetida':>12}{'ms':>8}")
+    for path in PAGES:
+        for encoding in encodings:
+            first, repeat, median = results[(path, encoding)]
+            print(f"{path:<16}{encoding:>14}{first:>12}{repeat:>12}{median:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+import csv
+import io
+import json
+import re
+import sys
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session, selectinload
+
+import analytics
+import events
+import models
+import search
+import stats
+
+# Importación y exportación masiva de prospectos, y borrado masivo.
+# - La importación lee el archivo en streaming, valida cada fila y hace un
+#   INSERT multi-fila por bloque (executemany), con commit por bloque.
+# - La exportación recorre la tabla con un cursor del lado del servidor
+#   (yield_per) y va emitiendo CSV/JSONL: la memoria no depende del tamaño.
+# - El borrado de prospectos/tareas es un DELETE por lista de ids: las FK con
+#   ON DELETE CASCADE (migración 0009) se llevan notas, tareas, asignaciones,
+#   subtareas e historial, sin cargarlos en memoria. Las sentencias no
+#   dependen de cuántos hijos tenga cada fila.
+
+CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+FORMATS = ("csv", "jsonl")
+
+PROSPECT_FIELDS = ("name", "industry", "contact_name", "email", "phone", "status", "address")
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+# --- Importación ---
+
+def _iter_records(stream, fmt: str):
+    """Devuelve (número de línea, dict) por registro. stream es binario."""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_number, ValueError(f"JSON inválido: {e}")
+                continue
+            yield line_number, record
+    else:
+        raise ValueError(f"Formato no soportado: {fmt}")
+
+
+def validate_record(record) -> dict:
+    if isinstance(record, Exception):
+        raise record
+    if not isinstance(record, dict):
+        raise ValueError("Se esperaba un objeto")
+    row = {}
+    for field in PROSPECT_FIELDS:
+        value = record.get(field)
+        if value is not None and not isinstance(value, str):
+            value = str(value)
+        row[field] = value.strip() if value and value.strip() else None
+    if not row["name"]:
+        raise ValueError("El nombre es obligatorio")
+    if row["email"] and not EMAIL_RE.match(row["email"]):
+        raise ValueError(f"Email inválido: {row['email']}")
+    row["status"] = row["status"] or models.PROSPECT_STATUSES[0]
+    if row["status"] not in models.PROSPECT_STATUSES:
+        raise ValueError(f"Estado inválido: {row['status']}")
+    return row
+
+
+def _flush(db: Session, batch: list):
+    if not batch:
+        return
+    # RETURNING en bloque (insertmanyvalues): ids para el historial y el índice sin releer las filas
+    ids = db.scalars(insert(models.Prospect).returning(models.Prospect.id, sort_by_parameter_order=True), batch).all()
+    prospects = [models.Prospect(id=prospect_id, **row) for prospect_id, row in zip(ids, batch)]
+    search.index_later(db, "prospect", ids)
+    analytics.record_imported(db, prospects)
+    stats.prospects_imported(db, Counter(row["status"] for row in batch))
+    db.commit()
+
+
+def import_prospects(db: Session, stream, fmt: str, created_by_id: int = None) -> dict:
+    report = {"inserted": 0, "failed": 0, "errors": []}
+    batch = []
+    for line_number, record in _iter_records(stream, fmt):
+        try:
+            row = validate_record(record)
+        except ValueError as e:
+            report["failed"] += 1
+            if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                report["errors"].append({"line": line_number, "error": str(e)})
+            continue
+        now = datetime.utcnow()
+        row.update(created_by_id=created_by_id, created_at=now, updated_at=now)
+        batch.append(row)
+        if len(batch) >= CHUNK_SIZE:
+            _flush(db, batch)
+            report["inserted"] += len(batch)
+            batch = []
+    _flush(db, batch)
+    report["inserted"] += len(batch)
+    return report
+
+
+# --- Borrado ---
+
+def _open_tasks_by_user(db: Session, condition) -> dict:
+    # Tareas abiertas que se van a borrar, por asignado (contadores del dashboard)
+    T, A = models.Task, models.task_assignments
+    return dict(db.execute(
+        select(A.c.user_id, func.count())
+        .join(T, T.id == A.c.task_id)
+        .where(condition, T.status != models.TaskStatus.DONE.value)
+        .group_by(A.c.user_id)
+    ).all())
+
+
+def _delete_rows(db: Session, model, ids):
+    # Sin sincronizar la sesión: las filas (y sus hijos) no se cargaron en ella
+    db.execute(delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False))
+
+
+def delete_prospects(db: Session, prospect_ids) -> list:
+    """Borra prospectos con todo lo que cuelga de ellos. Devuelve los ids borrados (sin commit)."""
+    P = models.Prospect
+    rows = db.execute(select(P.id, P.status).where(P.id.in_(prospect_ids))).all()
+    ids = [prospect_id for prospect_id, _ in rows]
+    if not ids:
+        return []
+    # Contadores e índice de búsqueda antes del DELETE, mientras los hijos existen
+    stats.prospects_removed(db, Counter(status for _, status in rows))
+    stats.open_tasks_removed(db, _open_tasks_by_user(db, models.Task.prospect_id.in_(ids)))
+    search.remove_prospects(db, ids)
+    for prospect_id, status in rows:
+        events.emit(db, "prospect", "deleted", prospect_id, prospect_id, status=status)
+    _delete_rows(db, P, ids)
+    return ids
+
+
+def delete_tasks(db: Session, task_ids) -> list:
+    """Borra tareas con sus asignaciones y subtareas. Devuelve los ids borrados (sin commit)."""
+    T, A = models.Task, models.task_assignments
+    rows = db.execute(select(T.id, T.prospect_id).where(T.id.in_(task_ids))).all()
+    ids = [task_id for task_id, _ in rows]
+    if not ids:
+        return []
+    owners = {}
+    for task_id, user_id in db.execute(select(A.c.task_id, A.c.user_id).where(A.c.task_id.in_(ids))):
+        owners.setdefault(task_id, []).append(user_id)
+    stats.open_tasks_removed(db, _open_tasks_by_user(db, T.id.in_(ids)))
+    search.remove_tasks(db, ids)
+    for task_id, prospect_id in rows:
+        events.emit(db, "task", "deleted", task_id, prospect_id, owners.get(task_id, ()))
+    _delete_rows(db, T, ids)
+    return ids
+
+
+# --- Exportación ---
+
+EXPORT_COLUMNS = ("id",) + PROSPECT_FIELDS + ("created_at", "notes", "tasks")
+
+
+def _prospect_record(prospect) -> dict:
+    return {
+        "id": prospect.id,
+        **{field: getattr(prospect, field) for field in PROSPECT_FIELDS},
+        "created_at": prospect.created_at.isoformat() if prospect.created_at else None,
+        "notes": [
+            {"content": note.content, "created_at": note.created_at.isoformat() if note.created_at else None}
+            for note in prospect.notes
+        ],
+        "tasks": [
+            {
+                "id": task.id,
+                "title": task.title,
+                "status": task.status,
+                "end_date": task.end_date.isoformat() if task.end_date else None,
+            }
+            for task in prospect.tasks
+        ],
+    }
+
+
+def _csv_line(values) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def export_prospects(db: Session, fmt: str):
+    """Generador de texto (CSV o JSONL), bloque a bloque."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato no soportado: {fmt}")
+    statement = (
+        select(models.Prospect)
+        .options(selectinload(models.Prospect.notes), selectinload(models.Prospect.tasks))
+        .order_by(models.Prospect.id)
+        .execution_options(yield_per=CHUNK_SIZE)
+    )
+    if fmt == "csv":
+        yield _csv_line(EXPORT_COLUMNS)
+    for partition in db.execute(statement).scalars().partitions():
+        lines = []
+        for prospect in partition:
+            record = _prospect_record(prospect)
+            if fmt == "csv":
+                record["notes"] = " | ".join(n["content"] or "" for n in record["notes"])
+                record["tasks"] = " | ".join(f"{t['title']} [{t['status']}]" for t in record["tasks"])
+                lines.append(_csv_line([record[c] for c in EXPORT_COLUMNS]))
+            else:
+                lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+        # El identity map es débil: las filas ya escritas se liberan al salir del bloque
+        yield "".join(lines)
+
+
+def _format_from_path(path: str) -> str:
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+if __name__ == "__main__":
+    # Uso: python bulk.py import leads.csv|leads.jsonl
+    #      python bulk.py export prospectos.csv|prospectos.jsonl
+    from database import SessionLocal
+
+    if len(sys.argv) != 3 or sys.argv[1] not in ("import", "export"):
+        print("Uso: python bulk.py import|export <archivo.csv|archivo.jsonl>")
+        sys.exit(1)
+    action, path = sys.argv[1], sys.argv[2]
+    db = SessionLocal()
+    try:
+        if action == "import":
+            with open(path, "rb") as f:
+                report = import_prospects(db, f, _format_from_path(path))
+            print(f"INFO: {report['inserted']} inserted, {report['failed']} failed.")
+            for error in report["errors"]:
+                print(f"  line {error['line']}: {error['error']}")
+        else:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                for chunk in export_prospects(db, _format_from_path(path)):
+                    f.write(chunk)
+            print(f"INFO: Exported prospects to {path}.")
+    finally:
+        db.close()
@@ -0,0 +1,144 @@
+import os
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+# Compresión de respuestas (middleware ASGI).
+# - Brotli si el cliente lo acepta y está instalado el paquete "brotli";
+#   si no, gzip. Sin "brotli" todo sigue funcionando con gzip.
+# - Solo tipos de texto (HTML, JSON, CSS, JS, CSV, ...) y a partir de
+#   COMPRESS_MIN_SIZE bytes: en respuestas chicas la cabecera gzip/br y el
+#   tiempo de CPU no compensan.
+# - Las respuestas en streaming (exportaciones) se comprimen por partes. El
+#   stream de eventos (text/event-stream) no se toca: cada evento tiene que
+#   llegar en el momento y no quedar en el buffer del compresor.
+# - Con compresión el ETag fuerte pasa a débil (la representación cambia);
+#   If-None-Match usa comparación débil, así que los 304 siguen funcionando.
+
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+)
+SKIP_TYPES = ("text/event-stream",)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str):
+    """Codificación preferida por el servidor entre las que acepta el cliente (q > 0)."""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip())
+    for encoding in ENCODINGS:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def _compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "").lower()
+    if not content_type.startswith(COMPRESSIBLE_TYPES) or content_type.startswith(SKIP_TYPES):
+        return False
+    if "content-encoding" in headers or "content-range" in headers:
+        return False
+    return "no-transform" not in headers.get("cache-control", "")
+
+
+class _Encoder:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self.compress, self.finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self.compress, self.finish = compressor.compress, compressor.flush
+
+
+class CompressionMiddleware:
+    """Middleware ASGI: comprime las respuestas de texto según Accept-Encoding."""
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        state = {"start": None, "encoder": None}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                if message["status"] in (204, 206, 304) or not _compressible(Headers(raw=message.get("headers", []))):
+                    await send(message)
+                    return
+                # Se retiene hasta ver el primer bloque del cuerpo (tamaño)
+                state["start"] = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            start = state["start"]
+            if start is None:
+                encoder = state["encoder"]
+                if encoder is not None:
+                    more_body = message.get("more_body", False)
+                    body = encoder.compress(message.get("body", b""))
+                    if not more_body:
+                        body += encoder.finish()
+                    elif not body:
+                        return  # el compresor todavía no emitió nada
+                    message = {"type": "http.response.body", "body": body, "more_body": more_body}
+                await send(message)
+                return
+
+            state["start"] = None
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers.add_vary_header("Accept-Encoding")
+            if encoding is None or (not more_body and len(body) < self.minimum_size):
+                await send({**start, "headers": headers.raw})
+                await send(message)
+                return
+
+            encoder = _Encoder(encoding)
+            body = encoder.compress(body)
+            if more_body:
+                state["encoder"] = encoder
+                del headers["content-length"]
+            else:
+                body += encoder.finish()
+                headers["content-length"] = str(len(body))
+            headers["content-encoding"] = encoding
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["etag"] = f"W/{etag}"
+            await send({**start, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
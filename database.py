@@ -1,11 +1,19 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql.dml import UpdateBase
+import contextvars
+import itertools
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
+IS_SERVERLESS = bool(os.environ.get("VERCEL")) or os.getcwd().startswith("/var/task")
+
 # Por defecto usa SQLite si no hay URL de Postgres configurada
 # Vercel usa "POSTGRES_URL", "POSTGRES_PRISMA_URL", etc. Intentamos leer POSTGRES_URL si DATABASE_URL falla.
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -16,25 +24,318 @@ if not DATABASE_URL:
     # FALLBACK DIAGNOSTIC
     print("WARNING: No DATABASE_URL or POSTGRES_URL found. Falling back to SQLite.")
     # On Vercel, root is read-only. We must use /tmp if we really want to try SQLite (data will be lost)
-    if os.environ.get("VERCEL") or os.getcwd().startswith("/var/task"):
+    if IS_SERVERLESS:
         print("ERROR: Running on Vercel with SQLite (ReadOnly FS). This will likely crash.")
     DATABASE_URL = "sqlite:///./crm.db"
 else:
     print(f"INFO: Database URL found (starts with {DATABASE_URL[:10]}...)")
 
 # Fix para SQLAlchemy que removió soporte para 'postgres://' (Vercel lo usa por defecto)
-if DATABASE_URL and DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+def _normalize_url(url):
+    if url and url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+DATABASE_URL = _normalize_url(DATABASE_URL)
+
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+
+def _env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+# --- Pool de conexiones ---
+# DB_POOL_MODE:
+#   "queue"      -> QueuePool con tamaño configurable (uvicorn / procesos largos)
+#   "serverless" -> pool mínimo por instancia (1 conexión + poco overflow), para
+#                   que los cold starts concurrentes no abran decenas de conexiones
+#   "external"   -> NullPool: el pooling lo hace PgBouncer / el pooler del proveedor
+# Por defecto: "serverless" en Vercel, "queue" en el resto.
+DB_POOL_MODE = os.getenv("DB_POOL_MODE") or ("serverless" if IS_SERVERLESS else "queue")
+
+
+def _pool_options(sqlite=IS_SQLITE):
+    if sqlite:
+        # SQLite usa su propio pool por defecto; solo ajustamos pragmas (ver abajo)
+        return {}
+    if DB_POOL_MODE == "external":
+        return {"poolclass": NullPool}
+    # pre_ping descarta conexiones muertas tras periodos de inactividad;
+    # recycle evita reutilizar conexiones que el servidor/pooler ya cerró.
+    options = {
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "1") == "1",
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", 300 if DB_POOL_MODE == "serverless" else 1800),
+        "pool_timeout": _env_int("DB_POOL_TIMEOUT", 10 if DB_POOL_MODE == "serverless" else 30),
+    }
+    if DB_POOL_MODE == "serverless":
+        options["pool_size"] = _env_int("DB_POOL_SIZE", 1)
+        options["max_overflow"] = _env_int("DB_MAX_OVERFLOW", 2)
+    else:
+        options["pool_size"] = _env_int("DB_POOL_SIZE", 5)
+        options["max_overflow"] = _env_int("DB_MAX_OVERFLOW", 10)
+    return options
+
+
+def _make_engine(url):
+    sqlite = url.startswith("sqlite")
+    new_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if sqlite else {},
+        **_pool_options(sqlite),
+    )
+    if sqlite:
+        event.listen(new_engine, "connect", _sqlite_pragmas)
+    return new_engine
+
+
+# --- SQLite local: WAL y pragmas ---
+# WAL permite lecturas concurrentes con una escritura; busy_timeout evita
+# "database is locked" inmediatos cuando varios hilos escriben a la vez.
+# foreign_keys: SQLite no aplica las FK (ni ON DELETE CASCADE / SET NULL)
+# salvo que se active en cada conexión.
+SQLITE_WAL = os.getenv("SQLITE_WAL", "1") == "1"
+SQLITE_BUSY_TIMEOUT_MS = _env_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    if SQLITE_WAL:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+engine = _make_engine(DATABASE_URL)
+
+if not IS_SQLITE:
+    print(f"INFO: Database pool mode '{DB_POOL_MODE}'.")
+
+
+# --- Métricas del pool ---
+pool_metrics = {
+    "connects": 0,
+    "checkouts": 0,
+    "checkins": 0,
+    "invalidations": 0,
+    "checked_out": 0,
+    "max_checked_out": 0,
+}
+_pool_metrics_lock = threading.Lock()
+
+
+@event.listens_for(engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    with _pool_metrics_lock:
+        pool_metrics["connects"] += 1
+
+
+@event.listens_for(engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    with _pool_metrics_lock:
+        pool_metrics["checkouts"] += 1
+        pool_metrics["checked_out"] += 1
+        pool_metrics["max_checked_out"] = max(pool_metrics["max_checked_out"], pool_metrics["checked_out"])
+
+
+@event.listens_for(engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    with _pool_metrics_lock:
+        pool_metrics["checkins"] += 1
+        pool_metrics["checked_out"] = max(pool_metrics["checked_out"] - 1, 0)
+
+
+@event.listens_for(engine, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    with _pool_metrics_lock:
+        pool_metrics["invalidations"] += 1
+
+
+def pool_stats() -> dict:
+    stats = dict(pool_metrics)
+    stats["mode"] = "sqlite" if IS_SQLITE else DB_POOL_MODE
+    pool = engine.pool
+    # size()/overflow() solo existen en QueuePool
+    if hasattr(pool, "overflow"):
+        stats["pool_size"] = pool.size()
+        stats["overflow"] = pool.overflow()
+        stats["idle"] = pool.checkedin()
+    return stats
+
 
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# --- Réplicas de lectura ---
+# DATABASE_REPLICA_URLS: URLs separadas por coma. Sin réplicas todo va a la
+# primaria, como siempre.
+# - Las peticiones GET/HEAD leen de una réplica (round-robin entre las sanas);
+#   cualquier escritura de esa misma sesión (flush, INSERT/UPDATE/DELETE) va a
+#   la primaria, y desde ahí también sus lecturas.
+# - Read-your-writes: una petición que puede escribir (POST, PUT, ...) deja
+#   una cookie que fija la primaria durante REPLICA_PIN_SECONDS, más que el
+#   retraso esperable de la replicación. El redirect posterior y las páginas
+#   siguientes de ese navegador muestran lo recién escrito.
+# - REPLICA_PRIMARY_PATHS siempre van a la primaria: /tasks/cards se pide justo
+#   después de un evento del tablero en vivo y la réplica podría no tenerlo.
+# - Salud: cada réplica se comprueba (SELECT 1) como mucho cada
+#   REPLICA_CHECK_INTERVAL segundos al elegirla, y una desconexión la marca
+#   caída al momento. Mientras está caída sus lecturas van a la primaria.
+# - Solo las sesiones de las peticiones (get_db, request_session) se enrutan;
+#   SessionLocal() en workers, migraciones y SSE siempre usa la primaria.
+DATABASE_REPLICA_URLS = [
+    _normalize_url(url.strip()) for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+]
+REPLICA_PIN_SECONDS = _env_int("REPLICA_PIN_SECONDS", 5)
+REPLICA_CHECK_INTERVAL = float(os.getenv("REPLICA_CHECK_INTERVAL", "10"))
+REPLICA_PIN_COOKIE = "db_primary"
+REPLICA_PRIMARY_PATHS = ("/tasks/cards",)
+
+
+class Replica:
+    def __init__(self, url: str):
+        self.url = url
+        self.engine = _make_engine(url)
+        self.healthy = True
+        self.checked_at = 0.0
+        self.failures = 0
+        self._lock = threading.Lock()
+        event.listen(self.engine, "handle_error", self._on_error)
+
+    def _on_error(self, context):
+        # Desconexión (o fallo al conectar): caída hasta la próxima comprobación
+        if context.is_disconnect or context.connection is None:
+            self.mark_down(context.original_exception)
+
+    def mark_down(self, error):
+        if self.healthy:
+            print(f"WARNING: Read replica {self.url[:10]}... unavailable, using primary. {error}")
+            self.failures += 1
+        self.healthy = False
+        self.checked_at = time.monotonic()
+
+    def available(self) -> bool:
+        if time.monotonic() - self.checked_at < REPLICA_CHECK_INTERVAL:
+            return self.healthy
+        # Un solo hilo comprueba; el resto usa el último resultado
+        if not self._lock.acquire(blocking=False):
+            return self.healthy
+        try:
+            self.checked_at = time.monotonic()
+            with self.engine.connect() as connection:
+                connection.exec_driver_sql("SELECT 1")
+            if not self.healthy:
+                print(f"INFO: Read replica {self.url[:10]}... is back.")
+            self.healthy = True
+        except Exception as e:
+            self.mark_down(e)
+        finally:
+            self._lock.release()
+        return self.healthy
+
+
+replicas = [Replica(url) for url in DATABASE_REPLICA_URLS]
+_next_replica = itertools.count()
+if replicas:
+    print(f"INFO: {len(replicas)} read replica(s) configured.")
+
+# True mientras se atiende una petición que puede leer de una réplica
+_read_only = contextvars.ContextVar("db_read_only", default=False)
+routing_metrics = {"replica_sessions": 0, "primary_sessions": 0}
+_routing_metrics_lock = threading.Lock()
+
+
+def pick_replica():
+    """Una réplica sana (round-robin), o None si no hay ninguna."""
+    start = next(_next_replica)
+    for offset in range(len(replicas)):
+        replica = replicas[(start + offset) % len(replicas)]
+        if replica.available():
+            return replica
+    return None
+
+
+def _has_pin(scope) -> bool:
+    for name, value in scope.get("headers", ()):
+        if name == b"cookie":
+            cookies = (part.strip().split("=", 1)[0] for part in value.decode("latin-1").split(";"))
+            if REPLICA_PIN_COOKIE in cookies:
+                return True
+    return False
+
+
+class ReplicaRoutingMiddleware:
+    """Middleware ASGI: marca las lecturas enrutables a réplica y fija la primaria tras una escritura."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not replicas:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in ("GET", "HEAD"):
+            read_only = not scope["path"].startswith(REPLICA_PRIMARY_PATHS) and not _has_pin(scope)
+            token = _read_only.set(read_only)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _read_only.reset(token)
+            return
+
+        cookie = f"{REPLICA_PIN_COOKIE}=1; Max-Age={REPLICA_PIN_SECONDS}; Path=/; HttpOnly; SameSite=Lax"
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 500:
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class RoutingSession(Session):
+    # info["replica"]: engine de réplica para las lecturas (lo fija request_session)
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        replica = self.info.get("replica")
+        if replica is not None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                # Desde la primera escritura, todo en la primaria
+                self.info["replica"] = replica = None
+            else:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def replica_stats() -> dict:
+    stats = dict(routing_metrics)
+    stats["configured"] = len(replicas)
+    stats["healthy"] = sum(1 for replica in replicas if replica.healthy)
+    stats["failures"] = sum(replica.failures for replica in replicas)
+    return stats
+
+
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
-def get_db():
+
+def request_session():
+    """Sesión para una petición: lee de una réplica si la petición lo permite."""
     db = SessionLocal()
+    if not replicas:
+        return db
+    replica = pick_replica() if _read_only.get() else None
+    if replica is not None:
+        db.info["replica"] = replica.engine
+    with _routing_metrics_lock:
+        routing_metrics["replica_sessions" if replica is not None else "primary_sessions"] += 1
+    return db
+
+
+def get_db():
+    db = request_session()
     try:
         yield db
     finally:
@@ -0,0 +1,229 @@
+import asyncio
+import itertools
+import json
+import os
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Eventos de cambios (tareas, subtareas, prospectos) para actualizar el tablero
+# en vivo por Server-Sent Events (GET /events).
+# - Los handlers de main.py encolan los eventos; se publican tras el commit.
+# - Cada conexión SSE es una suscripción con filtros opcionales por usuario
+#   (tareas asignadas / subtareas propias) y por prospecto.
+# - Backend en proceso por defecto. Con varios workers, EVENTS_URL (redis://...;
+#   requiere el paquete "redis") reparte los eventos entre todos los procesos.
+
+EVENTS_URL = os.getenv("EVENTS_URL")
+# Eventos en espera por conexión; si un cliente lento se llena, recibe "resync"
+EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "256"))
+# Comentario de keep-alive para proxies que cortan conexiones inactivas
+EVENTS_HEARTBEAT = float(os.getenv("EVENTS_HEARTBEAT", "15"))
+
+RESYNC = {"type": "resync"}
+
+
+class Subscription:
+    __slots__ = ("queue", "loop", "user_id", "prospect_id", "overflowed")
+
+    def __init__(self, loop, user_id=None, prospect_id=None):
+        self.queue = asyncio.Queue(maxsize=EVENTS_QUEUE_SIZE)
+        self.loop = loop
+        self.user_id = user_id
+        self.prospect_id = prospect_id
+        self.overflowed = False
+
+    def matches(self, event: dict) -> bool:
+        if self.prospect_id is not None and event.get("prospect_id") != self.prospect_id:
+            return False
+        if self.user_id is not None and self.user_id not in event.get("user_ids", ()):
+            return False
+        return True
+
+    def put(self, event: dict):
+        # Corre en el event loop de la conexión (call_soon_threadsafe)
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Perdimos eventos: el cliente debe recargar en vez de aplicar deltas
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class LocalBroker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = set()
+        self._ids = itertools.count(1)
+        self.published = 0
+
+    def subscribe(self, user_id=None, prospect_id=None) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), user_id, prospect_id)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event: dict):
+        self.dispatch(event)
+
+    def dispatch(self, event: dict):
+        # Puede llamarse desde el threadpool (handlers "def") o desde el hilo del
+        # backend compartido: cada cola se toca solo desde su propio loop
+        event = {**event, "seq": next(self._ids)}
+        with self._lock:
+            self.published += 1
+            targets = [s for s in self._subscriptions if s.matches(event)]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                # Loop cerrado (apagado del servidor)
+                self.unsubscribe(subscription)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"subscribers": len(self._subscriptions), "published": self.published}
+
+
+class RedisBroker(LocalBroker):
+    """Publica en un canal de redis; un hilo por proceso reparte lo recibido."""
+
+    CHANNEL = "crm:events"
+
+    def __init__(self, url: str):
+        import redis  # dependencia opcional
+
+        super().__init__()
+        self._client = redis.Redis.from_url(url)
+        self._listener = None
+
+    def subscribe(self, user_id=None, prospect_id=None) -> Subscription:
+        self._start_listener()
+        return super().subscribe(user_id, prospect_id)
+
+    def publish(self, event: dict):
+        self._client.publish(self.CHANNEL, json.dumps(event))
+
+    def _start_listener(self):
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(target=self._listen, name="events-listener", daemon=True)
+        self._listener.start()
+
+    def _listen(self):
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.CHANNEL)
+        for message in pubsub.listen():
+            try:
+                self.dispatch(json.loads(message["data"]))
+            except (TypeError, ValueError):
+                print("WARNING: Ignoring malformed event from shared backend.")
+
+    def stats(self) -> dict:
+        return {**super().stats(), "backend": "redis"}
+
+
+def _make_broker():
+    if EVENTS_URL:
+        try:
+            broker = RedisBroker(EVENTS_URL)
+            print("INFO: Live events using shared backend.")
+            return broker
+        except ImportError:
+            print("WARNING: EVENTS_URL set but 'redis' is not installed. Using in-process events.")
+    return LocalBroker()
+
+
+broker = _make_broker()
+
+
+# --- Publicación ---
+# Los handlers encolan los eventos en la sesión (antes del commit, mientras los
+# datos están cargados); se publican en el after_commit y se descartan si hay
+# rollback, así nunca se anuncia un cambio que no quedó guardado.
+
+def _publish(event: dict):
+    try:
+        broker.publish(event)
+    except Exception as exc:
+        # Un fallo del backend de eventos nunca debe romper la escritura ya confirmada
+        print(f"WARNING: Could not publish {event['type']} event: {exc}")
+
+
+def emit(db: Session, kind: str, action: str, entity_id: int, prospect_id=None, user_ids=(), **data):
+    db.info.setdefault("pending_events", []).append({
+        "type": kind,
+        "action": action,
+        "id": entity_id,
+        "prospect_id": prospect_id,
+        "user_ids": sorted(set(user_ids)),
+        **data,
+    })
+
+
+def task_changed(db: Session, task, action: str = "updated", user_ids=None):
+    if user_ids is None:
+        user_ids = [u.id for u in task.assignees]
+    emit(db, "task", action, task.id, task.prospect_id, user_ids, status=task.status)
+
+
+def subtask_changed(db: Session, sub, action: str = "updated"):
+    emit(db, "subtask", action, sub.id, sub.parent_task.prospect_id if sub.parent_task else None,
+         [sub.user_id], task_id=sub.task_id, status=sub.status)
+
+
+def prospect_changed(db: Session, prospect, action: str = "updated"):
+    emit(db, "prospect", action, prospect.id, prospect.id, status=prospect.status)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session):
+    for pending in session.info.pop("pending_events", ()):
+        _publish(pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session, previous_transaction):
+    session.info.pop("pending_events", None)
+
+
+# --- Formato SSE ---
+
+def format_event(event: dict) -> str:
+    # user_ids solo sirve para filtrar en el servidor: no se envía al navegador
+    event = {key: value for key, value in event.items() if key != "user_ids"}
+    lines = []
+    if "seq" in event:
+        lines.append(f"id: {event['seq']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream(request, subscription: Subscription):
+    """Generador de la respuesta SSE de una suscripción. Termina al desconectarse el cliente."""
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), EVENTS_HEARTBEAT)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": ping\n\n"
+                continue
+            yield format_event(event)
+            if event is RESYNC:
+                break
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,168 @@
+import json
+import os
+import threading
+
+from markupsafe import Markup
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+import models
+from cache import TTLCache
+
+# Caché de fragmentos HTML ya renderizados (tarjetas de tarea, filas de
+# prospecto, tarjetas de subtarea). Clave: tipo + id de la entidad; cada entrada
+# guarda además la versión con la que se renderizó (updated_at y los datos
+# relacionados que muestra), así que una versión distinta nunca sirve HTML viejo.
+# Las escrituras invalidan las entradas en el after_flush de la sesión.
+#
+# Backend: LRU en memoria del proceso (por defecto) o compartido si se define
+# FRAGMENT_CACHE_URL (redis://...; requiere el paquete "redis").
+
+FRAGMENT_CACHE_SIZE = int(os.getenv("FRAGMENT_CACHE_SIZE", "5000"))
+FRAGMENT_CACHE_TTL = float(os.getenv("FRAGMENT_CACHE_TTL", "3600"))
+FRAGMENT_CACHE_URL = os.getenv("FRAGMENT_CACHE_URL")
+
+
+class LocalBackend:
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def set(self, key, value):
+        self._cache.set(key, value)
+
+    def delete(self, *keys):
+        for key in keys:
+            self._cache.delete(key)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+class RedisBackend:
+    """Backend compartido entre procesos/instancias. Los valores van en JSON."""
+
+    PREFIX = "crm:fragment:"
+
+    def __init__(self, url: str, ttl: float):
+        import redis  # dependencia opcional
+
+        self._client = redis.Redis.from_url(url)
+        self._ttl = int(ttl)
+
+    def get(self, key):
+        raw = self._client.get(self.PREFIX + key)
+        if raw is None:
+            return None
+        version, html = json.loads(raw)
+        return version, html
+
+    def set(self, key, value):
+        self._client.set(self.PREFIX + key, json.dumps(value), ex=self._ttl)
+
+    def delete(self, *keys):
+        if keys:
+            self._client.delete(*(self.PREFIX + key for key in keys))
+
+    def stats(self) -> dict:
+        return {"backend": "redis"}
+
+
+def _make_backend():
+    if FRAGMENT_CACHE_URL:
+        try:
+            backend = RedisBackend(FRAGMENT_CACHE_URL, FRAGMENT_CACHE_TTL)
+            print("INFO: Fragment cache using shared backend.")
+            return backend
+        except ImportError:
+            print("WARNING: FRAGMENT_CACHE_URL set but 'redis' is not installed. Using in-process cache.")
+    return LocalBackend(FRAGMENT_CACHE_SIZE, FRAGMENT_CACHE_TTL)
+
+
+backend = _make_backend()
+
+# Aciertos/fallos a nivel de fragmento: una entrada con otra versión cuenta como fallo.
+# Con lock: las rutas síncronas renderizan a la vez desde el threadpool.
+_lock = threading.Lock()
+_counters = {"hits": 0, "misses": 0}
+
+
+def _count(outcome: str):
+    with _lock:
+        _counters[outcome] += 1
+
+
+def stats() -> dict:
+    with _lock:
+        counters = dict(_counters)
+    return {**backend.stats(), **counters}
+
+
+def _cached(env, kind: str, entity_id: int, version, template_name: str, **context) -> Markup:
+    key = f"{kind}:{entity_id}"
+    version = repr(version)
+    entry = backend.get(key)
+    if entry is not None and entry[0] == version:
+        _count("hits")
+        return Markup(entry[1])
+    _count("misses")
+    html = env.get_template(template_name).render(**context)
+    backend.set(key, (version, html))
+    return Markup(html)
+
+
+# --- Versiones: todo lo que cambia el HTML del fragmento ---
+
+def _task_card_version(task, redirect_mode):
+    prospect = task.prospect
+    return (task.updated_at, task.position, prospect.id if prospect else None, prospect.name if prospect else None,
+            bool(redirect_mode))
+
+
+def _prospect_row_version(prospect):
+    return (prospect.updated_at, prospect.creator.username if prospect.creator else None)
+
+
+def _subtask_card_version(sub):
+    # La versión son los campos que muestra (incluido el título de la tarea padre)
+    return (sub.title, sub.status, sub.parent_task.title if sub.parent_task else None)
+
+
+def install(env):
+    """Registra task_card(), prospect_row() y subtask_card() como globals de Jinja."""
+
+    def task_card(task, redirect_mode=False):
+        kind = "task_card_redirect" if redirect_mode else "task_card"
+        return _cached(env, kind, task.id, _task_card_version(task, redirect_mode),
+                       "components/task_card.html", task=task, redirect_mode=redirect_mode)
+
+    def prospect_row(prospect):
+        return _cached(env, "prospect_row", prospect.id, _prospect_row_version(prospect),
+                       "components/prospect_row.html", prospect=prospect)
+
+    def subtask_card(sub):
+        return _cached(env, "subtask_card", sub.id, _subtask_card_version(sub),
+                       "components/subtask_card.html", sub=sub)
+
+    env.globals.update(task_card=task_card, prospect_row=prospect_row, subtask_card=subtask_card)
+
+
+# --- Invalidación por escritura ---
+
+def invalidate(instance):
+    if isinstance(instance, models.Task):
+        backend.delete(f"task_card:{instance.id}", f"task_card_redirect:{instance.id}")
+    elif isinstance(instance, models.Prospect):
+        backend.delete(f"prospect_row:{instance.id}")
+    elif isinstance(instance, models.SubTask):
+        backend.delete(f"subtask_card:{instance.id}")
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session, flush_context):
+    # En after_flush las colecciones dirty/deleted aún reflejan lo que se escribió
+    for instance in list(session.dirty) + list(session.deleted):
+        if instance.__dict__.get("id") is not None:
+            invalidate(instance)
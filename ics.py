@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+import models
+import queries
+
+# Feed iCalendar (RFC 5545) con las tareas que tienen fecha de entrega.
+# Cada tarea es un evento de día completo en su end_date. El feed se genera
+# en streaming (yield_per) para no cargar toda la ventana en memoria.
+
+PRODID = "-//ADM TERRA//CRM//ES"
+UID_DOMAIN = "crm-adm-terra"
+BATCH_SIZE = 500
+
+STATUS_LABELS = {
+    models.TaskStatus.TODO.value: "Pendiente",
+    models.TaskStatus.IN_PROGRESS.value: "En curso",
+    models.TaskStatus.DONE.value: "Completado",
+}
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    # Líneas de máx. 75 octetos; las continuaciones empiezan con un espacio
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _timestamp(value: datetime) -> str:
+    # Las fechas del modelo se guardan en UTC (datetime.utcnow)
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def event(task) -> str:
+    day = task.end_date.date()
+    modified = task.updated_at or task.created_at or datetime.utcnow()
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:task-{task.id}@{UID_DOMAIN}",
+        f"DTSTAMP:{_timestamp(modified)}",
+        f"LAST-MODIFIED:{_timestamp(modified)}",
+        f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+        f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+        f"SUMMARY:{_escape(task.title or '')}",
+        f"CATEGORIES:{_escape(STATUS_LABELS.get(task.status, task.status or ''))}",
+        "TRANSP:TRANSPARENT",
+    ]
+    if task.description:
+        lines.append(f"DESCRIPTION:{_escape(task.description)}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def feed(db: Session, start, end, status=None, name: str = "CRM - Tareas", **filters):
+    """Genera el .ics por partes: cabecera, un evento por tarea y cierre."""
+    yield "".join(_fold(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ))
+    query = queries.filter_calendar_status(queries.filter_calendar(db.query(models.Task), start, end), status)
+    query = queries.filter_tasks(query, **filters).order_by(*queries.CALENDAR_ORDER)
+    chunk = []
+    for task in query.yield_per(BATCH_SIZE):
+        chunk.append(event(task))
+        if len(chunk) >= BATCH_SIZE:
+            yield "".join(chunk)
+            chunk = []
+    chunk.append(_fold("END:VCALENDAR"))
+    yield "".join(chunk)
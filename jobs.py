@@ -0,0 +1,359 @@
+import heapq
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, event, func, insert, select, update
+from sqlalchemy.orm import Session
+
+import metrics
+import models
+from database import IS_SERVERLESS, SessionLocal
+
+# Cola de trabajos en segundo plano: lo que una escritura desencadena pero el
+# usuario no necesita ver hecho antes del redirect (índice de búsqueda, y en
+# adelante notificaciones, auditoría, ...).
+# - Los handlers encolan con enqueue(db, "nombre", **payload) antes del commit.
+#   Como los eventos (events.py), el trabajo se despacha en el after_commit y se
+#   descarta con rollback: nunca corre por una escritura que no quedó guardada.
+# - JOBS_BACKEND=memory (por defecto): cola en memoria del proceso. Lo
+#   pendiente se pierde si el proceso muere (al apagarse se espera hasta
+#   JOBS_DRAIN_TIMEOUT a que se vacíe).
+# - JOBS_BACKEND=db: el trabajo se inserta en la tabla jobs en la misma
+#   transacción que la escritura y sobrevive a reinicios. Lo toma el worker de
+#   cualquier proceso (FOR UPDATE SKIP LOCKED en Postgres) y se borra en la
+#   misma transacción que su resultado.
+# - JOBS_WORKERS hilos por proceso. Con 0 (por defecto en serverless, donde no
+#   hay vida después de la respuesta) los trabajos corren justo después del
+#   commit, en la misma petición; con JOBS_BACKEND=db los que fallen o queden
+#   pendientes se procesan con "python jobs.py" (cron).
+# - Reintentos: hasta JOB_MAX_ATTEMPTS ejecuciones, esperando
+#   JOB_RETRY_DELAY * 2^(intento - 1) segundos. Los handlers deben ser
+#   idempotentes (un trabajo puede correr más de una vez).
+
+JOBS_BACKEND = os.getenv("JOBS_BACKEND", "memory")
+JOBS_WORKERS = int(os.getenv("JOBS_WORKERS", "0" if IS_SERVERLESS else "2"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_RETRY_DELAY = float(os.getenv("JOB_RETRY_DELAY", "2"))
+# Backend db: cada cuánto se mira la tabla sin aviso del propio proceso
+JOBS_POLL_INTERVAL = float(os.getenv("JOBS_POLL_INTERVAL", "1"))
+# Backend db: un trabajo "running" por más tiempo es de un proceso caído y se reencola
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", "300"))
+JOBS_DRAIN_TIMEOUT = float(os.getenv("JOBS_DRAIN_TIMEOUT", "10"))
+
+QUEUED, RUNNING, FAILED = "queued", "running", "failed"
+
+J = models.Job
+
+_handlers = {}
+
+
+def handler(name: str):
+    """Decorador: registra fn(db, **payload) como el handler del trabajo `name`.
+
+    El handler recibe una sesión propia; el commit lo hace la cola si termina
+    sin excepción.
+    """
+    def register(fn):
+        _handlers[name] = fn
+        return fn
+    return register
+
+
+def enqueue(db: Session, name: str, **payload):
+    """Encola un trabajo que corre cuando (y si) se confirma la transacción de `db`."""
+    if name not in _handlers:
+        raise ValueError(f"Trabajo desconocido: {name}")
+    if JOBS_BACKEND == "db":
+        now = datetime.utcnow()
+        db.execute(insert(J).values(name=name, payload=json.dumps(payload), status=QUEUED, attempts=0,
+                                    run_at=now, created_at=now))
+        db.info["jobs_inserted"] = db.info.get("jobs_inserted", 0) + 1
+    else:
+        db.info.setdefault("pending_jobs", []).append((name, payload))
+
+
+# --- Estado del proceso ---
+
+_heap = []  # backend memory: (vence, nº, nombre, payload, intentos)
+_seq = itertools.count()
+_cond = threading.Condition()
+_running = 0  # backend memory: trabajos en curso
+_stats = {"done": 0, "retried": 0, "failed": 0}
+_workers = []
+_stop = threading.Event()
+_wake = threading.Event()  # backend db: hay trabajos nuevos de este proceso
+_last_recovery = None
+
+
+def _retry_delay(attempts: int) -> float:
+    return JOB_RETRY_DELAY * 2 ** (attempts - 1)
+
+
+def _record(name: str, outcome: str, wait: float, duration: float):
+    with _cond:
+        _stats[outcome if outcome != "retry" else "retried"] += 1
+    metrics.registry.observe_job(name, outcome, wait, duration)
+
+
+def _run_handler(db: Session, name: str, payload: dict):
+    fn = _handlers.get(name)
+    if fn is None:
+        raise LookupError(f"Sin handler para el trabajo {name}")
+    fn(db, **payload)
+
+
+# --- Backend memory ---
+
+def _push(name: str, payload: dict, attempts: int = 0, due: float = None):
+    with _cond:
+        heapq.heappush(_heap, (due or time.time(), next(_seq), name, payload, attempts))
+        _cond.notify()
+
+
+def _execute_memory(name: str, payload: dict, attempts: int, due: float, retry: bool = True):
+    started = time.time()
+    attempts += 1
+    db = SessionLocal()
+    try:
+        _run_handler(db, name, payload)
+        db.commit()
+        outcome = "done"
+    except Exception as exc:
+        db.rollback()
+        if retry and attempts < JOB_MAX_ATTEMPTS:
+            outcome = "retry"
+            _push(name, payload, attempts, time.time() + _retry_delay(attempts))
+        else:
+            outcome = "failed"
+            print(f"WARNING: Job {name} failed after {attempts} attempt(s), dropped. {exc}")
+    finally:
+        db.close()
+    _record(name, outcome, started - due, time.time() - started)
+
+
+def _memory_worker():
+    global _running
+    while True:
+        with _cond:
+            while True:
+                if _stop.is_set():
+                    return
+                if _heap and _heap[0][0] <= time.time():
+                    due, _, name, payload, attempts = heapq.heappop(_heap)
+                    _running += 1
+                    break
+                _cond.wait(_heap[0][0] - time.time() if _heap else None)
+        try:
+            _execute_memory(name, payload, attempts, due)
+        finally:
+            with _cond:
+                _running -= 1
+                _cond.notify_all()
+
+
+# --- Backend db ---
+
+def _recover_stale(db: Session):
+    global _last_recovery
+    if _last_recovery is not None and time.monotonic() - _last_recovery < min(JOB_TIMEOUT, 60):
+        return
+    _last_recovery = time.monotonic()
+    cutoff = datetime.utcnow() - timedelta(seconds=JOB_TIMEOUT)
+    result = db.execute(update(J).where(J.status == RUNNING, J.started_at < cutoff).values(status=QUEUED))
+    db.commit()
+    if result.rowcount:
+        print(f"WARNING: Requeued {result.rowcount} job(s) left running by a stopped process.")
+
+
+def _claim(db: Session):
+    """Toma el siguiente trabajo vencido (lo marca running). None si no hay."""
+    now = datetime.utcnow()
+    next_id = (
+        select(J.id).where(J.status == QUEUED, J.run_at <= now).order_by(J.run_at, J.id).limit(1)
+        .with_for_update(skip_locked=True).scalar_subquery()
+    )
+    row = db.execute(
+        update(J).where(J.id == next_id, J.status == QUEUED)
+        .values(status=RUNNING, started_at=now, attempts=J.attempts + 1)
+        .returning(J.id, J.name, J.payload, J.attempts, J.run_at)
+    ).first()
+    db.commit()
+    return row
+
+
+def _execute_db(db: Session, job) -> None:
+    started = time.time()
+    wait = (datetime.utcnow() - job.run_at).total_seconds()
+    try:
+        _run_handler(db, job.name, json.loads(job.payload))
+        # Hecho: el trabajo sale de la tabla en la misma transacción que su resultado
+        db.execute(delete(J).where(J.id == job.id))
+        db.commit()
+        outcome = "done"
+    except Exception as exc:
+        db.rollback()
+        values = {"last_error": str(exc)[:2000]}
+        if job.attempts < JOB_MAX_ATTEMPTS:
+            outcome = "retry"
+            values.update(status=QUEUED, run_at=datetime.utcnow() + timedelta(seconds=_retry_delay(job.attempts)))
+        else:
+            outcome = "failed"
+            values.update(status=FAILED)
+            print(f"WARNING: Job {job.name} #{job.id} failed after {job.attempts} attempt(s). {exc}")
+        db.execute(update(J).where(J.id == job.id).values(**values))
+        db.commit()
+    _record(job.name, outcome, wait, time.time() - started)
+
+
+def run_pending(limit: int = None) -> int:
+    """Backend db: procesa trabajos vencidos hasta vaciar la cola (o `limit`). Devuelve cuántos."""
+    processed = 0
+    db = SessionLocal()
+    try:
+        _recover_stale(db)
+        while limit is None or processed < limit:
+            job = _claim(db)
+            if job is None:
+                break
+            _execute_db(db, job)
+            processed += 1
+    finally:
+        db.close()
+    return processed
+
+
+def _db_worker():
+    while not _stop.is_set():
+        try:
+            processed = run_pending(limit=1)
+        except Exception as exc:
+            # P. ej. la base no responde: esperar y volver a intentar
+            print(f"WARNING: Job worker error. {exc}")
+            processed = 0
+        if not processed:
+            _wake.wait(JOBS_POLL_INTERVAL)
+            _wake.clear()
+
+
+# --- Despacho tras el commit ---
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_after_commit(session):
+    pending = session.info.pop("pending_jobs", ())
+    inserted = session.info.pop("jobs_inserted", 0)
+    if _workers:
+        for name, payload in pending:
+            _push(name, payload)
+        if inserted:
+            _wake.set()
+        return
+    # Sin workers en este proceso: se ejecutan ya, en el mismo hilo
+    for name, payload in pending:
+        _execute_memory(name, payload, 0, time.time(), retry=False)
+    if inserted:
+        run_pending(limit=inserted)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session, previous_transaction):
+    session.info.pop("pending_jobs", None)
+    session.info.pop("jobs_inserted", None)
+
+
+# --- Workers ---
+
+def start_workers(count: int = None):
+    count = JOBS_WORKERS if count is None else count
+    if count <= 0 or _workers:
+        return
+    _stop.clear()
+    target = _db_worker if JOBS_BACKEND == "db" else _memory_worker
+    for i in range(count):
+        worker = threading.Thread(target=target, name=f"jobs-worker-{i}", daemon=True)
+        _workers.append(worker)
+        worker.start()
+    print(f"INFO: {count} background job worker(s) started ({JOBS_BACKEND} queue).")
+
+
+def drain(timeout: float = JOBS_DRAIN_TIMEOUT) -> bool:
+    """Espera a que no queden trabajos vencidos ni en curso. False si se agotó el tiempo."""
+    deadline = time.monotonic() + timeout
+    if JOBS_BACKEND == "db":
+        while time.monotonic() < deadline:
+            depth = _db_depth()
+            if not depth[QUEUED] and not depth[RUNNING]:
+                return True
+            _wake.set()
+            time.sleep(0.05)
+        return False
+    with _cond:
+        return _cond.wait_for(lambda: not _running and not (_heap and _heap[0][0] <= time.time()),
+                              max(deadline - time.monotonic(), 0))
+
+
+def stop_workers():
+    if not _workers:
+        return
+    # En memoria lo pendiente se perdería: se da un margen para terminarlo
+    if JOBS_BACKEND != "db" and not drain():
+        print(f"WARNING: Stopping job workers with {len(_heap)} job(s) still queued.")
+    _stop.set()
+    _wake.set()
+    with _cond:
+        _cond.notify_all()
+    for worker in _workers:
+        worker.join(timeout=1)
+    _workers.clear()
+
+
+# --- Estado ---
+
+def _db_depth() -> dict:
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(J.status, func.count()).where((J.status != QUEUED) | (J.run_at <= now)).group_by(J.status)
+        ).all()
+    finally:
+        db.close()
+    return {QUEUED: 0, RUNNING: 0, FAILED: 0, **dict(rows)}
+
+
+def stats() -> dict:
+    with _cond:
+        result = {**_stats, "backend": JOBS_BACKEND, "workers": len(_workers)}
+        if JOBS_BACKEND != "db":
+            result.update(queued=len(_heap), running=_running)
+    if JOBS_BACKEND == "db":
+        depth = _db_depth()
+        result.update(queued=depth[QUEUED], running=depth[RUNNING], failed_pending=depth[FAILED])
+    return result
+
+
+def main(args: list):
+    if JOBS_BACKEND != "db":
+        print("Uso: JOBS_BACKEND=db python jobs.py [retry]")
+        sys.exit(1)
+    if args == ["retry"]:
+        session = SessionLocal()
+        requeued = session.execute(update(J).where(J.status == FAILED).values(status=QUEUED, attempts=0)).rowcount
+        session.commit()
+        session.close()
+        print(f"Trabajos fallidos reencolados: {requeued}")
+    print(f"Trabajos procesados: {run_pending()}")
+
+
+if __name__ == "__main__":
+    # Procesa la cola persistente (cron en serverless); "retry" reencola antes los fallidos.
+    # Como script este archivo es __main__: los handlers se registran en el
+    # módulo jobs que importan los demás, así que se usa ese.
+    import jobs
+    import search  # noqa: F401  (registra sus handlers)
+
+    jobs.main(sys.argv[1:])
@@ -0,0 +1,143 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+import events
+import models
+import stats
+
+# Cambios del kanban aplicados en lote: movimientos de estado, reordenamientos
+# y altas/bajas de asignados en una sola transacción.
+# - Se cargan todas las tareas y sus asignados con dos consultas.
+# - Los asignados se actualizan por diferencia (INSERT/DELETE solo de las filas
+#   que cambian en task_assignments), sin reemplazar la colección completa.
+# - Los contadores del dashboard se ajustan igual que en los handlers sueltos.
+
+
+class BatchError(ValueError):
+    pass
+
+
+def _assignee_ids(db: Session, task_ids) -> dict:
+    rows = db.execute(
+        select(models.task_assignments.c.task_id, models.task_assignments.c.user_id)
+        .where(models.task_assignments.c.task_id.in_(task_ids))
+    )
+    assignees = {task_id: set() for task_id in task_ids}
+    for task_id, user_id in rows:
+        assignees[task_id].add(user_id)
+    return assignees
+
+
+def _validate(db: Session, operations, tasks: dict):
+    errors = []
+    for index, op in enumerate(operations):
+        for task_id in (op.task_id, op.before_id):
+            if task_id is not None and task_id not in tasks:
+                errors.append(f"Operación {index}: tarea {task_id} no existe")
+        if op.before_id is not None and op.before_id == op.task_id:
+            errors.append(f"Operación {index}: una tarea no puede ir antes de sí misma")
+    user_ids = {u for op in operations for u in op.add_assignees}
+    if user_ids:
+        found = {u for (u,) in db.query(models.User.id).filter(models.User.id.in_(user_ids))}
+        for missing in sorted(user_ids - found):
+            errors.append(f"Usuario {missing} no existe")
+    if errors:
+        raise BatchError("; ".join(errors))
+
+
+def next_position(db: Session, status: str) -> int:
+    """Primera posición libre al final de la columna."""
+    current = db.query(func.max(models.Task.position)).filter(models.Task.status == status).scalar()
+    return (current or 0) + 1
+
+
+class _Positions:
+    """Siguiente posición libre al final de cada columna (se consulta una vez por estado)."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._next = {}
+
+    def take(self, status: str) -> int:
+        if status not in self._next:
+            self._next[status] = next_position(self.db, status)
+        position = self._next[status]
+        self._next[status] += 1
+        return position
+
+    def forget(self, status: str):
+        self._next.pop(status, None)
+
+
+def _insert_before(db: Session, task, anchor, positions: _Positions):
+    # Abre un hueco en la columna destino corriendo una posición lo que está
+    # desde el ancla hacia abajo, y coloca la tarea en el lugar del ancla.
+    # Los huecos que quedan en la columna de origen no importan: solo cuenta el orden.
+    db.flush()
+    position = anchor.position
+    db.execute(
+        update(models.Task)
+        .where(models.Task.status == anchor.status, models.Task.position >= position,
+               models.Task.id != task.id)
+        .values(position=models.Task.position + 1)
+        .execution_options(synchronize_session="evaluate")
+    )
+    task.position = position
+    positions.forget(anchor.status)
+
+
+def apply_batch(db: Session, operations) -> list:
+    """Aplica las operaciones en orden. Devuelve los ids de las tareas cambiadas.
+
+    No hace commit: el llamador confirma (o descarta) la transacción completa.
+    """
+    task_ids = {op.task_id for op in operations} | {op.before_id for op in operations if op.before_id}
+    tasks = {t.id: t for t in db.query(models.Task).filter(models.Task.id.in_(task_ids))}
+    _validate(db, operations, tasks)
+    assignees = _assignee_ids(db, list(tasks))
+    positions = _Positions(db)
+    changed = []
+
+    for op in operations:
+        task = tasks[op.task_id]
+        current = assignees[task.id]
+        target = op.status or task.status
+
+        if op.before_id is not None:
+            anchor = tasks[op.before_id]
+            if anchor.status != target:
+                raise BatchError(f"La tarea {anchor.id} no está en la columna '{target}'")
+            _insert_before(db, task, anchor, positions)
+        elif target != task.status:
+            task.position = positions.take(target)
+
+        if target != task.status:
+            stats.task_status_changed(db, current, task.status, target)
+            task.status = target
+
+        added = set(op.add_assignees) - current
+        removed = set(op.remove_assignees) & current
+        if added:
+            db.execute(insert(models.task_assignments), [{"task_id": task.id, "user_id": u} for u in added])
+        if removed:
+            db.execute(
+                delete(models.task_assignments)
+                .where(models.task_assignments.c.task_id == task.id,
+                       models.task_assignments.c.user_id.in_(removed))
+            )
+        if added or removed:
+            stats.task_assignees_changed(db, task.status, added_ids=added, removed_ids=removed)
+            current |= added
+            current -= removed
+            # Cambiar solo asignados no dispara onupdate: marcamos la versión a mano
+            task.updated_at = datetime.utcnow()
+            db.expire(task, ["assignees"])
+
+        # Los que dejan de estar asignados también reciben el evento (para quitar la tarjeta)
+        events.task_changed(db, task, user_ids=current | removed)
+        changed.append(task.id)
+
+    db.flush()
+    return list(dict.fromkeys(changed))
@@ -1,56 +1,127 @@
-from fastapi import FastAPI, Request, Depends, Form, Response, status
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from fastapi import FastAPI, Request, Depends, Form, Query, Response, status
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pathlib import Path
 from datetime import timedelta, datetime
+import os
+import anyio
+from urllib.parse import urlencode
 
 import models
 import auth
-from database import engine, get_db
-
-# NOTA: En producción usar Alembic.
+import queries
+import search
+import stats
+import migrate
+import analytics
+import api
+import archive
+import assets
+import bulk
+import compression
+import events
+import fragments
+import jobs
+import kanban
+import metrics
+import schemas
+import templating
+from database import get_db, SessionLocal, engine, pool_stats, replicas, replica_stats, ReplicaRoutingMiddleware
+
+# El esquema se gestiona con Alembic (migrate.py, carpeta migrations/).
 # IMPORTANTE: Ya NO borramos los datos al iniciar.
-# models.Base.metadata.drop_all(bind=engine)
 app = FastAPI(title="CRM Agencia")
 
+# Las rutas que usan la sesión síncrona de SQLAlchemy se declaran con "def"
+# para que FastAPI las ejecute en su threadpool y no bloqueen el event loop.
+# El tamaño del threadpool es acotado y configurable.
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
+# Compresión gzip/brotli de las respuestas de texto (compression.py). Se agrega
+# antes que las métricas para quedar por dentro: el tamaño medido es el enviado.
+app.add_middleware(compression.CompressionMiddleware)
+
+# Lecturas de GET a réplicas, con la primaria fijada tras una escritura
+# (DATABASE_REPLICA_URLS; sin réplicas no hace nada)
+app.add_middleware(ReplicaRoutingMiddleware)
+
+# Métricas por petición (SQL, render, tamaño): Server-Timing, /metrics y log de lentas
+app.add_middleware(metrics.MetricsMiddleware)
+metrics.instrument_engine(engine)
+# También las réplicas: las lecturas enrutadas allí cuentan igual en Server-Timing y /metrics
+for replica in replicas:
+    metrics.instrument_engine(replica.engine)
+
 @app.on_event("startup")
 async def startup_event():
-    # Inicialización de tablas en tiempo de ejecución para capturar logs correctamente
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Migraciones en tiempo de ejecución para capturar logs correctamente.
+    # Con la revisión al día no se carga Alembic (ver MIGRATE_ON_STARTUP en migrate.py)
     try:
-        print("INFO: Attempting to create tables...")
-        models.Base.metadata.create_all(bind=engine)
-        print("INFO: Tables created successfully.")
+        migrate.ensure_database()
     except Exception as e:
-        print(f"CRITICAL ERROR: Failed to create tables. {e}")
+        print(f"CRITICAL ERROR: Failed to migrate database. {e}")
+
+    # Contadores del dashboard: se construyen una vez si la tabla está vacía
+    db = SessionLocal()
+    try:
+        stats.ensure_built(db)
+    except Exception as e:
+        print(f"WARNING: Could not build dashboard counters. {e}")
+    finally:
+        db.close()
+
+    # Archivado periódico de tareas/subtareas completadas (ARCHIVE_INTERVAL)
+    archive.start_worker()
+    # Trabajos diferidos de las escrituras (índice de búsqueda, ...): JOBS_WORKERS
+    jobs.start_workers()
+
+@app.on_event("shutdown")
+def shutdown_event():
+    archive.stop_worker()
+    jobs.stop_workers()
 
 # Manejador de errores para redirigir a login en lugar de mostrar JSON
 from fastapi.exceptions import HTTPException
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
+    # La API JSON responde errores en JSON (sin redirección a /login)
+    if request.url.path.startswith("/api/"):
+        return JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
     if exc.status_code == status.HTTP_401_UNAUTHORIZED:
         return RedirectResponse(url="/login", status_code=303)
     return HTMLResponse(content=f"<h1>Error {exc.status_code}</h1><p>{exc.detail}</p>", status_code=exc.status_code)
 
 # Configuración de rutas
 BASE_DIR = Path(__file__).resolve().parent
-TEMPLATES_DIR = BASE_DIR / "templates"
-STATIC_DIR = BASE_DIR / "static"
+STATIC_DIR = assets.STATIC_DIR
 
-# Crear directorio static si no existe (para evitar crash en local) y montar solo si existe
-if not STATIC_DIR.exists():
-    try:
-        STATIC_DIR.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        print(f"WARNING: Could not create static directory (Read-Only FS?): {e}")
+# Montar static solo si existe. No se crea: en serverless el FS es de solo
+# lectura y el intento fallido se pagaba en cada cold start.
+# Las URL con hash de contenido (static_url() en los templates) se cachean como
+# immutable; el resto se revalida (assets.py).
+if STATIC_DIR.is_dir():
+    app.mount(assets.STATIC_PREFIX, assets.StaticAssets(directory=STATIC_DIR), name="static")
+
+# El entorno de Jinja se crea en el primer render (templating.py), con
+# plantillas precompiladas si las hay. Al crearlo se instrumenta y se registran
+# task_card(), prospect_row(), subtask_card(): fragmentos cacheados por versión;
+# y static_url(): URL de estáticos con hash de contenido.
+templates = templating.LazyTemplates(setup=(metrics.instrument_templates, fragments.install, assets.install))
+
+# API JSON (/api/v1/...)
+app.include_router(api.router)
 
-if STATIC_DIR.exists():
-    app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
-else:
-    print("WARNING: Static directory not found, skipping mount.")
+def _get_user_by_username(db: Session, username: str):
+    return db.query(models.User).filter(models.User.username == username).first()
 
-templates = Jinja2Templates(directory=TEMPLATES_DIR)
+def _int_or_none(value):
+    # Los <select> de filtros envían "" cuando no hay selección
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
 
 # --- RUTAS DE AUTENTICACIÓN ---
 
@@ -66,8 +137,9 @@ async def login(
     password: str = Form(...), 
     db: Session = Depends(get_db)
 ):
-    user = db.query(models.User).filter(models.User.username == username).first()
-    if not user or not auth.verify_password(password, user.hashed_password):
+    # La consulta va al threadpool y el hash a su propio executor: el event loop queda libre
+    user = await run_in_threadpool(_get_user_by_username, db, username)
+    if not user or not await auth.verify_password(password, user.hashed_password):
         return templates.TemplateResponse("login.html", {"request": request, "error": "Credenciales inválidas"})
     
     access_token = auth.create_access_token(data={"sub": user.username})
@@ -90,17 +162,58 @@ async def register(
     password: str = Form(...),
     db: Session = Depends(get_db)
 ):
-    existing_user = db.query(models.User).filter(models.User.username == username).first()
+    existing_user = await run_in_threadpool(_get_user_by_username, db, username)
     if existing_user:
         return templates.TemplateResponse("register.html", {"request": request, "error": "El usuario ya existe"})
     
-    hashed_pwd = auth.get_password_hash(password)
+    hashed_pwd = await auth.get_password_hash(password)
     new_user = models.User(username=username, email=email, hashed_password=hashed_pwd)
     db.add(new_user)
-    db.commit()
+    await run_in_threadpool(db.commit)
     
     return RedirectResponse(url="/login", status_code=303)
 
+# Métricas en formato Prometheus. Si METRICS_TOKEN está definido se exige
+# "Authorization: Bearer <token>" (el scraper no tiene sesión).
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+@app.get("/metrics")
+async def metrics_endpoint(request: Request):
+    if METRICS_TOKEN and request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+        return Response(status_code=401)
+    pool = pool_stats()
+    cache = auth.user_cache_stats()
+    fragment_cache = fragments.stats()
+    live = events.broker.stats()
+    report_cache = analytics.cache_stats()
+    archived = archive.stats()
+    routing = replica_stats()
+    queue = await run_in_threadpool(jobs.stats)
+    gauges = {
+        "crm_db_pool_checked_out": ("Conexiones del pool en uso.", pool["checked_out"]),
+        "crm_db_pool_max_checked_out": ("Máximo de conexiones en uso a la vez.", pool["max_checked_out"]),
+        "crm_db_pool_connects": ("Conexiones abiertas por el pool desde el arranque.", pool["connects"]),
+        "crm_db_replicas_healthy": ("Réplicas de lectura sanas (de DATABASE_REPLICA_URLS).", routing["healthy"]),
+        "crm_db_replica_sessions": ("Sesiones de petición que leyeron de una réplica.", routing["replica_sessions"]),
+        "crm_db_primary_sessions": ("Sesiones de petición en la primaria con réplicas configuradas.", routing["primary_sessions"]),
+        "crm_db_replica_failures": ("Veces que una réplica pasó a caída.", routing["failures"]),
+        "crm_user_cache_hits": ("Aciertos de la caché de identidad.", cache["hits"]),
+        "crm_user_cache_misses": ("Fallos de la caché de identidad.", cache["misses"]),
+        "crm_fragment_cache_hits": ("Fragmentos servidos desde la caché.", fragment_cache["hits"]),
+        "crm_fragment_cache_misses": ("Fragmentos renderizados (no estaban o cambió la versión).", fragment_cache["misses"]),
+        "crm_events_subscribers": ("Conexiones abiertas a /events.", live["subscribers"]),
+        "crm_events_published": ("Eventos repartidos a este proceso desde el arranque.", live["published"]),
+        "crm_analytics_cache_hits": ("Reportes de analítica servidos desde la caché.", report_cache["hits"]),
+        "crm_analytics_cache_misses": ("Reportes de analítica calculados en la base.", report_cache["misses"]),
+        "crm_archived_tasks": ("Tareas archivadas por este proceso desde el arranque.", archived["tasks"]),
+        "crm_archived_subtasks": ("Subtareas archivadas por este proceso desde el arranque.", archived["subtasks"]),
+        "crm_jobs_queued": ("Trabajos en segundo plano esperando (vencidos, en la tabla jobs si es persistente).", queue["queued"]),
+        "crm_jobs_running": ("Trabajos en segundo plano en ejecución.", queue["running"]),
+        "crm_jobs_workers": ("Hilos de trabajos en segundo plano de este proceso.", queue["workers"]),
+        "crm_archive_errors": ("Bloques de archivado fallidos desde el arranque.", archived["errors"]),
+    }
+    return Response(metrics.registry.render(gauges), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.get("/logout")
 async def logout(response: Response):
     resp = RedirectResponse(url="/login", status_code=303)
@@ -108,18 +221,23 @@ async def logout(response: Response):
     return resp
 
 @app.get("/profile", response_class=HTMLResponse)
-async def user_profile(
+def user_profile(
     request: Request,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
     # Traer tareas asignadas
-    assigned_tasks = db.query(models.Task).filter(
-        models.Task.assignees.any(id=current_user.id)
-    ).all()
+    assigned_tasks = queries.assigned_tasks(db, current_user.id)
     
     # Traer Subtareas personales
-    my_subtasks = db.query(models.SubTask).filter(models.SubTask.user_id == current_user.id).all()
+    my_subtasks = queries.user_subtasks(db, current_user.id)
+
+    # El perfil muestra el email, que no forma parte de la identidad en caché
+    profile_user = db.get(models.User, current_user.id)
+    # Enlace del feed .ics (sin filtros) y el formulario para regenerarlo
+    feed_url = request.url_for("calendar_feed").include_query_params(
+        token=auth.create_feed_token(profile_user.username, profile_user.feed_token_version)
+    )
 
     return templates.TemplateResponse(
         "profile.html", 
@@ -127,19 +245,30 @@ async def user_profile(
             "request": request,
             "title": "Mi Perfil",
             "active_tab": "profile",
-            "user": current_user,
+            "user": profile_user,
             "tasks": assigned_tasks,
-            "subtasks": my_subtasks
+            "subtasks": my_subtasks,
+            "feed_url": str(feed_url)
         }
     )
 
+@app.post("/profile/feed/regenerate")
+def regenerate_feed(
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Invalida todos los enlaces .ics anteriores del usuario (p. ej. uno filtrado)
+    auth.regenerate_feed_token(db, current_user.id)
+    db.commit()
+    return RedirectResponse(url="/profile", status_code=303)
+
 # --- Subtareas Endpoints ---
 @app.post("/subtasks/create")
-async def create_subtask(
+def create_subtask(
     title: str = Form(...),
     task_id: int = Form(...),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
     new_sub = models.SubTask(
         title=title,
@@ -148,30 +277,34 @@ async def create_subtask(
         status="todo"
     )
     db.add(new_sub)
+    db.flush()
+    events.subtask_changed(db, new_sub, "created")
     db.commit()
     return RedirectResponse(url="/profile", status_code=303)
 
 @app.post("/subtasks/{sub_id}/update_status")
-async def update_subtask_status(
+def update_subtask_status(
     sub_id: int,
     status: str = Form(...),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
     sub = db.query(models.SubTask).filter(models.SubTask.id == sub_id, models.SubTask.user_id == current_user.id).first()
     if sub:
         sub.status = status
+        events.subtask_changed(db, sub)
         db.commit()
     return RedirectResponse(url="/profile", status_code=303)
 
 @app.post("/subtasks/{sub_id}/delete")
-async def delete_subtask(
+def delete_subtask(
     sub_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
     sub = db.query(models.SubTask).filter(models.SubTask.id == sub_id, models.SubTask.user_id == current_user.id).first()
     if sub:
+        events.subtask_changed(db, sub, "deleted")
         db.delete(sub)
         db.commit()
     return RedirectResponse(url="/profile", status_code=303)
@@ -181,33 +314,29 @@ async def update_profile(
     email: str = Form(None),
     password: str = Form(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
+    user = await run_in_threadpool(db.get, models.User, current_user.id)
     if email:
-        current_user.email = email
+        user.email = email
     if password:
-        current_user.hashed_password = auth.get_password_hash(password)
+        user.hashed_password = await auth.get_password_hash(password)
         
-    db.commit()
+    await run_in_threadpool(db.commit)
+    auth.invalidate_user(current_user.username)
     return RedirectResponse(url="/profile", status_code=303)
 
 
 # --- RUTAS PROTEGIDAS ---
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard(
+def dashboard(
     request: Request, 
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
-    total_prospects = db.query(models.Prospect).count()
-    contacted_prospects = db.query(models.Prospect).filter(models.Prospect.status == "Contactado").count()
-    
-    # Tareas asignadas AL USUARIO actual que están pendientes
-    my_pending_tasks = db.query(models.Task).filter(
-        models.Task.assignees.any(id=current_user.id),
-        models.Task.status != models.TaskStatus.DONE
-    ).count()
+    # Total, contactados y tareas pendientes del usuario en una sola lectura
+    dashboard_stats = stats.dashboard_stats(db, current_user.id)
     
     return templates.TemplateResponse(
         "dashboard.html", 
@@ -216,21 +345,27 @@ async def dashboard(
             "title": "Dashboard",
             "active_tab": "dashboard",
             "user": current_user,
-            "stats": {
-                "total": total_prospects,
-                "contacted": contacted_prospects,
-                "tasks": my_pending_tasks
-            }
+            "stats": dashboard_stats
         }
     )
 
 @app.get("/prospectos", response_class=HTMLResponse)
-async def prospects_list(
+def prospects_list(
     request: Request, 
+    after: str = None,
+    status: str = None,
+    industry: str = None,
+    creator_id: str = None,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
-    prospects = db.query(models.Prospect).all()
+    # Filtros y paginación por cursor se resuelven en SQL
+    filters = {
+        "status": status or None,
+        "industry": industry or None,
+        "creator_id": _int_or_none(creator_id),
+    }
+    prospects, next_cursor = queries.prospects_page(db, cursor=after, **filters)
     return templates.TemplateResponse(
         "prospects.html", 
         {
@@ -238,19 +373,23 @@ async def prospects_list(
             "title": "Prospectos",
             "active_tab": "prospects",
             "user": current_user,
-            "prospects": prospects
+            "prospects": prospects,
+            "next_cursor": next_cursor,
+            "filters": filters,
+            "creator": queries.user_choice(db, filters["creator_id"]),
+            "prospect_statuses": models.PROSPECT_STATUSES
         }
     )
 
 @app.post("/prospectos/nuevo")
-async def create_prospect(
+def create_prospect(
     name: str = Form(...),
     industry: str = Form(None),
     contact_name: str = Form(None),
     phone: str = Form(None),
     email: str = Form(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
     new_prospect = models.Prospect(
         name=name,
@@ -261,23 +400,28 @@ async def create_prospect(
         created_by_id=current_user.id # Asignamos creador
     )
     db.add(new_prospect)
+    db.flush()
+    stats.prospect_added(db, new_prospect.status)
+    analytics.record_status(db, new_prospect.id, None, new_prospect.status, current_user.id)
+    search.index_later(db, "prospect", [new_prospect.id])
+    events.prospect_changed(db, new_prospect, "created")
     db.commit()
     return RedirectResponse(url="/prospectos", status_code=303)
 
 @app.get("/prospectos/{prospect_id}", response_class=HTMLResponse)
-async def prospect_detail(
+def prospect_detail(
     request: Request, 
     prospect_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
-    prospect = db.query(models.Prospect).filter(models.Prospect.id == prospect_id).first()
+    prospect = queries.prospect_detail(db, prospect_id)
     if not prospect:
         # Podríamos retornar un 404 custom
         return RedirectResponse(url="/prospectos")
     
-    # Necesitamos usuarios para el modal de nueva tarea
-    users = db.query(models.User).all()
+    # Usuarios para el modal de nueva tarea (acotados, ver queries.assignee_choices)
+    users = queries.assignee_choices(db)
         
     return templates.TemplateResponse(
         "prospect_detail.html", 
@@ -292,7 +436,7 @@ async def prospect_detail(
     )
 
 @app.post("/prospectos/{prospect_id}/update")
-async def update_prospect(
+def update_prospect(
     prospect_id: int,
     name: str = Form(...),
     industry: str = Form(None),
@@ -302,10 +446,12 @@ async def update_prospect(
     email: str = Form(None),
     address: str = Form(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
     prospect = db.query(models.Prospect).filter(models.Prospect.id == prospect_id).first()
     if prospect:
+        stats.prospect_status_changed(db, prospect.status, status)
+        analytics.record_status(db, prospect.id, prospect.status, status, current_user.id)
         prospect.name = name
         prospect.industry = industry
         prospect.status = status
@@ -313,33 +459,62 @@ async def update_prospect(
         prospect.phone = phone
         prospect.email = email
         prospect.address = address
+        search.index_later(db, "prospect", [prospect.id])
+        events.prospect_changed(db, prospect)
         db.commit()
     
     return RedirectResponse(url=f"/prospectos/{prospect_id}", status_code=303)
 
 @app.post("/prospectos/{prospect_id}/delete")
-async def delete_prospect(
+def delete_prospect(
     prospect_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
-    prospect = db.query(models.Prospect).filter(models.Prospect.id == prospect_id).first()
-    if prospect:
-        db.delete(prospect)
+    # Notas, tareas e historial se borran en la base (ON DELETE CASCADE)
+    if bulk.delete_prospects(db, [prospect_id]):
         db.commit()
     return RedirectResponse(url="/prospectos", status_code=303)
 
 @app.get("/planning", response_class=HTMLResponse)
-async def planning_view(
+def planning_view(
     request: Request,
+    todo_after: str = None,
+    in_progress_after: str = None,
+    done_after: str = None,
+    prospect_id: str = None,
+    assignee_id: str = None,
+    industry: str = None,
+    creator_id: str = None,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
-    # Obtener tareas agrupadas o filtrarlas en frontend
-    # Para simplicidad, traemos todas y el template filtra, o filtramos aquí
-    tasks = db.query(models.Task).all()
-    prospects = db.query(models.Prospect).all() # Para el select de crear tarea
-    users = db.query(models.User).all() # Para asignar
+    # Cada columna del kanban se pagina por separado (cursor propio por estado)
+    filters = {
+        "prospect_id": _int_or_none(prospect_id),
+        "assignee_id": _int_or_none(assignee_id),
+        "industry": industry or None,
+        "creator_id": _int_or_none(creator_id),
+    }
+    cursors = {
+        models.TaskStatus.TODO.value: todo_after,
+        models.TaskStatus.IN_PROGRESS.value: in_progress_after,
+        models.TaskStatus.DONE.value: done_after,
+    }
+    columns = {}
+    for task_status, cursor in cursors.items():
+        tasks, next_cursor = queries.task_column(db, task_status, cursor=cursor, **filters)
+        columns[task_status] = {"tasks": tasks, "next_cursor": next_cursor}
+
+    # Los <select> de filtro traen solo la opción elegida; el resto se busca
+    # por nombre (/api/v1/.../choices). Asignados de la nueva tarea: acotados
+    users = queries.assignee_choices(db)
+    # El stream de eventos filtra en el servidor por prospecto y asignado (solo
+    # el propio usuario, ver /events); con otro asignado el tablero sigue los
+    # cambios de sus tarjetas pero no agrega nuevas (data-live-new="0")
+    live_filters = {key: filters[key] for key in ("prospect_id", "assignee_id") if filters[key]}
+    if live_filters.get("assignee_id") not in (None, current_user.id):
+        del live_filters["assignee_id"]
     
     return templates.TemplateResponse(
         "planning.html", 
@@ -348,21 +523,87 @@ async def planning_view(
             "title": "Planificación",
             "active_tab": "planning",
             "user": current_user,
-            "tasks": tasks,
-            "prospects": prospects,
+            "columns": columns,
+            "filters": filters,
+            "live_events_url": "/events" + (f"?{urlencode(live_filters)}" if live_filters else ""),
+            "selected_prospect": queries.prospect_choice(db, filters["prospect_id"]),
+            "assignee": queries.user_choice(db, filters["assignee_id"]),
+            "creator": queries.user_choice(db, filters["creator_id"]),
             "users": users,
             "TaskStatus": models.TaskStatus
         }
     )
 
+@app.get("/planning/archivo", response_class=HTMLResponse)
+def archive_view(
+    request: Request,
+    after: str = None,
+    prospect_id: str = None,
+    assignee_id: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Tareas completadas que salieron del tablero (archive.py), paginadas
+    filters = {
+        "prospect_id": _int_or_none(prospect_id),
+        "assignee_id": _int_or_none(assignee_id),
+    }
+    tasks, next_cursor = queries.archived_tasks_page(db, cursor=after, **filters)
+    return templates.TemplateResponse(
+        "archive.html",
+        {
+            "request": request,
+            "title": "Archivo",
+            "active_tab": "planning",
+            "user": current_user,
+            "tasks": tasks,
+            "column": {"next_cursor": next_cursor},
+            "filters": filters,
+            "archive_after_days": archive.ARCHIVE_AFTER_DAYS,
+            "selected_prospect": queries.prospect_choice(db, filters["prospect_id"]),
+            "assignee": queries.user_choice(db, filters["assignee_id"])
+        }
+    )
+
+MONTH_NAMES = ["enero", "febrero", "marzo", "abril", "mayo", "junio", "julio",
+               "agosto", "septiembre", "octubre", "noviembre", "diciembre"]
+
 @app.get("/calendar", response_class=HTMLResponse)
-async def calendar_view(
+def calendar_view(
     request: Request,
+    view: str = "month",
+    date: str = None,
+    assignee_id: str = None,
+    prospect_id: str = None,
+    status: str = None,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
-    # Traer tareas que tengan fecha de fin para mostrarlas
-    tasks = db.query(models.Task).filter(models.Task.end_date != None).all()
+    # Solo la ventana visible (mes o semana), ordenada por SQL
+    if view not in queries.CALENDAR_VIEWS:
+        view = "month"
+    try:
+        anchor = datetime.strptime(date, "%Y-%m-%d").date() if date else datetime.utcnow().date()
+    except ValueError:
+        anchor = datetime.utcnow().date()
+    start, end = queries.calendar_window(view, anchor)
+    filters = {
+        "assignee_id": _int_or_none(assignee_id),
+        "prospect_id": _int_or_none(prospect_id),
+    }
+    tasks = queries.calendar_range(db, start, end, status=status or None, **filters)
+
+    if view == "week":
+        label = f"Semana del {start.day} de {MONTH_NAMES[start.month - 1]} de {start.year}"
+    else:
+        label = f"{MONTH_NAMES[start.month - 1].capitalize()} {start.year}"
+
+    # URL del feed .ics con los mismos filtros (para suscribirse desde un cliente de calendario)
+    feed_params = {k: v for k, v in {**filters, "status": status}.items() if v}
+    feed_url = request.url_for("calendar_feed").include_query_params(
+        token=auth.feed_token_for(db, current_user.id), **feed_params
+    )
+
     return templates.TemplateResponse(
         "calendar.html", 
         {
@@ -370,12 +611,87 @@ async def calendar_view(
             "title": "Calendario",
             "active_tab": "calendar",
             "user": current_user,
-            "tasks_with_dates": tasks
+            "tasks_with_dates": tasks,
+            "view": view,
+            "label": label,
+            "prev_date": (start - timedelta(days=7 if view == "week" else 1)).date().isoformat(),
+            "next_date": end.date().isoformat(),
+            "filters": {**filters, "status": status or None},
+            "assignee": queries.user_choice(db, filters["assignee_id"]),
+            "selected_prospect": queries.prospect_choice(db, filters["prospect_id"]),
+            "feed_url": str(feed_url)
+        }
+    )
+
+@app.get("/buscar", response_class=HTMLResponse)
+def search_view(
+    request: Request,
+    q: str = "",
+    page: int = 1,
+    kind: str = None,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    results, has_more = search.search(db, q, page=page, kind=kind or None)
+    return templates.TemplateResponse(
+        "search.html",
+        {
+            "request": request,
+            "title": "Buscar",
+            "active_tab": "search",
+            "user": current_user,
+            "q": q,
+            "kind": kind,
+            "page": max(page, 1),
+            "results": results,
+            "has_more": has_more
+        }
+    )
+
+@app.get("/events")
+async def event_stream(
+    request: Request,
+    prospect_id: int = None,
+    assignee_id: int = None,
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Server-Sent Events con los cambios de tareas, subtareas y prospectos.
+    # Filtros: prospect_id (página de un prospecto) y assignee_id (tablero filtrado).
+    # assignee_id solo puede ser el propio usuario ("mis tareas"): no se puede
+    # seguir en vivo lo asignado a otro.
+    if assignee_id is not None and assignee_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Solo puedes seguir tus propias tareas")
+    subscription = events.broker.subscribe(user_id=assignee_id, prospect_id=prospect_id)
+    return StreamingResponse(
+        events.stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/tasks/{task_id}/modal", response_class=HTMLResponse)
+def task_modal(
+    request: Request,
+    task_id: int,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Fragmento con el detalle/edición de una tarea. Las tarjetas del tablero
+    # ya no incluyen el modal completo: se pide aquí al abrirlas.
+    task = queries.task_detail(db, task_id)
+    if not task:
+        return HTMLResponse(content="", status_code=404)
+    users = queries.assignee_choices(db, task.assignees) # Para el select de asignados
+    return templates.TemplateResponse(
+        "components/task_modal.html",
+        {
+            "request": request,
+            "task": task,
+            "users": users
         }
     )
 
 @app.post("/tasks/create")
-async def create_task(
+def create_task(
     request: Request,
     title: str = Form(...),
     description: str = Form(None),
@@ -384,7 +700,7 @@ async def create_task(
     end_date: str = Form(None),
     assignee_ids: list[int] = Form([]),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
     # Convertir fechas si existen
     start_dt = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
@@ -402,8 +718,14 @@ async def create_task(
     if assignee_ids:
         assignees = db.query(models.User).filter(models.User.id.in_(assignee_ids)).all()
         new_task.assignees = assignees
+        stats.task_assignees_changed(db, new_task.status, added_ids=[u.id for u in assignees])
         
+    # Las tareas nuevas van al final de la columna "Por hacer"
+    new_task.position = kanban.next_position(db, new_task.status)
     db.add(new_task)
+    db.flush()
+    search.index_later(db, "task", [new_task.id])
+    events.task_changed(db, new_task, "created")
     db.commit()
     # Redirigir a la página desde donde se llamó (referer) o default a planning
     referer = request.headers.get("referer")
@@ -412,35 +734,72 @@ async def create_task(
     return RedirectResponse(url="/planning", status_code=303)
 
 @app.post("/tasks/{task_id}/delete")
-async def delete_task(
+def delete_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
-    task = db.query(models.Task).filter(models.Task.id == task_id).first()
-    if task:
-        db.delete(task)
+    # Asignaciones y subtareas se borran en la base (ON DELETE CASCADE)
+    if bulk.delete_tasks(db, [task_id]):
         db.commit()
     return RedirectResponse(url="/planning", status_code=303)
 
 @app.post("/tasks/{task_id}/update_status")
-async def update_task_status(
+def update_task_status(
     request: Request,
     task_id: int,
     status: str = Form(...),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
-    task = db.query(models.Task).filter(models.Task.id == task_id).first()
-    if task:
-        task.status = status
-        db.commit()
+    if status in {s.value for s in models.TaskStatus}:
+        try:
+            kanban.apply_batch(db, [schemas.TaskOperation(task_id=task_id, status=status)])
+            db.commit()
+        except kanban.BatchError:
+            db.rollback()
     # Redirigir al referer para que sirva desde planning y prospect detail
     referer = request.headers.get("referer") or "/planning"
     return RedirectResponse(url=referer, status_code=303)
 
+@app.post("/tasks/batch")
+def update_tasks_batch(
+    batch: schemas.TaskBatch,
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Varios movimientos/reordenamientos/cambios de asignados del tablero en una
+    # sola petición y una sola transacción. Devuelve solo las tarjetas cambiadas,
+    # ya renderizadas, para que el cliente las reemplace sin recargar la página.
+    try:
+        changed_ids = kanban.apply_batch(db, batch.operations)
+        db.commit()
+    except kanban.BatchError as exc:
+        db.rollback()
+        return JSONResponse({"detail": str(exc)}, status_code=400)
+    return _task_cards_response(db, changed_ids)
+
+@app.get("/tasks/cards")
+def task_cards(
+    ids: list[int] = Query([]),
+    db: Session = Depends(get_db),
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
+):
+    # Tarjetas ya renderizadas de unas tareas concretas: el tablero en vivo las
+    # pide al recibir eventos de /events en vez de recargar la página completa
+    return _task_cards_response(db, ids[:schemas.MAX_BATCH_OPERATIONS])
+
+def _task_cards_response(db: Session, task_ids):
+    task_card = templates.env.globals["task_card"]
+    return JSONResponse({
+        "tasks": [
+            {"id": task.id, "status": task.status, "position": task.position, "html": str(task_card(task))}
+            for task in queries.tasks_by_id(db, task_ids)
+        ]
+    })
+
 @app.post("/tasks/{task_id}/update")
-async def update_task_details(
+def update_task_details(
     request: Request,
     task_id: int,
     title: str = Form(...),
@@ -449,7 +808,7 @@ async def update_task_details(
     end_date: str = Form(None),
     assignee_ids: list[int] = Form([]),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(auth.get_current_active_user)
+    current_user: auth.CurrentUser = Depends(auth.get_current_active_user)
 ):
     task = db.query(models.Task).filter(models.Task.id == task_id).first()
     if task:
@@ -463,13 +822,15 @@ async def update_task_details(
         # En HTML forms, un select multiple vacío no envía nada. 
         # Asumiremos que si la clave existe (incluso vacía) en el form data es intencional, 
         # pero FastAPI Form([]) maneja esto. 
-        # Para simplificar: Siempre reemplazamos con lo que llegue.
-        if assignee_ids:
-             new_assignees = db.query(models.User).filter(models.User.id.in_(assignee_ids)).all()
-             task.assignees = new_assignees
-        else:
-             # Si llega vacío, limpiamos (desasignar a todos)
-             task.assignees = []
+        # Siempre dejamos exactamente lo que llegue, pero aplicando solo la
+        # diferencia (kanban.apply_batch) en vez de reemplazar la colección.
+        new_ids = {u for (u,) in db.query(models.User.id).filter(models.User.id.in_(assignee_ids))} if assignee_ids else set()
+        old_ids = {u.id for u in task.assignees}
+        kanban.apply_batch(db, [schemas.TaskOperation(
+            task_id=task.id, add_assignees=sorted(new_ids - old_ids), remove_assignees=sorted(old_ids - new_ids)
+        )])
+        # Los campos de texto siempre cambian la versión (onupdate); los asignados ya la marcan en apply_batch
+        search.index_later(db, "task", [task.id])
 
         db.commit()
         
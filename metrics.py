@@ -0,0 +1,268 @@
+import contextvars
+import os
+import threading
+import time
+
+from sqlalchemy import event
+
+# Instrumentación por petición:
+# - nº de sentencias SQL, tiempo total en la base y la sentencia más lenta
+#   (eventos de SQLAlchemy sobre el engine),
+# - tiempo de render de Jinja (clase de Template instrumentada),
+# - tiempo total y tamaño de la respuesta (middleware ASGI).
+# Se exponen como cabecera Server-Timing, en /metrics (formato Prometheus)
+# y en un log de peticiones lentas (umbral SLOW_REQUEST_MS).
+
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+SERVER_TIMING = os.getenv("SERVER_TIMING", "1") == "1"
+
+# Buckets del histograma de duración (segundos)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Rutas que no se registran (el propio scrape, los estáticos y el stream de
+# eventos, que dura lo que la conexión y falsearía latencias y log de lentas)
+SKIP_PREFIXES = ("/metrics", "/static", "/events")
+
+
+class RequestMetrics:
+    __slots__ = ("sql_count", "sql_time", "slowest_sql", "slowest_sql_time", "render_time", "render_depth")
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.slowest_sql = None
+        self.slowest_sql_time = 0.0
+        self.render_time = 0.0
+        self.render_depth = 0
+
+
+# Las rutas "def" corren en el threadpool con una copia del contexto: el objeto
+# es el mismo, así que los eventos de SQL lo actualizan desde cualquier hilo.
+_current = contextvars.ContextVar("request_metrics", default=None)
+
+
+def current() -> RequestMetrics:
+    return _current.get()
+
+
+# --- SQL ---
+
+def instrument_engine(engine):
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        metrics = _current.get()
+        if metrics is None:
+            return
+        metrics.sql_count += 1
+        metrics.sql_time += elapsed
+        if elapsed >= metrics.slowest_sql_time:
+            metrics.slowest_sql_time = elapsed
+            metrics.slowest_sql = statement
+
+
+# --- Templates ---
+
+_timed_template_class = None
+
+
+def _timed_template():
+    # La subclase se crea al instrumentar el entorno: así importar este módulo
+    # no importa jinja2 (el entorno de templates se crea en el primer render)
+    global _timed_template_class
+    if _timed_template_class is not None:
+        return _timed_template_class
+    from jinja2 import Template
+
+    class TimedTemplate(Template):
+        # Solo cuenta el render más externo: los include/extends se ejecutan dentro,
+        # y los fragmentos renderizados desde un global (fragments.py) llaman a
+        # render() anidado sin que su tiempo se sume dos veces.
+        def render(self, *args, **kwargs):
+            metrics = _current.get()
+            if metrics is None:
+                return super().render(*args, **kwargs)
+            metrics.render_depth += 1
+            start = time.perf_counter()
+            try:
+                return super().render(*args, **kwargs)
+            finally:
+                metrics.render_depth -= 1
+                if metrics.render_depth == 0:
+                    metrics.render_time += time.perf_counter() - start
+
+    _timed_template_class = TimedTemplate
+    return TimedTemplate
+
+
+def instrument_templates(env):
+    env.template_class = _timed_template()
+
+
+# --- Registro (formato de exposición de Prometheus) ---
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}       # (method, route, status) -> nº
+        self.durations = {}      # (method, route) -> [buckets..., suma, nº]
+        self.sql_statements = {}  # route -> nº
+        self.sql_seconds = {}    # route -> segundos
+        self.render_seconds = {}  # route -> segundos
+        self.response_bytes = {}  # route -> bytes
+        self.slow_requests = 0
+        self.jobs = {}           # (job, resultado) -> nº
+        self.job_waits = {}      # job -> [buckets..., suma, nº] (en cola hasta empezar)
+        self.job_durations = {}  # job -> [buckets..., suma, nº] (ejecución)
+
+    def observe(self, method, route, status, duration, metrics: RequestMetrics, size):
+        with self._lock:
+            key = (method, route, str(status))
+            self.requests[key] = self.requests.get(key, 0) + 1
+            _histogram_add(self.durations, (method, route), duration)
+            self.sql_statements[route] = self.sql_statements.get(route, 0) + metrics.sql_count
+            self.sql_seconds[route] = self.sql_seconds.get(route, 0.0) + metrics.sql_time
+            self.render_seconds[route] = self.render_seconds.get(route, 0.0) + metrics.render_time
+            self.response_bytes[route] = self.response_bytes.get(route, 0) + size
+            if duration * 1000 >= SLOW_REQUEST_MS:
+                self.slow_requests += 1
+
+    def observe_job(self, name, outcome, wait, duration):
+        """outcome: done / retry / failed (jobs.py)."""
+        with self._lock:
+            key = (name, outcome)
+            self.jobs[key] = self.jobs.get(key, 0) + 1
+            _histogram_add(self.job_waits, name, wait)
+            _histogram_add(self.job_durations, name, duration)
+
+    def render(self, gauges: dict = None) -> str:
+        """gauges: {nombre: (ayuda, valor)} leídos en el momento del scrape."""
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histograms(name, help_text, values):
+            header(name, "histogram", help_text)
+            for labels, histogram in sorted(values.items()):
+                for bound, count in zip(DURATION_BUCKETS, histogram):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram[-1]}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram[-2]:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {histogram[-1]}")
+
+        with self._lock:
+            header("crm_http_requests_total", "counter", "Peticiones HTTP atendidas.")
+            for (method, route, status), value in sorted(self.requests.items()):
+                lines.append(f'crm_http_requests_total{{method="{method}",route="{route}",status="{status}"}} {value}')
+
+            histograms("crm_http_request_duration_seconds", "Duración de las peticiones HTTP.",
+                       {f'method="{method}",route="{route}"': h for (method, route), h in self.durations.items()})
+
+            for name, help_text, values in (
+                ("crm_db_statements_total", "Sentencias SQL ejecutadas por ruta.", self.sql_statements),
+                ("crm_db_seconds_total", "Tiempo en la base de datos por ruta.", self.sql_seconds),
+                ("crm_template_render_seconds_total", "Tiempo de render de templates por ruta.", self.render_seconds),
+                ("crm_http_response_bytes_total", "Bytes de respuesta enviados por ruta.", self.response_bytes),
+            ):
+                header(name, "counter", help_text)
+                for route, value in sorted(values.items()):
+                    lines.append(f'{name}{{route="{route}"}} {value:.6f}' if isinstance(value, float)
+                                 else f'{name}{{route="{route}"}} {value}')
+
+            header("crm_slow_requests_total", "counter", f"Peticiones más lentas que {SLOW_REQUEST_MS:g} ms.")
+            lines.append(f"crm_slow_requests_total {self.slow_requests}")
+
+            header("crm_jobs_total", "counter", "Trabajos en segundo plano ejecutados, por resultado.")
+            for (name, outcome), value in sorted(self.jobs.items()):
+                lines.append(f'crm_jobs_total{{job="{name}",outcome="{outcome}"}} {value}')
+            histograms("crm_job_wait_seconds", "Espera en la cola hasta empezar cada trabajo.",
+                       {f'job="{name}"': h for name, h in self.job_waits.items()})
+            histograms("crm_job_duration_seconds", "Duración de cada ejecución de un trabajo.",
+                       {f'job="{name}"': h for name, h in self.job_durations.items()})
+
+        for name, (help_text, value) in (gauges or {}).items():
+            header(name, "gauge", help_text)
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_add(histograms: dict, key, value: float):
+    histogram = histograms.setdefault(key, [0] * (len(DURATION_BUCKETS) + 2))
+    for i, bound in enumerate(DURATION_BUCKETS):
+        if value <= bound:
+            histogram[i] += 1
+    histogram[-2] += value
+    histogram[-1] += 1
+
+
+registry = Registry()
+
+
+def _route_label(scope) -> str:
+    # Plantilla de la ruta (/tasks/{task_id}) para no crear una serie por id
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    return "unmatched"
+
+
+def server_timing(metrics: RequestMetrics, elapsed: float) -> str:
+    return (
+        f'db;dur={metrics.sql_time * 1000:.1f};desc="{metrics.sql_count} queries", '
+        f"tpl;dur={metrics.render_time * 1000:.1f}, "
+        f"app;dur={elapsed * 1000:.1f}"
+    )
+
+
+def _log_slow(method, path, status, duration, metrics: RequestMetrics, size):
+    slowest = " ".join((metrics.slowest_sql or "-").split())[:200]
+    print(
+        f"WARNING: Slow request {method} {path} -> {status} in {duration * 1000:.0f} ms "
+        f"(sql: {metrics.sql_count} stmts / {metrics.sql_time * 1000:.0f} ms, "
+        f"render: {metrics.render_time * 1000:.0f} ms, {size} bytes). "
+        f"Slowest SQL ({metrics.slowest_sql_time * 1000:.0f} ms): {slowest}"
+    )
+
+
+class MetricsMiddleware:
+    """Middleware ASGI: mide cada petición HTTP y añade la cabecera Server-Timing."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        response = {"status": 500, "size": 0}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                if SERVER_TIMING:
+                    # En respuestas en streaming refleja el trabajo hecho hasta empezar a enviar
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", server_timing(metrics, time.perf_counter() - start).encode()))
+                    message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                response["size"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            _current.reset(token)
+            registry.observe(scope["method"], _route_label(scope), response["status"], duration, metrics, response["size"])
+            if duration * 1000 >= SLOW_REQUEST_MS:
+                _log_slow(scope["method"], scope["path"], response["status"], duration, metrics, response["size"])
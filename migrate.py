@@ -0,0 +1,132 @@
+import os
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlalchemy import exc, inspect, text
+
+from database import engine
+
+# Migraciones de esquema con Alembic (carpeta migrations/).
+# Uso: python migrate.py                      -> upgrade a la última revisión
+#      python migrate.py upgrade <revision>
+#      python migrate.py downgrade <revision>
+#
+# Alembic se importa solo cuando hay algo que migrar: en el arranque basta con
+# comparar la revisión guardada en alembic_version con la última del repo.
+
+BASE_DIR = Path(__file__).resolve().parent
+VERSIONS_DIR = BASE_DIR / "migrations" / "versions"
+
+# Revisión que corresponde al esquema que creaba create_all antes de Alembic
+BASELINE_REVISION = "0001_initial"
+
+# Qué hace el arranque de la app con el esquema:
+#   "auto"   -> migra solo si la revisión guardada no es la última (por defecto)
+#   "always" -> corre siempre el upgrade de Alembic
+#   "never"  -> no toca el esquema (se migra en el deploy: python migrate.py)
+MIGRATE_ON_STARTUP = os.getenv("MIGRATE_ON_STARTUP", "auto")
+
+_REVISION_RE = re.compile(r'^(down_revision|revision)\s*=\s*["\']?([\w.-]+|None)["\']?\s*$', re.MULTILINE)
+
+
+def alembic_config():
+    from alembic.config import Config
+
+    cfg = Config(str(BASE_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(BASE_DIR / "migrations"))
+    return cfg
+
+
+@contextmanager
+def migration_connection():
+    """Conexión en transacción para migrar.
+
+    En SQLite el modo batch recrea tablas (CREATE + copia + DROP + RENAME): con
+    las FK activas el DROP borraría en cascada las filas hijas. El pragma solo
+    se puede cambiar fuera de una transacción, y se restaura antes de devolver
+    la conexión al pool.
+    """
+    with engine.connect() as connection:
+        sqlite = connection.dialect.name == "sqlite"
+        if sqlite:
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            connection.commit()
+        try:
+            with connection.begin():
+                yield connection
+        finally:
+            if sqlite:
+                connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+                connection.commit()
+
+
+def upgrade_database(revision: str = "head"):
+    from alembic import command
+
+    cfg = alembic_config()
+    with migration_connection() as connection:
+        cfg.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+        # Base creada con create_all (sin tabla alembic_version): la marcamos
+        # como baseline para que solo se apliquen las migraciones nuevas.
+        if "alembic_version" not in tables and "users" in tables:
+            print(f"INFO: Existing schema without migration stamp, stamping {BASELINE_REVISION}.")
+            command.stamp(cfg, BASELINE_REVISION)
+        command.upgrade(cfg, revision)
+
+
+def head_revision():
+    """Última revisión según los archivos de migrations/versions, sin cargar Alembic.
+
+    Devuelve None si no hay una única cabeza (ramas, merges): en ese caso el
+    arranque no se arriesga y deja decidir a Alembic.
+    """
+    revisions, parents = set(), set()
+    for path in VERSIONS_DIR.glob("*.py"):
+        values = dict((key, value) for key, value in _REVISION_RE.findall(path.read_text(encoding="utf-8")))
+        if "revision" not in values or "down_revision" not in values:
+            return None
+        revisions.add(values["revision"])
+        parents.add(values["down_revision"])
+    heads = revisions - parents
+    return heads.pop() if len(heads) == 1 else None
+
+
+def current_revision():
+    try:
+        with engine.connect() as connection:
+            rows = connection.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    except exc.DBAPIError:
+        return None  # sin tabla alembic_version: base nueva o previa a Alembic
+    return rows[0] if len(rows) == 1 else None
+
+
+def ensure_database():
+    """Migración del arranque según MIGRATE_ON_STARTUP."""
+    if MIGRATE_ON_STARTUP == "never":
+        print("INFO: MIGRATE_ON_STARTUP=never, skipping schema check.")
+        return
+    if MIGRATE_ON_STARTUP != "always":
+        head = head_revision()
+        if head is not None and current_revision() == head:
+            print(f"INFO: Database schema is current ({head}), skipping migrations.")
+            return
+    print("INFO: Applying database migrations...")
+    upgrade_database()
+    print("INFO: Database schema is up to date.")
+
+
+if __name__ == "__main__":
+    action = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    target = sys.argv[2] if len(sys.argv) > 2 else "head"
+    if action == "upgrade":
+        upgrade_database(target)
+    elif action == "downgrade":
+        from alembic import command
+
+        command.downgrade(alembic_config(), target)
+    else:
+        print("Uso: python migrate.py [upgrade|downgrade] [revision]")
+        sys.exit(1)
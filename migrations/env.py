@@ -0,0 +1,63 @@
+from logging.config import fileConfig
+
+from alembic import context
+
+import database
+import models
+
+config = context.config
+
+if config.config_file_name is not None:
+    # disable_existing_loggers=False: no silenciar los logs de uvicorn al migrar en el startup
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = models.Base.metadata
+
+
+def _include_name(name, type_, parent_names):
+    # El índice de búsqueda (FTS5 / tsvector) se gestiona a mano en la migración 0005
+    # y no está en models: que autogenerate no lo proponga como tabla a borrar.
+    if type_ == "table":
+        return not name.startswith("search_documents")
+    return True
+
+
+def _configure(**kwargs):
+    # SQLite no soporta ALTER de constraints: usamos el modo "batch" (recrear tabla)
+    context.configure(
+        target_metadata=target_metadata,
+        render_as_batch=database.DATABASE_URL.startswith("sqlite"),
+        compare_type=True,
+        include_name=_include_name,
+        **kwargs,
+    )
+
+
+def run_migrations_offline():
+    _configure(url=database.DATABASE_URL, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    # migrate.py puede pasar una conexión ya abierta; si no, una del engine de la app
+    # (en SQLite con las FK desactivadas mientras dura la migración)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    import migrate
+
+    with migrate.migration_connection() as connection:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,31 @@
+"""Tabla de contadores del dashboard (stats.py)
+
+Revision ID: 0002_stat_counters
+Revises: 0001_initial
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002_stat_counters"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Bases creadas antes de usar Alembic ya pueden tenerla (via create_all)
+    if sa.inspect(op.get_bind()).has_table("stat_counters"):
+        return
+    op.create_table(
+        "stat_counters",
+        sa.Column("key", sa.String(), primary_key=True),
+        sa.Column("value", sa.Integer(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("stat_counters")
@@ -0,0 +1,73 @@
+"""Índices para las consultas calientes y PK compuesta en task_assignments
+
+Revision ID: 0003_hot_path_indexes
+Revises: 0002_stat_counters
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003_hot_path_indexes"
+down_revision = "0002_stat_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # /prospectos: filtro opcional + orden (created_at, id) descendente
+    op.create_index("ix_prospects_created_at_id", "prospects", ["created_at", "id"])
+    op.create_index("ix_prospects_status_created_at", "prospects", ["status", "created_at", "id"])
+    op.create_index("ix_prospects_industry_created_at", "prospects", ["industry", "created_at", "id"])
+    op.create_index("ix_prospects_creator_created_at", "prospects", ["created_by_id", "created_at", "id"])
+
+    # Kanban (estado + cursor por id), calendario (rango de fechas) y detalle de prospecto
+    op.create_index("ix_tasks_status_id", "tasks", ["status", "id"])
+    op.create_index("ix_tasks_end_date_status", "tasks", ["end_date", "status"])
+    op.create_index("ix_tasks_prospect_status", "tasks", ["prospect_id", "status"])
+
+    # Perfil (subtareas del usuario) y notas de un prospecto
+    op.create_index("ix_subtasks_user_status", "subtasks", ["user_id", "status"])
+    op.create_index("ix_subtasks_task_id", "subtasks", ["task_id"])
+    op.create_index("ix_notes_prospect_id", "notes", ["prospect_id"])
+
+    # task_assignments: quitar filas nulas/duplicadas antes de la PK compuesta
+    bind = op.get_bind()
+    op.execute("DELETE FROM task_assignments WHERE user_id IS NULL OR task_id IS NULL")
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            "DELETE FROM task_assignments a USING task_assignments b "
+            "WHERE a.ctid > b.ctid AND a.task_id = b.task_id AND a.user_id = b.user_id"
+        )
+    else:
+        op.execute(
+            "DELETE FROM task_assignments WHERE rowid NOT IN "
+            "(SELECT MIN(rowid) FROM task_assignments GROUP BY task_id, user_id)"
+        )
+    with op.batch_alter_table("task_assignments") as batch_op:
+        batch_op.alter_column("user_id", existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column("task_id", existing_type=sa.Integer(), nullable=False)
+        batch_op.create_primary_key("pk_task_assignments", ["task_id", "user_id"])
+    # La PK cubre "tareas de X"; este índice cubre "tareas asignadas a un usuario"
+    op.create_index("ix_task_assignments_user_task", "task_assignments", ["user_id", "task_id"])
+
+
+def downgrade():
+    op.drop_index("ix_task_assignments_user_task", table_name="task_assignments")
+    with op.batch_alter_table("task_assignments") as batch_op:
+        batch_op.drop_constraint("pk_task_assignments", type_="primary")
+        batch_op.alter_column("user_id", existing_type=sa.Integer(), nullable=True)
+        batch_op.alter_column("task_id", existing_type=sa.Integer(), nullable=True)
+
+    op.drop_index("ix_notes_prospect_id", table_name="notes")
+    op.drop_index("ix_subtasks_task_id", table_name="subtasks")
+    op.drop_index("ix_subtasks_user_status", table_name="subtasks")
+    op.drop_index("ix_tasks_prospect_status", table_name="tasks")
+    op.drop_index("ix_tasks_end_date_status", table_name="tasks")
+    op.drop_index("ix_tasks_status_id", table_name="tasks")
+    op.drop_index("ix_prospects_creator_created_at", table_name="prospects")
+    op.drop_index("ix_prospects_industry_created_at", table_name="prospects")
+    op.drop_index("ix_prospects_status_created_at", table_name="prospects")
+    op.drop_index("ix_prospects_created_at_id", table_name="prospects")
@@ -0,0 +1,30 @@
+"""Columna updated_at en prospects y tasks (versiones para ETag)
+
+Revision ID: 0004_updated_at
+Revises: 0003_hot_path_indexes
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004_updated_at"
+down_revision = "0003_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("prospects", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.add_column("tasks", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.execute("UPDATE prospects SET updated_at = created_at")
+    op.execute("UPDATE tasks SET updated_at = created_at")
+
+
+def downgrade():
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("updated_at")
+    with op.batch_alter_table("prospects") as batch_op:
+        batch_op.drop_column("updated_at")
@@ -0,0 +1,53 @@
+"""Índice de búsqueda de texto completo (FTS5 en SQLite, tsvector + GIN en Postgres)
+
+Revision ID: 0005_search_index
+Revises: 0004_updated_at
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0005_search_index"
+down_revision = "0004_updated_at"
+branch_labels = None
+depends_on = None
+
+# doc_id = id * 4 + código de tipo (ver search.doc_id)
+BACKFILL = (
+    "SELECT id * 4 + 1, 'prospect', id, id, COALESCE(name, ''), "
+    "TRIM(COALESCE(industry, '') || ' ' || COALESCE(contact_name, '') || ' ' || COALESCE(email, '') || ' ' "
+    "|| COALESCE(phone, '') || ' ' || COALESCE(address, '')) FROM prospects "
+    "UNION ALL SELECT id * 4 + 2, 'note', id, prospect_id, '', COALESCE(content, '') FROM notes "
+    "UNION ALL SELECT id * 4 + 3, 'task', id, prospect_id, COALESCE(title, ''), COALESCE(description, '') FROM tasks"
+)
+
+
+def upgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "CREATE TABLE search_documents ("
+            " doc_id BIGINT PRIMARY KEY,"
+            " kind VARCHAR NOT NULL,"
+            " ref_id INTEGER NOT NULL,"
+            " prospect_id INTEGER,"
+            " title TEXT NOT NULL DEFAULT '',"
+            " body TEXT NOT NULL DEFAULT '',"
+            " document tsvector GENERATED ALWAYS AS ("
+            "  setweight(to_tsvector('spanish', title), 'A') || setweight(to_tsvector('spanish', body), 'B')"
+            " ) STORED)"
+        )
+        op.execute("CREATE INDEX ix_search_documents_document ON search_documents USING GIN (document)")
+        op.execute("INSERT INTO search_documents (doc_id, kind, ref_id, prospect_id, title, body) " + BACKFILL)
+    else:
+        op.execute(
+            "CREATE VIRTUAL TABLE search_documents USING fts5("
+            "kind UNINDEXED, ref_id UNINDEXED, prospect_id UNINDEXED, title, body, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        op.execute("INSERT INTO search_documents (rowid, kind, ref_id, prospect_id, title, body) " + BACKFILL)
+
+
+def downgrade():
+    op.execute("DROP TABLE search_documents")
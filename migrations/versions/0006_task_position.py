@@ -0,0 +1,29 @@
+"""Columna position en tasks (orden manual dentro de cada columna del kanban)
+
+Revision ID: 0006_task_position
+Revises: 0005_search_index
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0006_task_position"
+down_revision = "0005_search_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("tasks", sa.Column("position", sa.Integer(), nullable=False, server_default="0"))
+    # Conserva el orden actual del tablero (por id)
+    op.execute("UPDATE tasks SET position = id")
+    op.create_index("ix_tasks_status_position", "tasks", ["status", "position", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_tasks_status_position", table_name="tasks")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("position")
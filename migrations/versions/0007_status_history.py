@@ -0,0 +1,43 @@
+"""Historial de estados de prospectos (analítica de embudo y tiempo por etapa)
+
+Revision ID: 0007_status_history
+Revises: 0006_task_position
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_status_history"
+down_revision = "0006_task_position"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "prospect_status_history",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("prospect_id", sa.Integer(), sa.ForeignKey("prospects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("from_status", sa.String(), nullable=True),
+        sa.Column("to_status", sa.String(), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), nullable=False),
+        sa.Column("changed_by_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+    )
+    op.create_index(
+        "ix_status_history_prospect_changed", "prospect_status_history", ["prospect_id", "changed_at", "id"]
+    )
+    # No hay historial previo: cada prospecto arranca con su estado actual a la
+    # fecha de creación (las etapas intermedias ya recorridas no se conocen)
+    op.execute(
+        "INSERT INTO prospect_status_history (prospect_id, from_status, to_status, changed_at, changed_by_id) "
+        "SELECT id, NULL, COALESCE(status, 'Nuevo'), COALESCE(created_at, CURRENT_TIMESTAMP), created_by_id "
+        "FROM prospects"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_status_history_prospect_changed", table_name="prospect_status_history")
+    op.drop_table("prospect_status_history")
@@ -0,0 +1,77 @@
+"""Tablas de archivo para tareas y subtareas completadas (archive.py)
+
+Revision ID: 0008_archive
+Revises: 0007_status_history
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_archive"
+down_revision = "0007_status_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Antigüedad de las subtareas completadas (las tareas ya tienen updated_at)
+    op.add_column("subtasks", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.execute("UPDATE subtasks SET updated_at = created_at")
+
+    op.create_table(
+        "archived_tasks",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("start_date", sa.DateTime(), nullable=True),
+        sa.Column("end_date", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.Column("prospect_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["prospect_id"], ["prospects.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_archived_tasks_archived_at_id", "archived_tasks", ["archived_at", "id"])
+    op.create_index("ix_archived_tasks_prospect_archived_at", "archived_tasks", ["prospect_id", "archived_at", "id"])
+
+    op.create_table(
+        "archived_task_assignments",
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["task_id"], ["archived_tasks.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("task_id", "user_id", name="pk_archived_task_assignments"),
+    )
+    op.create_index("ix_archived_task_assignments_user_task", "archived_task_assignments", ["user_id", "task_id"])
+
+    op.create_table(
+        "archived_subtasks",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("task_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_archived_subtasks_user_archived_at", "archived_subtasks", ["user_id", "archived_at", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_archived_subtasks_user_archived_at", table_name="archived_subtasks")
+    op.drop_table("archived_subtasks")
+    op.drop_index("ix_archived_task_assignments_user_task", table_name="archived_task_assignments")
+    op.drop_table("archived_task_assignments")
+    op.drop_index("ix_archived_tasks_prospect_archived_at", table_name="archived_tasks")
+    op.drop_index("ix_archived_tasks_archived_at_id", table_name="archived_tasks")
+    op.drop_table("archived_tasks")
+    with op.batch_alter_table("subtasks") as batch_op:
+        batch_op.drop_column("updated_at")
@@ -0,0 +1,90 @@
+"""FK con ON DELETE CASCADE / SET NULL (borrados en cascada en la base)
+
+Revision ID: 0009_cascade_deletes
+Revises: 0008_archive
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0009_cascade_deletes"
+down_revision = "0008_archive"
+branch_labels = None
+depends_on = None
+
+# tabla -> [(columna, tabla referida, ondelete)]
+FOREIGN_KEYS = {
+    "prospects": [("created_by_id", "users", "SET NULL")],
+    "notes": [("prospect_id", "prospects", "CASCADE")],
+    "tasks": [("prospect_id", "prospects", "CASCADE")],
+    "task_assignments": [("task_id", "tasks", "CASCADE"), ("user_id", "users", "CASCADE")],
+    "subtasks": [("task_id", "tasks", "CASCADE"), ("user_id", "users", "CASCADE")],
+    "prospect_status_history": [("changed_by_id", "users", "SET NULL")],
+    "archived_task_assignments": [("user_id", "users", "CASCADE")],
+    "archived_subtasks": [("user_id", "users", "CASCADE")],
+}
+
+# En SQLite las FK de las tablas originales no tienen nombre: en modo batch
+# toman el de esta convención, que es también el de las nuevas
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s"}
+
+# Filas que hasta ahora quedaban huérfanas (sin FK aplicadas en SQLite y sin
+# cascada en el ORM para las tareas): con las FK activas romperían escrituras
+ORPHANS = (
+    "DELETE FROM notes WHERE prospect_id IS NOT NULL AND prospect_id NOT IN (SELECT id FROM prospects)",
+    "DELETE FROM tasks WHERE prospect_id IS NOT NULL AND prospect_id NOT IN (SELECT id FROM prospects)",
+    "DELETE FROM task_assignments WHERE task_id NOT IN (SELECT id FROM tasks) OR user_id NOT IN (SELECT id FROM users)",
+    "DELETE FROM subtasks WHERE (task_id IS NOT NULL AND task_id NOT IN (SELECT id FROM tasks)) "
+    "OR (user_id IS NOT NULL AND user_id NOT IN (SELECT id FROM users))",
+    "DELETE FROM archived_task_assignments WHERE user_id NOT IN (SELECT id FROM users)",
+    "DELETE FROM archived_subtasks WHERE user_id IS NOT NULL AND user_id NOT IN (SELECT id FROM users)",
+)
+DANGLING = (
+    "UPDATE prospects SET created_by_id = NULL WHERE created_by_id NOT IN (SELECT id FROM users)",
+    "UPDATE prospect_status_history SET changed_by_id = NULL WHERE changed_by_id NOT IN (SELECT id FROM users)",
+    "UPDATE archived_tasks SET prospect_id = NULL WHERE prospect_id NOT IN (SELECT id FROM prospects)",
+)
+
+
+def _existing_name(bind, table, column):
+    for fk in sa.inspect(bind).get_foreign_keys(table):
+        if fk["constrained_columns"] == [column]:
+            # Sin nombre (SQLite): el que le asigna NAMING_CONVENTION
+            return fk["name"] or f"fk_{table}_{column}"
+    return None
+
+
+def _replace_foreign_keys(ondelete: bool):
+    bind = op.get_bind()
+    for table, columns in FOREIGN_KEYS.items():
+        names = {column: _existing_name(bind, table, column) for column, _, _ in columns}
+        # Un batch por tabla: en SQLite se recrea una sola vez
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            for column, referent, rule in columns:
+                if names[column]:
+                    batch_op.drop_constraint(names[column], type_="foreignkey")
+                batch_op.create_foreign_key(
+                    f"fk_{table}_{column}", referent, [column], ["id"], ondelete=rule if ondelete else None
+                )
+
+
+def upgrade():
+    bind = op.get_bind()
+    removed = sum(bind.execute(sa.text(statement)).rowcount for statement in ORPHANS)
+    for statement in DANGLING:
+        op.execute(statement)
+    if removed:
+        # Documentos de búsqueda de lo borrado y contadores del dashboard:
+        # vaciar stat_counters hace que el arranque los reconstruya (stats.ensure_built)
+        op.execute("DELETE FROM search_documents WHERE kind = 'note' AND ref_id NOT IN (SELECT id FROM notes)")
+        op.execute("DELETE FROM search_documents WHERE kind = 'task' AND ref_id NOT IN (SELECT id FROM tasks)")
+        op.execute("DELETE FROM stat_counters")
+
+    _replace_foreign_keys(ondelete=True)
+
+
+def downgrade():
+    _replace_foreign_keys(ondelete=False)
@@ -0,0 +1,44 @@
+"""AUTOINCREMENT en tasks y subtasks (SQLite): ids sin reutilizar para el archivo
+
+Revision ID: 0011_autoincrement_ids
+Revises: 0010_jobs
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_autoincrement_ids"
+down_revision = "0010_jobs"
+branch_labels = None
+depends_on = None
+
+# tabla viva -> tabla del archivo (mismos ids, ver archive.py)
+TABLES = {"tasks": "archived_tasks", "subtasks": "archived_subtasks"}
+
+
+def _recreate(autoincrement: bool):
+    for table in TABLES:
+        with op.batch_alter_table(table, recreate="always", table_kwargs={"sqlite_autoincrement": autoincrement}):
+            pass
+
+
+def upgrade():
+    # En PostgreSQL las secuencias nunca reutilizan ids: no hay nada que cambiar
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _recreate(autoincrement=True)
+    # El siguiente id sigue al mayor ya usado, también entre los archivados
+    for table, archive in TABLES.items():
+        op.execute(f"DELETE FROM sqlite_sequence WHERE name = '{table}'")
+        op.execute(
+            f"INSERT INTO sqlite_sequence (name, seq) SELECT '{table}', "
+            f"max(coalesce((SELECT max(id) FROM {table}), 0), coalesce((SELECT max(id) FROM {archive}), 0))"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _recreate(autoincrement=False)
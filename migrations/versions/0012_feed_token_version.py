@@ -0,0 +1,26 @@
+"""Versión del token del feed .ics por usuario (revocar enlaces filtrados)
+
+Revision ID: 0012_feed_token_version
+Revises: 0011_autoincrement_ids
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_feed_token_version"
+down_revision = "0011_autoincrement_ids"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("feed_token_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("feed_token_version")
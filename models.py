@@ -1,17 +1,26 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Table, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Table, Enum, Index, PrimaryKeyConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 from database import Base
 
+# Borrados: las FK llevan ON DELETE CASCADE / SET NULL (migración 0009) y las
+# relaciones usan passive_deletes, así el ORM no carga los hijos para borrarlos
+# uno por uno: la base los borra junto con la fila padre.
+
 # Tabla de asociación para Tareas <-> Usuarios (Asignación múltiple)
 task_assignments = Table(
     'task_assignments',
     Base.metadata,
-    Column('user_id', Integer, ForeignKey('users.id')),
-    Column('task_id', Integer, ForeignKey('tasks.id'))
+    Column('user_id', Integer, ForeignKey('users.id', ondelete="CASCADE"), nullable=False),
+    Column('task_id', Integer, ForeignKey('tasks.id', ondelete="CASCADE"), nullable=False),
+    PrimaryKeyConstraint('task_id', 'user_id', name='pk_task_assignments'),
+    Index('ix_task_assignments_user_task', 'user_id', 'task_id'),
 )
 
+# Estados posibles de un prospecto (mismo orden que en prospect_detail.html)
+PROSPECT_STATUSES = ["Nuevo", "Contactado", "Interesado", "Cliente", "Perdido"]
+
 class TaskStatus(str, enum.Enum):
     TODO = "todo"
     IN_PROGRESS = "in_progress"
@@ -25,10 +34,13 @@ class User(Base):
     email = Column(String, unique=True, index=True, nullable=True)
     hashed_password = Column(String)
     is_active = Column(Boolean, default=True)
+    # Versión del token del feed .ics: al regenerar el enlace se incrementa y
+    # los tokens anteriores dejan de valer (ver auth.get_feed_user)
+    feed_token_version = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Relaciones
-    created_prospects = relationship("Prospect", back_populates="creator")
-    assigned_tasks = relationship("Task", secondary=task_assignments, back_populates="assignees")
+    created_prospects = relationship("Prospect", back_populates="creator", passive_deletes=True)
+    assigned_tasks = relationship("Task", secondary=task_assignments, back_populates="assignees", passive_deletes=True)
 
 class Prospect(Base):
     __tablename__ = "prospects"
@@ -42,14 +54,24 @@ class Prospect(Base):
     status = Column(String, default="Nuevo")
     address = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Foreign Keys
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
     # Relaciones
     creator = relationship("User", back_populates="created_prospects")
-    notes = relationship("Note", back_populates="prospect", cascade="all, delete-orphan")
-    tasks = relationship("Task", back_populates="prospect")
+    notes = relationship("Note", back_populates="prospect", cascade="all, delete-orphan", passive_deletes=True)
+    # Sin delete-orphan: una tarea puede existir sin prospecto
+    tasks = relationship("Task", back_populates="prospect", cascade="all", passive_deletes=True)
+
+    # Índices según las consultas de /prospectos (filtro + orden por created_at, id)
+    __table_args__ = (
+        Index("ix_prospects_created_at_id", "created_at", "id"),
+        Index("ix_prospects_status_created_at", "status", "created_at", "id"),
+        Index("ix_prospects_industry_created_at", "industry", "created_at", "id"),
+        Index("ix_prospects_creator_created_at", "created_by_id", "created_at", "id"),
+    )
 
 class Note(Base):
     __tablename__ = "notes"
@@ -57,7 +79,7 @@ class Note(Base):
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
-    prospect_id = Column(Integer, ForeignKey("prospects.id"))
+    prospect_id = Column(Integer, ForeignKey("prospects.id", ondelete="CASCADE"), index=True)
 
     prospect = relationship("Prospect", back_populates="notes")
 
@@ -71,13 +93,28 @@ class Task(Base):
     start_date = Column(DateTime, nullable=True)
     end_date = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Se actualiza también al cambiar asignados (ver update_task_details)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Orden dentro de la columna del kanban (ver kanban.py)
+    position = Column(Integer, nullable=False, default=0, server_default="0")
     
-    prospect_id = Column(Integer, ForeignKey("prospects.id"), nullable=True)
+    prospect_id = Column(Integer, ForeignKey("prospects.id", ondelete="CASCADE"), nullable=True)
     
     # Relaciones
     prospect = relationship("Prospect", back_populates="tasks")
-    assignees = relationship("User", secondary=task_assignments, back_populates="assigned_tasks")
-    subtasks = relationship("SubTask", back_populates="parent_task", cascade="all, delete-orphan")
+    assignees = relationship("User", secondary=task_assignments, back_populates="assigned_tasks", passive_deletes=True)
+    subtasks = relationship("SubTask", back_populates="parent_task", cascade="all, delete-orphan", passive_deletes=True)
+
+    # Kanban (estado + cursor), calendario (rango de fechas) y detalle de prospecto.
+    # AUTOINCREMENT en SQLite: sin él se reutiliza el id de la última fila borrada,
+    # que puede estar ya en archived_tasks (los ids se conservan al archivar)
+    __table_args__ = (
+        Index("ix_tasks_status_id", "status", "id"),
+        Index("ix_tasks_status_position", "status", "position", "id"),
+        Index("ix_tasks_end_date_status", "end_date", "status"),
+        Index("ix_tasks_prospect_status", "prospect_id", "status"),
+        {"sqlite_autoincrement": True},
+    )
 
 class SubTask(Base):
     __tablename__ = "subtasks"
@@ -86,11 +123,118 @@ class SubTask(Base):
     title = Column(String, index=True)
     status = Column(String, default="todo") # todo, in_progress, done
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Antigüedad de las completadas para el archivado (ver archive.py)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # FKs
-    user_id = Column(Integer, ForeignKey("users.id")) # Es personal del usuario
-    task_id = Column(Integer, ForeignKey("tasks.id")) # Vinculada a una tarea padre (asignada)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE")) # Es personal del usuario
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), index=True) # Vinculada a una tarea padre (asignada)
     
     # Relaciones
     user = relationship("User") # No necesitamos back_populates estricto si no lo usamos
     parent_task = relationship("Task", back_populates="subtasks")
+
+    # AUTOINCREMENT en SQLite: ver Task
+    __table_args__ = (
+        Index("ix_subtasks_user_status", "user_id", "status"),
+        {"sqlite_autoincrement": True},
+    )
+
+# --- Archivo: tareas y subtareas completadas antiguas (ver archive.py) ---
+# Mismas columnas que las tablas vivas (y los mismos ids) más archived_at.
+# Las consultas del tablero, el detalle de prospecto y el perfil solo leen las
+# tablas vivas; el archivo se consulta aparte, paginado.
+
+archived_task_assignments = Table(
+    'archived_task_assignments',
+    Base.metadata,
+    Column('task_id', Integer, ForeignKey('archived_tasks.id', ondelete="CASCADE"), nullable=False),
+    Column('user_id', Integer, ForeignKey('users.id', ondelete="CASCADE"), nullable=False),
+    PrimaryKeyConstraint('task_id', 'user_id', name='pk_archived_task_assignments'),
+    Index('ix_archived_task_assignments_user_task', 'user_id', 'task_id'),
+)
+
+class ArchivedTask(Base):
+    __tablename__ = "archived_tasks"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String)
+    description = Column(Text, nullable=True)
+    status = Column(String)
+    start_date = Column(DateTime, nullable=True)
+    end_date = Column(DateTime, nullable=True)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    prospect_id = Column(Integer, ForeignKey("prospects.id", ondelete="SET NULL"), nullable=True)
+
+    prospect = relationship("Prospect")
+    assignees = relationship("User", secondary=archived_task_assignments)
+
+    # Listado del archivo: más recientes primero, filtrado o no por prospecto
+    __table_args__ = (
+        Index("ix_archived_tasks_archived_at_id", "archived_at", "id"),
+        Index("ix_archived_tasks_prospect_archived_at", "prospect_id", "archived_at", "id"),
+    )
+
+class ArchivedSubTask(Base):
+    __tablename__ = "archived_subtasks"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String)
+    status = Column(String)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    # La tarea padre puede seguir viva o estar también archivada: sin FK
+    task_id = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        Index("ix_archived_subtasks_user_archived_at", "user_id", "archived_at", "id"),
+    )
+
+class ProspectStatusHistory(Base):
+    # Cada cambio de estado de un prospecto (ver analytics.py): permite medir
+    # embudo y tiempo en cada etapa
+    __tablename__ = "prospect_status_history"
+
+    id = Column(Integer, primary_key=True)
+    prospect_id = Column(Integer, ForeignKey("prospects.id", ondelete="CASCADE"), nullable=False)
+    from_status = Column(String, nullable=True)
+    to_status = Column(String, nullable=False)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    changed_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
+    __table_args__ = (
+        Index("ix_status_history_prospect_changed", "prospect_id", "changed_at", "id"),
+    )
+
+class StatCounter(Base):
+    # Contadores precalculados del dashboard (ver stats.py)
+    __tablename__ = "stat_counters"
+
+    key = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+class Job(Base):
+    # Cola persistente de trabajos en segundo plano (jobs.py, JOBS_BACKEND=db).
+    # Los trabajos hechos se borran; quedan los pendientes y los fallidos.
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON con los argumentos del handler
+    status = Column(String(20), nullable=False, default="queued")  # queued / running / failed
+    attempts = Column(Integer, nullable=False, default=0)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # Siguiente trabajo a tomar: status = 'queued' AND run_at <= ahora, por orden
+        Index("ix_jobs_status_run_at", "status", "run_at", "id"),
+    )
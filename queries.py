@@ -0,0 +1,299 @@
+import base64
+import json
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import DateTime, func, tuple_
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
+
+import models
+
+# Consultas compartidas por las vistas.
+# Cada función carga de antemano las relaciones que usan los templates
+# (task.prospect, task.assignees, prospect.creator, ...) para que el render
+# no dispare un SELECT por fila (N+1).
+
+# Opciones de carga para una tarjeta de tarea (components/task_card.html)
+TASK_CARD_OPTIONS = (
+    joinedload(models.Task.prospect),
+    selectinload(models.Task.assignees),
+)
+
+
+# Tamaño de página por defecto para listados y columnas del kanban
+PAGE_SIZE = 50
+
+
+# --- Paginación por cursor (keyset) ---
+# El cursor codifica los valores de las columnas de orden de la última fila
+# mostrada. La siguiente página se pide con "WHERE (cols) > (valores)", que
+# usa el índice y no depende de cuántas filas haya antes (a diferencia de OFFSET).
+
+def encode_cursor(values) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(values, list) or len(values) != len(columns):
+        return None
+    decoded = []
+    for column, value in zip(columns, values):
+        if value is not None and isinstance(column.type, DateTime):
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                return None
+        decoded.append(value)
+    return decoded
+
+
+def keyset_page(query, columns, cursor=None, limit=PAGE_SIZE, descending=False):
+    """Devuelve (filas, cursor_siguiente). cursor_siguiente es None en la última página."""
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        if values is not None:
+            key, bound = tuple_(*columns), tuple_(*values)
+            query = query.filter(key < bound if descending else key > bound)
+    order = [c.desc() for c in columns] if descending else list(columns)
+    # Pedimos una fila extra para saber si hay página siguiente sin un COUNT
+    rows = query.order_by(*order).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, c.key) for c in columns])
+    return rows, next_cursor
+
+
+def filter_tasks(query, prospect_id=None, assignee_id=None, industry=None, creator_id=None):
+    if prospect_id:
+        query = query.filter(models.Task.prospect_id == prospect_id)
+    if assignee_id:
+        query = query.filter(models.Task.assignees.any(id=assignee_id))
+    if industry:
+        query = query.filter(models.Task.prospect.has(models.Prospect.industry == industry))
+    if creator_id:
+        query = query.filter(models.Task.prospect.has(models.Prospect.created_by_id == creator_id))
+    return query
+
+
+# Orden de los listados de tareas (API)
+TASK_ORDER = (models.Task.id,)
+# Orden de las columnas del kanban: posición manual y luego id
+KANBAN_ORDER = (models.Task.position, models.Task.id)
+
+
+def tasks_page(db: Session, cursor=None, limit=PAGE_SIZE, status=None, order=TASK_ORDER, **filters):
+    query = db.query(models.Task).options(*TASK_CARD_OPTIONS)
+    if status:
+        query = query.filter(models.Task.status == status)
+    query = filter_tasks(query, **filters)
+    return keyset_page(query, order, cursor, limit)
+
+
+def task_column(db: Session, status: str, cursor=None, limit=PAGE_SIZE, **filters):
+    # Una columna del kanban: solo las tareas de ese estado, en su orden manual
+    return tasks_page(db, cursor, limit, status=status, order=KANBAN_ORDER, **filters)
+
+
+def tasks_by_id(db: Session, task_ids):
+    # Tarjetas de un conjunto de tareas (respuesta de los cambios en lote)
+    if not task_ids:
+        return []
+    return (
+        db.query(models.Task)
+        .options(*TASK_CARD_OPTIONS)
+        .filter(models.Task.id.in_(task_ids))
+        .order_by(*KANBAN_ORDER)
+        .all()
+    )
+
+
+# Orden del calendario: por fecha de entrega
+CALENDAR_ORDER = (models.Task.end_date, models.Task.id)
+
+
+def filter_calendar(query, start=None, end=None):
+    query = query.filter(models.Task.end_date != None)
+    if start:
+        query = query.filter(models.Task.end_date >= start)
+    if end:
+        query = query.filter(models.Task.end_date < end)
+    return query
+
+
+def calendar_page(db: Session, start=None, end=None, cursor=None, limit=PAGE_SIZE, **filters):
+    query = db.query(models.Task).options(*TASK_CARD_OPTIONS)
+    query = filter_tasks(filter_calendar(query, start, end), **filters)
+    return keyset_page(query, CALENDAR_ORDER, cursor, limit)
+
+
+# Vistas del calendario: ventana [inicio, fin) alrededor de una fecha
+CALENDAR_VIEWS = ("month", "week")
+
+
+def calendar_window(view: str, anchor: date):
+    if view == "week":
+        start = anchor - timedelta(days=anchor.weekday())
+        end = start + timedelta(days=7)
+    else:
+        start = anchor.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+    return datetime.combine(start, time.min), datetime.combine(end, time.min)
+
+
+def filter_calendar_status(query, status=None):
+    # Con el rango de fechas usa ix_tasks_end_date_status
+    if status:
+        query = query.filter(models.Task.status == status)
+    return query
+
+
+def calendar_range(db: Session, start, end, status=None, **filters):
+    # Todas las tareas de la ventana, ya ordenadas por la base de datos
+    query = filter_calendar_status(filter_calendar(db.query(models.Task).options(*TASK_CARD_OPTIONS), start, end), status)
+    return filter_tasks(query, **filters).order_by(*CALENDAR_ORDER).all()
+
+
+def calendar_version(db: Session, start, end, status=None, **filters):
+    """(nº de tareas, id máximo, última modificación) de la ventana: versión barata para ETag."""
+    T = models.Task
+    query = db.query(func.count(T.id), func.max(T.id), func.max(T.updated_at))
+    query = filter_tasks(filter_calendar_status(filter_calendar(query, start, end), status), **filters)
+    return tuple(query.one())
+
+
+# Orden de /prospectos: más recientes primero
+PROSPECT_ORDER = (models.Prospect.created_at, models.Prospect.id)
+
+
+def filter_prospects(query, status=None, industry=None, creator_id=None):
+    if status:
+        query = query.filter(models.Prospect.status == status)
+    if industry:
+        query = query.filter(models.Prospect.industry == industry)
+    if creator_id:
+        query = query.filter(models.Prospect.created_by_id == creator_id)
+    return query
+
+
+def prospects_page(db: Session, cursor=None, limit=PAGE_SIZE, **filters):
+    query = db.query(models.Prospect).options(joinedload(models.Prospect.creator))
+    query = filter_prospects(query, **filters)
+    return keyset_page(query, PROSPECT_ORDER, cursor, limit, descending=True)
+
+
+# --- Opciones de los <select> de prospecto y usuario ---
+# Las páginas nunca cargan la tabla completa: el <select> trae solo la opción
+# elegida y el resto se pide por nombre a /api/v1/{prospects,users}/choices
+# (páginas chicas por keyset sobre (nombre, id)). Los <select multiple> de
+# asignados cargan a lo sumo USER_CHOICES_LIMIT usuarios.
+CHOICES_LIMIT = 20
+USER_CHOICES_LIMIT = 100
+
+
+def _name_filter(query, column, q):
+    # Contiene el texto, sin distinguir mayúsculas; % y _ se buscan literales
+    if q:
+        pattern = q.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        query = query.filter(column.ilike(f"%{pattern}%", escape="\\"))
+    return query
+
+
+def prospect_choices(db: Session, q=None, cursor=None, limit=CHOICES_LIMIT):
+    """(prospectos con solo id y nombre, cursor_siguiente), ordenados por nombre."""
+    P = models.Prospect
+    query = _name_filter(db.query(P).options(load_only(P.id, P.name)), P.name, q)
+    return keyset_page(query, (P.name, P.id), cursor, limit)
+
+
+def user_choices(db: Session, q=None, cursor=None, limit=CHOICES_LIMIT):
+    """(usuarios con solo id y username, cursor_siguiente), ordenados por username."""
+    U = models.User
+    query = _name_filter(db.query(U).options(load_only(U.id, U.username)), U.username, q)
+    return keyset_page(query, (U.username, U.id), cursor, limit)
+
+
+def prospect_choice(db: Session, prospect_id):
+    # La opción elegida de un filtro (None sin filtro: no consulta)
+    if not prospect_id:
+        return None
+    return db.get(models.Prospect, prospect_id, options=[load_only(models.Prospect.id, models.Prospect.name)])
+
+
+def user_choice(db: Session, user_id):
+    if not user_id:
+        return None
+    return db.get(models.User, user_id, options=[load_only(models.User.id, models.User.username)])
+
+
+def assignee_choices(db: Session, selected=()):
+    """Usuarios para un <select multiple> de asignados: los primeros
+    USER_CHOICES_LIMIT por nombre más los ya elegidos (selected)."""
+    users, _ = user_choices(db, limit=USER_CHOICES_LIMIT)
+    listed = {user.id for user in users}
+    return users + sorted((u for u in selected if u.id not in listed), key=lambda u: u.username)
+
+
+def prospect_detail(db: Session, prospect_id: int):
+    return (
+        db.query(models.Prospect)
+        .options(
+            selectinload(models.Prospect.tasks).options(*TASK_CARD_OPTIONS),
+        )
+        .filter(models.Prospect.id == prospect_id)
+        .first()
+    )
+
+
+def task_detail(db: Session, task_id: int):
+    return (
+        db.query(models.Task)
+        .options(*TASK_CARD_OPTIONS)
+        .filter(models.Task.id == task_id)
+        .first()
+    )
+
+
+def assigned_tasks(db: Session, user_id: int):
+    return (
+        db.query(models.Task)
+        .options(*TASK_CARD_OPTIONS)
+        .filter(models.Task.assignees.any(id=user_id))
+        .all()
+    )
+
+
+def user_subtasks(db: Session, user_id: int):
+    return (
+        db.query(models.SubTask)
+        .options(joinedload(models.SubTask.parent_task))
+        .filter(models.SubTask.user_id == user_id)
+        .all()
+    )
+
+
+# --- Archivo (archive.py): más recientes primero ---
+
+ARCHIVE_ORDER = (models.ArchivedTask.archived_at, models.ArchivedTask.id)
+ARCHIVED_SUBTASK_ORDER = (models.ArchivedSubTask.archived_at, models.ArchivedSubTask.id)
+
+
+def archived_tasks_page(db: Session, cursor=None, limit=PAGE_SIZE, prospect_id=None, assignee_id=None):
+    AT = models.ArchivedTask
+    query = db.query(AT).options(joinedload(AT.prospect), selectinload(AT.assignees))
+    if prospect_id:
+        query = query.filter(AT.prospect_id == prospect_id)
+    if assignee_id:
+        query = query.filter(AT.assignees.any(id=assignee_id))
+    return keyset_page(query, ARCHIVE_ORDER, cursor, limit, descending=True)
+
+
+def archived_subtasks_page(db: Session, user_id: int, cursor=None, limit=PAGE_SIZE):
+    query = db.query(models.ArchivedSubTask).filter(models.ArchivedSubTask.user_id == user_id)
+    return keyset_page(query, ARCHIVED_SUBTASK_ORDER, cursor, limit, descending=True)
@@ -0,0 +1,151 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Esquemas de respuesta de la API JSON (api.py)
+
+
+class UserRef(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    username: str
+
+
+class ProspectOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: Optional[str] = None
+    industry: Optional[str] = None
+    contact_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    status: Optional[str] = None
+    address: Optional[str] = None
+    created_by_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class TaskOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    prospect_id: Optional[int] = None
+    position: Optional[int] = None
+    assignees: List[UserRef] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class SearchHit(BaseModel):
+    kind: str
+    ref_id: int
+    prospect_id: Optional[int] = None
+    # title y snippet: HTML escapado, con los términos encontrados en <mark>
+    title: Optional[str] = None
+    snippet: Optional[str] = None
+    rank: float
+
+
+# --- Cambios en lote del kanban (kanban.py) ---
+
+MAX_BATCH_OPERATIONS = 1000
+
+
+class TaskOperation(BaseModel):
+    task_id: int
+    status: Optional[Literal["todo", "in_progress", "done"]] = None
+    # Colocar la tarea justo antes de esta otra (de la columna destino); sin
+    # before_id, un cambio de estado la deja al final de la nueva columna
+    before_id: Optional[int] = None
+    add_assignees: List[int] = []
+    remove_assignees: List[int] = []
+
+
+class TaskBatch(BaseModel):
+    operations: List[TaskOperation] = Field(..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+
+# --- Borrado masivo (bulk.py) ---
+
+MAX_BULK_DELETE = 1000
+
+
+class BulkDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_DELETE)
+
+
+# --- Analítica del pipeline (analytics.py) ---
+
+class FunnelStage(BaseModel):
+    status: str
+    current: int
+    reached: int
+    conversion: Optional[float] = None  # llegaron a esta etapa / llegaron a la anterior
+    lost: Optional[int] = None  # perdidos con esta etapa como la más lejana alcanzada
+
+
+class StageTime(BaseModel):
+    status: str
+    completed: int
+    avg_days: Optional[float] = None
+    max_days: Optional[float] = None
+    current: int
+    avg_current_days: Optional[float] = None
+
+
+class AssigneeCompletion(BaseModel):
+    user_id: int
+    username: str
+    total: int
+    todo: int
+    in_progress: int
+    done: int
+    overdue: int
+    completion_rate: Optional[float] = None
+
+
+class PipelineReport(BaseModel):
+    generated_at: datetime
+    since: Optional[datetime] = None
+    funnel: List[FunnelStage]
+    stage_times: List[StageTime]
+    assignees: List[AssigneeCompletion]
+
+
+# --- Archivo (archive.py) ---
+
+class ArchivedTaskOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    prospect_id: Optional[int] = None
+    assignees: List[UserRef] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    archived_at: datetime
+
+
+class ArchivedSubTaskOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: Optional[str] = None
+    status: Optional[str] = None
+    task_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    archived_at: datetime
@@ -0,0 +1,240 @@
+import re
+import sys
+
+from markupsafe import Markup, escape
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+import jobs
+import models
+
+# Búsqueda de texto completo sobre prospectos, notas y tareas.
+# - SQLite: tabla virtual FTS5 "search_documents" (ranking bm25).
+# - Postgres: tabla "search_documents" con columna tsvector generada e índice GIN.
+# El esquema lo crea la migración 0005. Las altas y cambios se indexan en
+# segundo plano justo después del commit (trabajo "search.index" de jobs.py,
+# que relee las filas: siempre indexa su último estado). Las bajas quitan sus
+# documentos en la misma transacción que el borrado.
+#
+# Cada documento tiene un doc_id derivado de (tipo, id) para poder
+# actualizarlo o borrarlo por clave primaria (rowid en FTS5).
+
+PAGE_SIZE = 20
+MAX_PAGE = 50
+
+KIND_CODES = {"prospect": 1, "note": 2, "task": 3}
+KIND_NAMES = {code: kind for kind, code in KIND_CODES.items()}
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Marcadores del término encontrado en el snippet (se convierten a <mark>)
+HL_START, HL_STOP = "\x02", "\x03"
+
+
+def doc_id(kind: str, ref_id: int) -> int:
+    return ref_id * 4 + KIND_CODES[kind]
+
+
+def _is_sqlite(db: Session) -> bool:
+    return db.get_bind().dialect.name == "sqlite"
+
+
+def _join(*parts) -> str:
+    return " ".join(p for p in parts if p)
+
+
+# --- Documentos ---
+
+def prospect_document(prospect) -> dict:
+    return {
+        "doc_id": doc_id("prospect", prospect.id),
+        "kind": "prospect",
+        "ref_id": prospect.id,
+        "prospect_id": prospect.id,
+        "title": prospect.name or "",
+        "body": _join(prospect.industry, prospect.contact_name, prospect.email, prospect.phone, prospect.address),
+    }
+
+
+def note_document(note) -> dict:
+    return {
+        "doc_id": doc_id("note", note.id),
+        "kind": "note",
+        "ref_id": note.id,
+        "prospect_id": note.prospect_id,
+        "title": "",
+        "body": note.content or "",
+    }
+
+
+def task_document(task) -> dict:
+    return {
+        "doc_id": doc_id("task", task.id),
+        "kind": "task",
+        "ref_id": task.id,
+        "prospect_id": task.prospect_id,
+        "title": task.title or "",
+        "body": task.description or "",
+    }
+
+
+# --- Escritura ---
+
+def _upsert(db: Session, documents: list):
+    if not documents:
+        return
+    if _is_sqlite(db):
+        # FTS5 no tiene UPSERT: borrar por rowid y volver a insertar
+        db.execute(text("DELETE FROM search_documents WHERE rowid = :doc_id"), documents)
+        db.execute(
+            text(
+                "INSERT INTO search_documents (rowid, kind, ref_id, prospect_id, title, body) "
+                "VALUES (:doc_id, :kind, :ref_id, :prospect_id, :title, :body)"
+            ),
+            documents,
+        )
+    else:
+        db.execute(
+            text(
+                "INSERT INTO search_documents (doc_id, kind, ref_id, prospect_id, title, body) "
+                "VALUES (:doc_id, :kind, :ref_id, :prospect_id, :title, :body) "
+                "ON CONFLICT (doc_id) DO UPDATE SET prospect_id = EXCLUDED.prospect_id, "
+                "title = EXCLUDED.title, body = EXCLUDED.body"
+            ),
+            documents,
+        )
+
+
+def _delete(db: Session, doc_ids: list):
+    if not doc_ids:
+        return
+    column = "rowid" if _is_sqlite(db) else "doc_id"
+    db.execute(text(f"DELETE FROM search_documents WHERE {column} = :doc_id"), [{"doc_id": d} for d in doc_ids])
+
+
+# Tipo de documento -> (modelo, función que arma el documento)
+SOURCES = {
+    "prospect": (models.Prospect, prospect_document),
+    "note": (models.Note, note_document),
+    "task": (models.Task, task_document),
+}
+
+
+def index_later(db: Session, kind: str, ids):
+    """Encola la indexación de esas filas para después del commit de `db`."""
+    jobs.enqueue(db, "search.index", kind=kind, ids=sorted(set(ids)))
+
+
+@jobs.handler("search.index")
+def _index_job(db: Session, kind: str, ids: list):
+    # Las filas borradas mientras tanto ya no están: no se indexan
+    model, to_document = SOURCES[kind]
+    _upsert(db, [to_document(row) for row in db.query(model).filter(model.id.in_(ids))])
+
+
+def remove_tasks(db: Session, task_ids):
+    _delete(db, [doc_id("task", t) for t in task_ids])
+
+
+def remove_prospects(db: Session, prospect_ids):
+    # Los prospectos, sus notas y sus tareas (que la base borra en cascada con
+    # ellos) en una sola sentencia: se llama antes del DELETE de los prospectos.
+    # Los doc_id se calculan en SQL igual que en doc_id().
+    column = "rowid" if _is_sqlite(db) else "doc_id"
+    statement = text(
+        f"DELETE FROM search_documents WHERE {column} IN ("
+        f"SELECT id * 4 + {KIND_CODES['prospect']} FROM prospects WHERE id IN :ids "
+        f"UNION ALL SELECT id * 4 + {KIND_CODES['note']} FROM notes WHERE prospect_id IN :ids "
+        f"UNION ALL SELECT id * 4 + {KIND_CODES['task']} FROM tasks WHERE prospect_id IN :ids)"
+    ).bindparams(bindparam("ids", expanding=True))
+    db.execute(statement, {"ids": list(prospect_ids)})
+
+
+def rebuild(db: Session, batch_size: int = 1000):
+    # Reindexa todo desde las tablas (reparación)
+    db.execute(text("DELETE FROM search_documents"))
+    for model, to_document in SOURCES.values():
+        batch = []
+        for row in db.query(model).yield_per(batch_size):
+            batch.append(to_document(row))
+            if len(batch) >= batch_size:
+                _upsert(db, batch)
+                batch = []
+        _upsert(db, batch)
+    db.commit()
+
+
+# --- Consulta ---
+
+def _tokens(query: str) -> list:
+    return _TOKEN_RE.findall(query or "")[:10]
+
+
+def search(db: Session, query: str, page: int = 1, page_size: int = PAGE_SIZE, kind: str = None):
+    """Resultados ordenados por relevancia: (items, hay_más)."""
+    tokens = _tokens(query)
+    if not tokens:
+        return [], False
+    page = max(1, min(page, MAX_PAGE))
+    params = {"limit": page_size + 1, "offset": (page - 1) * page_size, "hl_start": HL_START, "hl_stop": HL_STOP}
+    kind_filter = ""
+    if kind in KIND_CODES:
+        kind_filter = "AND kind = :kind"
+        params["kind"] = kind
+
+    if _is_sqlite(db):
+        # Cada término como prefijo entre comillas: "ter"* "min"* (AND implícito)
+        params["match"] = " ".join('"{}"*'.format(t.replace('"', "")) for t in tokens)
+        sql = (
+            "SELECT kind, ref_id, prospect_id, "
+            "highlight(search_documents, 3, :hl_start, :hl_stop) AS title, "
+            "snippet(search_documents, 4, :hl_start, :hl_stop, '…', 12) AS snippet, "
+            "bm25(search_documents, 0.0, 0.0, 0.0, 10.0, 1.0) AS rank "
+            "FROM search_documents WHERE search_documents MATCH :match " + kind_filter +
+            " ORDER BY rank LIMIT :limit OFFSET :offset"
+        )
+    else:
+        params["match"] = " & ".join(f"{t}:*" for t in tokens)
+        sql = (
+            "WITH hits AS ("
+            "  SELECT kind, ref_id, prospect_id, title, body, "
+            "  ts_rank_cd(document, to_tsquery('spanish', :match)) AS rank "
+            "  FROM search_documents WHERE document @@ to_tsquery('spanish', :match) " + kind_filter +
+            "  ORDER BY rank DESC LIMIT :limit OFFSET :offset"
+            ") SELECT kind, ref_id, prospect_id, "
+            "ts_headline('spanish', title, to_tsquery('spanish', :match), :title_options) AS title, "
+            "ts_headline('spanish', body, to_tsquery('spanish', :match), :headline_options) AS snippet, "
+            "rank FROM hits ORDER BY rank DESC"
+        )
+        params["headline_options"] = f"StartSel={HL_START}, StopSel={HL_STOP}, MaxWords=20, MinWords=5"
+        params["title_options"] = f"StartSel={HL_START}, StopSel={HL_STOP}, HighlightAll=true"
+    rows = db.execute(text(sql), params).mappings().all()
+    has_more = len(rows) > page_size
+    items = []
+    for row in rows[:page_size]:
+        item = dict(row)
+        item["title"] = highlight(item["title"])
+        item["snippet"] = highlight(item["snippet"])
+        items.append(item)
+    return items, has_more
+
+
+def highlight(snippet: str) -> Markup:
+    # Escapamos el texto y luego marcamos los términos encontrados
+    escaped = str(escape(snippet or ""))
+    return Markup(escaped.replace(HL_START, "<mark>").replace(HL_STOP, "</mark>"))
+
+
+if __name__ == "__main__":
+    # Uso: python search.py rebuild
+    from database import SessionLocal
+
+    if sys.argv[1:] != ["rebuild"]:
+        print("Uso: python search.py rebuild")
+        sys.exit(1)
+    db = SessionLocal()
+    try:
+        rebuild(db)
+        print("INFO: Search index rebuilt.")
+    finally:
+        db.close()
@@ -0,0 +1,216 @@
+// Comportamiento común de las páginas (se incluye desde layout.html)
+
+// Cerrar el menú de usuario si se clickea fuera
+window.addEventListener('click', function (e) {
+    const menu = document.getElementById('user-menu');
+    const button = e.target.closest('button'); // El botón que abre el menú
+
+    // Si el click NO fue en el botón Y el menú NO está oculto -> cerrar
+    // (Nota: si fue en el botón, el onclick del botón ya lo manejó)
+    if (menu && !button && !menu.classList.contains('hidden')) {
+        menu.classList.add('hidden');
+    }
+});
+
+// Abre el modal de una tarea pidiendo el fragmento HTML al servidor
+function openTaskModal(taskId) {
+    fetch('/tasks/' + taskId + '/modal', { credentials: 'same-origin' })
+        .then(function (resp) {
+            if (!resp.ok) throw new Error(resp.status);
+            return resp.text();
+        })
+        .then(function (html) {
+            document.getElementById('task-modal-container').innerHTML = html;
+        })
+        .catch(function () {
+            window.location.href = '/planning';
+        });
+}
+
+function closeTaskModal(event, modalId) {
+    // Cierra solo si clickeas el backdrop (id == modalId)
+    if (event.target.id === modalId) {
+        closeTaskModalById(modalId);
+    }
+}
+
+function closeTaskModalById(modalId) {
+    const modal = document.getElementById(modalId);
+    if (modal) {
+        modal.remove();
+    }
+}
+
+// Coloca una tarjeta (JSON de /tasks/batch o /tasks/cards) en la columna
+// de su estado respetando la posición. Devuelve false si la página no
+// tiene dónde mostrarla.
+function placeTaskCard(task, allowNew) {
+    const card = document.querySelector('[data-task-id="' + task.id + '"]');
+    const column = document.querySelector('[data-column="' + task.status + '"]');
+    if (!column || (!card && allowNew === false)) {
+        return false;
+    }
+    const template = document.createElement('template');
+    template.innerHTML = task.html.trim();
+    const fresh = template.content.firstElementChild;
+    if (card) {
+        card.remove();
+    }
+    const next = Array.prototype.find.call(
+        column.querySelectorAll('[data-task-id]'),
+        function (el) { return Number(el.dataset.position) > task.position; }
+    );
+    column.insertBefore(fresh, next || null);
+    return true;
+}
+
+// Aplica varios cambios del tablero en una sola petición (POST /tasks/batch)
+// y reemplaza solo las tarjetas que cambiaron. Si la columna destino no
+// está en la página (otra vista), recarga.
+function applyTaskBatch(operations) {
+    return fetch('/tasks/batch', {
+        method: 'POST',
+        credentials: 'same-origin',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ operations: operations })
+    })
+        .then(function (resp) {
+            if (!resp.ok) throw new Error(resp.status);
+            return resp.json();
+        })
+        .then(function (data) {
+            data.tasks.forEach(function (task) {
+                if (!placeTaskCard(task, true)) {
+                    window.location.reload();
+                }
+            });
+            return data.tasks;
+        });
+}
+
+// Tablero en vivo: las páginas con data-live-events se suscriben a /events
+// y aplican los cambios de otros usuarios sin recargar. Las tarjetas se
+// piden ya renderizadas a /tasks/cards (varias por petición).
+(function () {
+    const root = document.querySelector('[data-live-events]');
+    if (!root || !window.EventSource) {
+        return;
+    }
+    const allowNew = root.dataset.liveNew !== '0';
+    let pending = new Set();
+    let timer = null;
+
+    function showStaleNotice() {
+        if (document.getElementById('live-stale')) return;
+        const notice = document.createElement('div');
+        notice.id = 'live-stale';
+        notice.className = 'fixed bottom-4 right-4 z-40 bg-slate-800 text-white text-sm rounded-md shadow-lg px-4 py-2';
+        notice.innerHTML = 'Hay cambios nuevos. <a href="" class="underline font-medium">Actualizar</a>';
+        document.body.appendChild(notice);
+    }
+
+    function flush() {
+        timer = null;
+        const ids = Array.from(pending);
+        pending = new Set();
+        const query = ids.map(function (id) { return 'ids=' + id; }).join('&');
+        fetch('/tasks/cards?' + query, { credentials: 'same-origin' })
+            .then(function (resp) {
+                if (!resp.ok) throw new Error(resp.status);
+                return resp.json();
+            })
+            .then(function (data) {
+                data.tasks.forEach(function (task) { placeTaskCard(task, allowNew); });
+            })
+            .catch(showStaleNotice);
+    }
+
+    const source = new EventSource(root.dataset.liveEvents);
+    source.addEventListener('task', function (e) {
+        const event = JSON.parse(e.data);
+        if (event.action === 'deleted' || event.action === 'archived') {
+            const card = document.querySelector('[data-task-id="' + event.id + '"]');
+            if (card) card.remove();
+            return;
+        }
+        // Agrupa ráfagas (p. ej. un lote de cambios) en una sola petición
+        pending.add(event.id);
+        if (!timer) timer = setTimeout(flush, 150);
+    });
+    source.addEventListener('subtask', showStaleNotice);
+    source.addEventListener('prospect', showStaleNotice);
+    source.addEventListener('resync', function () {
+        source.close();
+        showStaleNotice();
+    });
+})();
+
+// Botones de estado del modal: sin recargar la página si es posible
+function moveTaskFromModal(event, taskId) {
+    const button = event.submitter;
+    if (!button || !window.fetch || !document.querySelector('[data-column]')) {
+        return true; // envío normal del formulario
+    }
+    event.preventDefault();
+    applyTaskBatch([{ task_id: taskId, status: button.value }])
+        .then(function () { closeTaskModalById('task-modal-' + taskId); })
+        .catch(function () { window.location.reload(); });
+    return false;
+}
+
+// <select data-choices="/api/v1/.../choices"> (components/choice_select.html):
+// la página trae solo la opción elegida. Un buscador encima pide por nombre
+// una página chica de opciones al escribir (o al enfocar, sin texto).
+(function () {
+    document.querySelectorAll('select[data-choices]').forEach(function (select) {
+        const search = document.createElement('input');
+        search.type = 'search';
+        search.placeholder = 'Buscar…';
+        search.className = select.className + ' block';
+        select.parentNode.insertBefore(search, select);
+        let requested = null;
+        let timer = null;
+
+        function load() {
+            const q = search.value.trim();
+            if (q === requested) return;
+            requested = q;
+            fetch(select.dataset.choices + '?q=' + encodeURIComponent(q), { credentials: 'same-origin' })
+                .then(function (resp) {
+                    if (!resp.ok) throw new Error(resp.status);
+                    return resp.json();
+                })
+                .then(function (data) {
+                    if (q !== requested) return; // llegó una búsqueda más nueva
+                    // Se conservan la opción vacía y la elegida
+                    const keep = Array.prototype.filter.call(select.options, function (option) {
+                        return !option.disabled && (option.value === '' || option.selected);
+                    });
+                    while (select.options.length) select.remove(0);
+                    keep.forEach(function (option) { select.add(option); });
+                    data.items.forEach(function (item) {
+                        if (!keep.some(function (option) { return option.value === String(item.id); })) {
+                            select.add(new Option(item.name, item.id));
+                        }
+                    });
+                    if (data.next_cursor) {
+                        const more = new Option('… escribe para acotar', '');
+                        more.disabled = true;
+                        select.add(more);
+                    }
+                    // Escribir un nombre elige el primer resultado si no había elección
+                    if (q && select.value === '' && data.items.length) {
+                        select.value = String(data.items[0].id);
+                    }
+                })
+                .catch(function () { requested = null; });
+        }
+
+        search.addEventListener('input', function () {
+            clearTimeout(timer);
+            timer = setTimeout(load, 200);
+        });
+        search.addEventListener('focus', load);
+        select.addEventListener('focus', load);
+    });
+})();
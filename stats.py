@@ -0,0 +1,163 @@
+import sys
+
+from sqlalchemy import func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+import models
+
+# Contadores incrementales para el dashboard.
+# Los handlers de main.py los actualizan dentro de la misma transacción que la
+# escritura, así el dashboard se arma con una sola lectura en vez de tres COUNT.
+# rebuild() los recalcula desde cero (reparación o primera ejecución).
+
+TOTAL_PROSPECTS = "prospects:total"
+
+
+def prospect_status_key(status: str) -> str:
+    return f"prospects:status:{status}"
+
+
+def open_tasks_key(user_id: int) -> str:
+    return f"tasks:open:user:{user_id}"
+
+
+def is_open(task_status: str) -> bool:
+    return task_status != models.TaskStatus.DONE.value
+
+
+def _bump_many(db: Session, deltas: dict):
+    # Un solo INSERT ... ON CONFLICT DO UPDATE para todas las claves: crea las
+    # que faltan (primera vez, o tras un rebuild que no guardó las que valían 0)
+    # sin la carrera de UPDATE + INSERT entre dos transacciones
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    counter = models.StatCounter
+    statement = dialect.insert(counter).values([{"key": key, "value": delta} for key, delta in deltas.items()])
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[counter.key],
+            set_={"value": counter.value + statement.excluded.value},
+        )
+    )
+
+
+def _bump(db: Session, key: str, delta: int):
+    _bump_many(db, {key: delta})
+
+
+# --- Prospectos ---
+
+def prospect_added(db: Session, status: str):
+    _bump(db, TOTAL_PROSPECTS, 1)
+    _bump(db, prospect_status_key(status), 1)
+
+
+def prospects_imported(db: Session, status_counts: dict):
+    # Alta masiva: una sola sentencia para todos los estados en lugar de una por fila
+    deltas = {TOTAL_PROSPECTS: sum(status_counts.values())}
+    for status, count in status_counts.items():
+        deltas[prospect_status_key(status)] = count
+    _bump_many(db, deltas)
+
+
+def prospects_removed(db: Session, status_counts: dict):
+    deltas = {TOTAL_PROSPECTS: -sum(status_counts.values())}
+    for status, count in status_counts.items():
+        deltas[prospect_status_key(status)] = -count
+    _bump_many(db, deltas)
+
+
+def prospect_status_changed(db: Session, old_status: str, new_status: str):
+    if old_status == new_status:
+        return
+    _bump(db, prospect_status_key(old_status), -1)
+    _bump(db, prospect_status_key(new_status), 1)
+
+
+# --- Tareas abiertas por usuario ---
+
+def task_assignees_changed(db: Session, task_status: str, added_ids=(), removed_ids=()):
+    if not is_open(task_status):
+        return
+    for user_id in added_ids:
+        _bump(db, open_tasks_key(user_id), 1)
+    for user_id in removed_ids:
+        _bump(db, open_tasks_key(user_id), -1)
+
+
+def open_tasks_removed(db: Session, counts_by_user: dict):
+    # {user_id: nº de tareas abiertas suyas que se borran}
+    _bump_many(db, {open_tasks_key(user_id): -count for user_id, count in counts_by_user.items()})
+
+
+def task_status_changed(db: Session, assignee_ids, old_status: str, new_status: str):
+    delta = int(is_open(new_status)) - int(is_open(old_status))
+    for user_id in assignee_ids:
+        _bump(db, open_tasks_key(user_id), delta)
+
+
+# --- Lectura ---
+
+def dashboard_stats(db: Session, user_id: int) -> dict:
+    keys = {
+        "total": TOTAL_PROSPECTS,
+        "contacted": prospect_status_key("Contactado"),
+        "tasks": open_tasks_key(user_id),
+    }
+    rows = dict(
+        db.query(models.StatCounter.key, models.StatCounter.value)
+        .filter(models.StatCounter.key.in_(keys.values()))
+        .all()
+    )
+    return {name: rows.get(key, 0) for name, key in keys.items()}
+
+
+# --- Reconstrucción ---
+
+def rebuild(db: Session):
+    counters = {TOTAL_PROSPECTS: 0}
+    by_status = db.query(models.Prospect.status, func.count()).group_by(models.Prospect.status).all()
+    for status, count in by_status:
+        counters[TOTAL_PROSPECTS] += count
+        if status is not None:
+            counters[prospect_status_key(status)] = count
+
+    ta = models.task_assignments
+    open_by_user = (
+        db.query(ta.c.user_id, func.count())
+        .join(models.Task, models.Task.id == ta.c.task_id)
+        .filter(models.Task.status != models.TaskStatus.DONE.value)
+        .group_by(ta.c.user_id)
+        .all()
+    )
+    for user_id, count in open_by_user:
+        counters[open_tasks_key(user_id)] = count
+
+    db.query(models.StatCounter).delete()
+    if counters:
+        db.execute(insert(models.StatCounter), [{"key": k, "value": v} for k, v in counters.items()])
+    db.commit()
+
+
+def ensure_built(db: Session):
+    # Si la tabla nunca se llenó (base existente), reconstruimos una vez
+    if db.get(models.StatCounter, TOTAL_PROSPECTS) is None:
+        rebuild(db)
+
+
+if __name__ == "__main__":
+    # Uso: python stats.py rebuild
+    from database import SessionLocal
+
+    if sys.argv[1:] != ["rebuild"]:
+        print("Uso: python stats.py rebuild")
+        sys.exit(1)
+    db = SessionLocal()
+    try:
+        rebuild(db)
+        print("INFO: Dashboard counters rebuilt.")
+    finally:
+        db.close()
@@ -0,0 +1,35 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'dashboard.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('layout.html', 'dashboard.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_stats = resolve('stats')
+    pass
+    yield '\n<div class="px-4 py-6 sm:px-0">\n    <div class="mb-8">\n        <h1 class="text-3xl font-bold text-slate-900">Dashboard</h1>\n        <p class="mt-2 text-sm text-slate-600">Resumen general de tu gestión de clientes.</p>\n    </div>\n\n    <div class="grid grid-cols-1 gap-5 sm:grid-cols-2 lg:grid-cols-3 mb-8">\n        <!-- Total Prospectos -->\n        <div class="bg-white overflow-hidden shadow rounded-lg border border-slate-100">\n            <div class="p-5">\n                <div class="flex items-center">\n                    <div class="flex-shrink-0 bg-blue-100 rounded-md p-3">\n                        <svg class="h-6 w-6 text-blue-600" fill="none" viewBox="0 0 24 24" stroke="currentColor">\n                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"\n                                d="M17 20h5v-2a3 3 0 00-5.356-1.857M17 20H7m10 0v-2c0-.656-.126-1.283-.356-1.857M7 20H2v-2a3 3 0 015.356-1.857M7 20v-2c0-.656.126-1.283.356-1.857m0 0a5.002 5.002 0 019.288 0M15 7a3 3 0 11-6 0 3 3 0 016 0zm6 3a2 2 0 11-4 0 2 2 0 014 0zM7 10a2 2 0 11-4 0 2 2 0 014 0z" />\n                        </svg>\n                    </div>\n                    <div class="ml-5 w-0 flex-1">\n                        <dl>\n                            <dt class="text-sm font-medium text-slate-500 truncate">Total Prospectos</dt>\n                            <dd>\n                                <div class="text-lg font-bold text-slate-900">'
+    yield escape(environment.getattr((undefined(name='stats') if l_0_stats is missing else l_0_stats), 'total'))
+    yield '</div>\n                            </dd>\n                        </dl>\n                    </div>\n                </div>\n            </div>\n            <div class="bg-slate-50 px-5 py-3">\n                <a href="/prospectos" class="text-sm font-medium text-blue-600 hover:text-blue-900">Ver todos</a>\n            </div>\n        </div>\n\n        <!-- Contactados -->\n        <div class="bg-white overflow-hidden shadow rounded-lg border border-slate-100">\n            <div class="p-5">\n                <div class="flex items-center">\n                    <div class="flex-shrink-0 bg-green-100 rounded-md p-3">\n                        <svg class="h-6 w-6 text-green-600" fill="none" viewBox="0 0 24 24" stroke="currentColor">\n                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"\n                                d="M3 5a2 2 0 012-2h3.28a1 1 0 01.948.684l1.498 4.493a1 1 0 01-.502 1.21l-2.257 1.13a11.042 11.042 0 005.516 5.516l1.13-2.257a1 1 0 011.21-.502l4.493 1.498a1 1 0 01.684.949V19a2 2 0 01-2 2h-1C9.716 21 3 14.284 3 6V5z" />\n                        </svg>\n                    </div>\n                    <div class="ml-5 w-0 flex-1">\n                        <dl>\n                            <dt class="text-sm font-medium text-slate-500 truncate">Contactados</dt>\n                            <dd>\n                                <div class="text-lg font-bold text-slate-900">'
+    yield escape(environment.getattr((undefined(name='stats') if l_0_stats is missing else l_0_stats), 'contacted'))
+    yield '</div>\n                            </dd>\n                        </dl>\n                    </div>\n                </div>\n            </div>\n            <div class="bg-slate-50 px-5 py-3">\n                <a href="/prospectos" class="text-sm font-medium text-green-600 hover:text-green-900">Ver detalles</a>\n            </div>\n        </div>\n\n        <!-- Tareas -->\n        <div class="bg-white overflow-hidden shadow rounded-lg border border-slate-100">\n            <div class="p-5">\n                <div class="flex items-center">\n                    <div class="flex-shrink-0 bg-purple-100 rounded-md p-3">\n                        <svg class="h-6 w-6 text-purple-600" fill="none" viewBox="0 0 24 24" stroke="currentColor">\n                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"\n                                d="M8 7V3m8 4V3m-9 8h10M5 21h14a2 2 0 002-2V7a2 2 0 00-2-2H5a2 2 0 00-2 2v12a2 2 0 002 2z" />\n                        </svg>\n                    </div>\n                    <div class="ml-5 w-0 flex-1">\n                        <dl>\n                            <dt class="text-sm font-medium text-slate-500 truncate">Tareas Pendientes</dt>\n                            <dd>\n                                <div class="text-lg font-bold text-slate-900">'
+    yield escape(environment.getattr((undefined(name='stats') if l_0_stats is missing else l_0_stats), 'tasks'))
+    yield '</div>\n                            </dd>\n                        </dl>\n                    </div>\n                </div>\n            </div>\n            <div class="bg-slate-50 px-5 py-3">\n                <a href="/planning" class="text-sm font-medium text-purple-600 hover:text-purple-900">Gestionar\n                    Tareas</a>\n            </div>\n        </div>\n    </div>\n</div>\n'
+
+blocks = {'content': block_content}
+debug_info = '1=12&3=17&25=27&50=29&75=31'
\ No newline at end of file
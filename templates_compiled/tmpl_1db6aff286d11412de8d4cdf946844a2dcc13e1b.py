@@ -0,0 +1,24 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'register.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_static_url = resolve('static_url')
+    l_0_error = resolve('error')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="es" class="h-full bg-slate-50">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>Registro - AgencyCRM</title>\n    <script src="https://cdn.tailwindcss.com"></script>\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'css/app.css'))
+    yield '" rel="stylesheet">\n</head>\n\n<body class="h-full flex flex-col justify-center items-center py-12 sm:px-6 lg:px-8">\n    <div class="sm:mx-auto sm:w-full sm:max-w-md">\n        <h2 class="mt-6 text-center text-3xl font-extrabold text-slate-900">\n            Crea tu cuenta\n        </h2>\n        <p class="mt-2 text-center text-sm text-slate-600">\n            ¿Ya tienes cuenta? <a href="/login" class="font-medium text-blue-600 hover:text-blue-500">Inicia sesión</a>\n        </p>\n    </div>\n\n    <div class="mt-8 sm:mx-auto sm:w-full sm:max-w-md">\n        <div class="bg-white py-8 px-4 shadow sm:rounded-lg sm:px-10">\n            <form class="space-y-6" action="/register" method="POST">\n\n                '
+    if (undefined(name='error') if l_0_error is missing else l_0_error):
+        pass
+        yield '\n                <div class="bg-red-50 border-l-4 border-red-400 p-4">\n                    <div class="flex">\n                        <div class="ml-3">\n                            <p class="text-sm text-red-700">'
+        yield escape((undefined(name='error') if l_0_error is missing else l_0_error))
+        yield '</p>\n                        </div>\n                    </div>\n                </div>\n                '
+    yield '\n\n                <div>\n                    <label for="username" class="block text-sm font-medium text-slate-700">Usuario</label>\n                    <div class="mt-1">\n                        <input id="username" name="username" type="text" required\n                            class="appearance-none block w-full px-3 py-2 border border-slate-300 rounded-md shadow-sm placeholder-slate-400 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                    </div>\n                </div>\n\n                <div>\n                    <label for="email" class="block text-sm font-medium text-slate-700">Email</label>\n                    <div class="mt-1">\n                        <input id="email" name="email" type="email" required\n                            class="appearance-none block w-full px-3 py-2 border border-slate-300 rounded-md shadow-sm placeholder-slate-400 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                    </div>\n                </div>\n\n                <div>\n                    <label for="password" class="block text-sm font-medium text-slate-700">Contraseña</label>\n                    <div class="mt-1">\n                        <input id="password" name="password" type="password" required\n                            class="appearance-none block w-full px-3 py-2 border border-slate-300 rounded-md shadow-sm placeholder-slate-400 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                    </div>\n                </div>\n\n                <div>\n                    <button type="submit"\n                        class="w-full flex justify-center py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-blue-600 hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500">\n                        Registrarse\n                    </button>\n                </div>\n            </form>\n        </div>\n    </div>\n</body>\n\n</html>'
+
+blocks = {}
+debug_info = '10=14&27=16&31=19'
\ No newline at end of file
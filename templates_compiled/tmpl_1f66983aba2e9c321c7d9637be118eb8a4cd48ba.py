@@ -0,0 +1,153 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'calendar.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    l_0_choice_select = missing
+    pass
+    parent_template = environment.get_template('layout.html', 'calendar.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    included_template = environment.get_template('components/choice_select.html', 'calendar.html')._get_default_module(context)
+    l_0_choice_select = getattr(included_template, 'choice_select', missing)
+    if l_0_choice_select is missing:
+        l_0_choice_select = undefined(f"the template {included_template.__name__!r} (imported on line 2 in 'calendar.html') does not export the requested name 'choice_select'", name='choice_select')
+    context.vars['choice_select'] = l_0_choice_select
+    context.exported_vars.discard('choice_select')
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_request = resolve('request')
+    l_0_prev_date = resolve('prev_date')
+    l_0_label = resolve('label')
+    l_0_next_date = resolve('next_date')
+    l_0_view = resolve('view')
+    l_0_choice_select = resolve('choice_select')
+    l_0_assignee = resolve('assignee')
+    l_0_selected_prospect = resolve('selected_prospect')
+    l_0_filters = resolve('filters')
+    l_0_feed_url = resolve('feed_url')
+    l_0_tasks_with_dates = resolve('tasks_with_dates')
+    try:
+        t_1 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    pass
+    yield '\n<div class="px-4 py-8 sm:px-0 max-w-5xl mx-auto">\n    <div class="flex justify-between items-end mb-10">\n        <div>\n            <h1 class="text-4xl font-light text-slate-900 tracking-tight">Agenda</h1>\n            <p class="mt-2 text-slate-500 font-light">Tus próximas entregas y compromisos.</p>\n        </div>\n        <a href="/planning" class="text-sm font-medium text-slate-400 hover:text-slate-600 transition-colors">Volver al\n            Kanban</a>\n    </div>\n\n    <!-- Navegación por mes / semana -->\n    <div class="flex flex-wrap items-center justify-between gap-3 mb-4">\n        <div class="flex items-center space-x-3">\n            <a href="'
+    yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'include_query_params'), date=(undefined(name='prev_date') if l_0_prev_date is missing else l_0_prev_date), _block_vars=_block_vars))
+    yield '"\n                class="px-2 py-1 rounded-md text-slate-500 hover:bg-slate-100">&larr;</a>\n            <span class="text-lg font-medium text-slate-800">'
+    yield escape((undefined(name='label') if l_0_label is missing else l_0_label))
+    yield '</span>\n            <a href="'
+    yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'include_query_params'), date=(undefined(name='next_date') if l_0_next_date is missing else l_0_next_date), _block_vars=_block_vars))
+    yield '"\n                class="px-2 py-1 rounded-md text-slate-500 hover:bg-slate-100">&rarr;</a>\n            <a href="'
+    yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'remove_query_params'), 'date', _block_vars=_block_vars))
+    yield '" class="text-sm text-blue-500 hover:text-blue-700">Hoy</a>\n        </div>\n        <div class="flex items-center space-x-1 text-sm">\n            <a href="'
+    yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'include_query_params'), view='month', _block_vars=_block_vars))
+    yield '"\n                class="px-3 py-1 rounded-md '
+    yield escape(('bg-slate-800 text-white' if ((undefined(name='view') if l_0_view is missing else l_0_view) == 'month') else 'text-slate-500 hover:bg-slate-100'))
+    yield '">Mes</a>\n            <a href="'
+    yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'include_query_params'), view='week', _block_vars=_block_vars))
+    yield '"\n                class="px-3 py-1 rounded-md '
+    yield escape(('bg-slate-800 text-white' if ((undefined(name='view') if l_0_view is missing else l_0_view) == 'week') else 'text-slate-500 hover:bg-slate-100'))
+    yield '">Semana</a>\n        </div>\n    </div>\n\n    <!-- Filtros -->\n    <form method="GET" action="/calendar" class="mb-10 flex flex-wrap items-end gap-3 text-sm">\n        <input type="hidden" name="view" value="'
+    yield escape((undefined(name='view') if l_0_view is missing else l_0_view))
+    yield '">\n        '
+    if context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'query_params'), 'get'), 'date', _block_vars=_block_vars):
+        pass
+        yield '\n        <input type="hidden" name="date" value="'
+        yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'query_params'), 'get'), 'date', _block_vars=_block_vars))
+        yield '">\n        '
+    yield '\n        <div>\n            <label class="block text-xs font-medium text-gray-500">Asignado a</label>\n            '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'assignee_id', '/api/v1/users/choices', (undefined(name='assignee') if l_0_assignee is missing else l_0_assignee), label='username', _block_vars=_block_vars))
+    yield '\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-gray-500">Prospecto</label>\n            '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'prospect_id', '/api/v1/prospects/choices', (undefined(name='selected_prospect') if l_0_selected_prospect is missing else l_0_selected_prospect), _block_vars=_block_vars))
+    yield '\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-gray-500">Estado</label>\n            <select name="status" class="mt-1 border border-gray-300 rounded-md py-1.5 px-2">\n                <option value="">Todos</option>\n                <option value="todo" '
+    if (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'status') == 'todo'):
+        pass
+        yield 'selected'
+    yield '>Por hacer</option>\n                <option value="in_progress" '
+    if (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'status') == 'in_progress'):
+        pass
+        yield 'selected'
+    yield '>En curso</option>\n                <option value="done" '
+    if (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'status') == 'done'):
+        pass
+        yield 'selected'
+    yield '>Completado</option>\n            </select>\n        </div>\n        <button type="submit"\n            class="px-3 py-1.5 border border-gray-300 rounded-md font-medium text-gray-700 bg-white hover:bg-gray-50">Filtrar</button>\n        <a href="/calendar?view='
+    yield escape((undefined(name='view') if l_0_view is missing else l_0_view))
+    yield '" class="px-3 py-1.5 text-gray-500 hover:text-gray-700">Limpiar</a>\n        <a href="'
+    yield escape((undefined(name='feed_url') if l_0_feed_url is missing else l_0_feed_url))
+    yield '" class="ml-auto text-xs text-slate-400 hover:text-slate-600"\n            title="Copia este enlace en tu cliente de calendario (Google Calendar, Outlook, Apple Calendar)">Suscribirse (.ics)</a>\n    </form>\n\n    <!-- Minimalist Timeline -->\n    <div class="relative border-l border-slate-200 ml-3 space-y-12">\n        '
+    if (undefined(name='tasks_with_dates') if l_0_tasks_with_dates is missing else l_0_tasks_with_dates):
+        pass
+        yield '\n        '
+        for l_1_task in (undefined(name='tasks_with_dates') if l_0_tasks_with_dates is missing else l_0_tasks_with_dates):
+            _loop_vars = {}
+            pass
+            yield '\n        <div class="relative pl-8 group">\n            <!-- Dot -->\n            <div\n                class="absolute -left-1.5 top-1.5 h-3 w-3 rounded-full border-2 border-white \n                    '
+            if (environment.getattr(l_1_task, 'status') == 'done'):
+                pass
+                yield 'bg-emerald-400 ring-2 ring-emerald-100'
+            else:
+                pass
+                yield 'bg-blue-500 ring-2 ring-blue-100'
+            yield '">\n            </div>\n\n            <!-- Content Card -->\n            <div\n                class="flex flex-col sm:flex-row sm:items-start sm:justify-between bg-white p-6 rounded-xl shadow-[0_2px_15px_-3px_rgba(0,0,0,0.07),0_10px_20px_-2px_rgba(0,0,0,0.04)] hover:shadow-lg transition-shadow duration-300 border border-slate-100">\n                <div class="flex-1">\n                    <div class="flex items-center space-x-3 mb-2">\n                        <span class="text-xs font-semibold tracking-wider uppercase text-slate-400">\n                            '
+            yield escape(context.call(environment.getattr(environment.getattr(l_1_task, 'end_date'), 'strftime'), '%d %b', _loop_vars=_loop_vars))
+            yield '\n                        </span>\n                        '
+            if (environment.getattr(l_1_task, 'status') == 'done'):
+                pass
+                yield '\n                        <span\n                            class="inline-flex items-center px-2 py-0.5 rounded text-xs font-medium bg-emerald-50 text-emerald-700">Completado</span>\n                        '
+            elif (environment.getattr(l_1_task, 'status') == 'in_progress'):
+                pass
+                yield '\n                        <span\n                            class="inline-flex items-center px-2 py-0.5 rounded text-xs font-medium bg-blue-50 text-blue-700">En\n                            Curso</span>\n                        '
+            yield '\n                    </div>\n\n                    <h3 class="text-xl font-medium text-slate-800 mb-1 group-hover:text-blue-600 transition-colors">\n                        '
+            yield escape(environment.getattr(l_1_task, 'title'))
+            yield '\n                    </h3>\n\n                    '
+            if environment.getattr(l_1_task, 'description'):
+                pass
+                yield '\n                    <p class="text-slate-500 text-sm leading-relaxed mb-3 max-w-2xl">\n                        '
+                yield escape(environment.getattr(l_1_task, 'description'))
+                yield '\n                    </p>\n                    '
+            yield '\n\n                    <div class="flex items-center space-x-4 mt-4">\n                        '
+            if environment.getattr(l_1_task, 'prospect'):
+                pass
+                yield '\n                        <div class="flex items-center text-xs text-slate-500">\n                            <span class="w-2 h-2 rounded-full bg-indigo-400 mr-2"></span>\n                            '
+                yield escape(environment.getattr(environment.getattr(l_1_task, 'prospect'), 'name'))
+                yield '\n                        </div>\n                        '
+            yield '\n\n                        <!-- Avatars -->\n                        '
+            if environment.getattr(l_1_task, 'assignees'):
+                pass
+                yield '\n                        <div class="flex -space-x-2">\n                            '
+                for l_2_user in environment.getattr(l_1_task, 'assignees'):
+                    _loop_vars = {}
+                    pass
+                    yield '\n                            <div class="h-6 w-6 rounded-full bg-slate-200 border-2 border-white flex items-center justify-center text-[9px] font-bold text-slate-600"\n                                title="'
+                    yield escape(environment.getattr(l_2_user, 'username'))
+                    yield '">\n                                '
+                    yield escape(t_1(environment.getitem(environment.getattr(l_2_user, 'username'), 0)))
+                    yield '\n                            </div>\n                            '
+                l_2_user = missing
+                yield '\n                        </div>\n                        '
+            yield '\n                    </div>\n                </div>\n\n                <!-- Action (Optional) -->\n                <!-- <div class="mt-4 sm:mt-0 sm:ml-4 text-right">\n                        <a href="#" class="text-sm text-slate-300 hover:text-slate-500">Ver &rarr;</a>\n                    </div> -->\n            </div>\n        </div>\n        '
+        l_1_task = missing
+        yield '\n        '
+    else:
+        pass
+        yield '\n        <div class="text-center py-20">\n            <p class="text-slate-400 font-light text-lg">No hay eventos programados en este periodo.</p>\n            <a href="/planning" class="text-blue-500 hover:text-blue-700 text-sm mt-2 inline-block font-medium">Crear\n                tarea con fecha</a>\n        </div>\n        '
+    yield '\n    </div>\n</div>\n'
+
+blocks = {'content': block_content}
+debug_info = '1=13&2=16&4=24&18=50&20=52&21=54&23=56&26=58&27=60&28=62&29=64&35=66&36=68&37=71&41=74&45=76&51=78&52=82&53=86&58=90&59=92&65=94&66=97&71=101&80=108&82=110&85=113&93=117&96=119&98=122&103=125&106=128&111=131&113=134&115=138&116=140'
\ No newline at end of file
@@ -0,0 +1,37 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/prospect_row.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_prospect = resolve('prospect')
+    pass
+    yield '<!-- Fila de la tabla de prospectos (cacheada en fragments.py) -->\n<tr>\n    <td class="px-6 py-4 whitespace-nowrap">\n        <div class="text-sm font-medium text-gray-900">\n            <a href="/prospectos/'
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'id'))
+    yield '"\n                class="hover:text-blue-600 font-bold underline decoration-dotted">\n                '
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'name'))
+    yield '\n            </a>\n        </div>\n        <div class="text-sm text-gray-500">'
+    yield escape((environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'email') or 'Sin correo'))
+    yield '</div>\n        <div class="text-xs text-slate-400 mt-1">Registrado por: '
+    yield escape(environment.getattr(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'creator'), 'username'))
+    yield '</div>\n    </td>\n    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">\n        '
+    yield escape((environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'industry') or '-'))
+    yield '\n    </td>\n    <td class="px-6 py-4 whitespace-nowrap text-sm text-gray-500">\n        '
+    yield escape((environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'contact_name') or '-'))
+    yield '\n        '
+    if environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'phone'):
+        pass
+        yield '<div class="text-xs">'
+        yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'phone'))
+        yield '</div>'
+    yield '\n    </td>\n    <td class="px-6 py-4 whitespace-nowrap">\n        <span\n            class="px-2 inline-flex text-xs leading-5 font-semibold rounded-full bg-green-100 text-green-800">\n            '
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'status'))
+    yield '\n        </span>\n    </td>\n    <td class="px-6 py-4 whitespace-nowrap text-right text-sm font-medium">\n        <a href="/prospectos/'
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'id'))
+    yield '"\n            class="text-blue-600 hover:text-blue-900">Ver Detalles &rarr;</a>\n    </td>\n</tr>'
+
+blocks = {}
+debug_info = '5=13&7=15&10=17&12=19&15=21&18=23&19=25&24=31&28=33'
\ No newline at end of file
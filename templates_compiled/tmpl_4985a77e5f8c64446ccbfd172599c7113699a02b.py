@@ -0,0 +1,32 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/column_pager.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_request = resolve('request')
+    l_0_param = resolve('param')
+    l_0_column = resolve('column')
+    pass
+    yield '<!-- Paginación de una columna del kanban (param = nombre del cursor en la URL) -->\n<div class="flex justify-between mt-3 text-xs">\n    '
+    if context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'query_params'), 'get'), (undefined(name='param') if l_0_param is missing else l_0_param)):
+        pass
+        yield '\n    <a href="'
+        yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'remove_query_params'), (undefined(name='param') if l_0_param is missing else l_0_param)))
+        yield '" class="text-slate-500 hover:text-slate-700">&larr; Inicio</a>\n    '
+    else:
+        pass
+        yield '\n    <span></span>\n    '
+    yield '\n    '
+    if environment.getattr((undefined(name='column') if l_0_column is missing else l_0_column), 'next_cursor'):
+        pass
+        yield '\n    <a href="'
+        yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'include_query_params'), **{(undefined(name='param') if l_0_param is missing else l_0_param): environment.getattr((undefined(name='column') if l_0_column is missing else l_0_column), 'next_cursor')}))
+        yield '"\n        class="font-medium text-blue-600 hover:text-blue-800">Ver más &rarr;</a>\n    '
+    yield '\n</div>'
+
+blocks = {}
+debug_info = '3=15&4=18&8=24&9=27'
\ No newline at end of file
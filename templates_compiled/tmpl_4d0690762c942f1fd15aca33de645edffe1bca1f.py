@@ -0,0 +1,89 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'prospects.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    l_0_choice_select = missing
+    pass
+    parent_template = environment.get_template('layout.html', 'prospects.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    included_template = environment.get_template('components/choice_select.html', 'prospects.html')._get_default_module(context)
+    l_0_choice_select = getattr(included_template, 'choice_select', missing)
+    if l_0_choice_select is missing:
+        l_0_choice_select = undefined(f"the template {included_template.__name__!r} (imported on line 2 in 'prospects.html') does not export the requested name 'choice_select'", name='choice_select')
+    context.vars['choice_select'] = l_0_choice_select
+    context.exported_vars.discard('choice_select')
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_prospect_statuses = resolve('prospect_statuses')
+    l_0_filters = resolve('filters')
+    l_0_choice_select = resolve('choice_select')
+    l_0_creator = resolve('creator')
+    l_0_prospects = resolve('prospects')
+    l_0_request = resolve('request')
+    l_0_next_cursor = resolve('next_cursor')
+    pass
+    yield '\n<div class="px-4 py-6 sm:px-0">\n    <div class="mb-6 flex justify-between items-center">\n        <div>\n            <h1 class="text-3xl font-bold text-slate-900">Prospectos</h1>\n            <p class="mt-2 text-sm text-slate-600">Gestiona las empresas objetivo.</p>\n        </div>\n        <!-- Modal Trigger (Simple implementation for now: Toggle visibility via JS or separate page. Keeping it simple as a form below) -->\n    </div>\n\n    <!-- Formulario rápido -->\n    <div class="bg-white shadow sm:rounded-lg mb-8 p-6">\n        <h3 class="text-lg font-medium leading-6 text-gray-900 mb-4">Registrar Nuevo Prospecto</h3>\n        <form action="/prospectos/nuevo" method="POST" class="grid grid-cols-1 gap-y-6 sm:grid-cols-2 sm:gap-x-8">\n            <div>\n                <label for="name" class="block text-sm font-medium text-gray-700">Nombre Empresa</label>\n                <div class="mt-1">\n                    <input type="text" name="name" id="name" required\n                        class="py-2 px-3 block w-full shadow-sm sm:text-sm border-gray-300 rounded-md border text-black focus:ring-blue-500 focus:border-blue-500">\n                </div>\n            </div>\n            <div>\n                <label for="industry" class="block text-sm font-medium text-gray-700">Rubro</label>\n                <div class="mt-1">\n                    <input type="text" name="industry" id="industry"\n                        class="py-2 px-3 block w-full shadow-sm sm:text-sm border-gray-300 rounded-md border text-black focus:ring-blue-500 focus:border-blue-500">\n                </div>\n            </div>\n            <div>\n                <label for="contact_name" class="block text-sm font-medium text-gray-700">Contacto</label>\n                <div class="mt-1">\n                    <input type="text" name="contact_name" id="contact_name"\n                        class="py-2 px-3 block w-full shadow-sm sm:text-sm border-gray-300 rounded-md border text-black focus:ring-blue-500 focus:border-blue-500">\n                </div>\n            </div>\n            <div>\n                <label for="phone" class="block text-sm font-medium text-gray-700">Teléfono</label>\n                <div class="mt-1">\n                    <input type="text" name="phone" id="phone"\n                        class="py-2 px-3 block w-full shadow-sm sm:text-sm border-gray-300 rounded-md border text-black focus:ring-blue-500 focus:border-blue-500">\n                </div>\n            </div>\n            <div class="sm:col-span-2">\n                <button type="submit"\n                    class="w-full inline-flex items-center justify-center px-6 py-2 border border-transparent rounded-md shadow-sm text-base font-medium text-white bg-blue-600 hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500">\n                    Guardar Prospecto\n                </button>\n            </div>\n        </form>\n    </div>\n\n    <!-- Filtros -->\n    <form method="GET" action="/prospectos" class="mb-4 flex flex-wrap items-end gap-3 text-sm">\n        <div>\n            <label class="block text-xs font-medium text-gray-500">Estado</label>\n            <select name="status" class="mt-1 border border-gray-300 rounded-md py-1.5 px-2">\n                <option value="">Todos</option>\n                '
+    for l_1_s in (undefined(name='prospect_statuses') if l_0_prospect_statuses is missing else l_0_prospect_statuses):
+        _loop_vars = {}
+        pass
+        yield '\n                <option value="'
+        yield escape(l_1_s)
+        yield '" '
+        if (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'status') == l_1_s):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(l_1_s)
+        yield '</option>\n                '
+    l_1_s = missing
+    yield '\n            </select>\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-gray-500">Rubro</label>\n            <input type="text" name="industry" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'industry') or ''))
+    yield '"\n                class="mt-1 border border-gray-300 rounded-md py-1.5 px-2">\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-gray-500">Registrado por</label>\n            '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'creator_id', '/api/v1/users/choices', (undefined(name='creator') if l_0_creator is missing else l_0_creator), label='username', _block_vars=_block_vars))
+    yield '\n        </div>\n        <button type="submit"\n            class="px-3 py-1.5 border border-gray-300 rounded-md font-medium text-gray-700 bg-white hover:bg-gray-50">Filtrar</button>\n        <a href="/prospectos" class="px-3 py-1.5 text-gray-500 hover:text-gray-700">Limpiar</a>\n        <div class="ml-auto flex items-center space-x-3">\n            <span class="text-xs text-gray-500">Exportar:</span>\n            <a href="/api/v1/prospects/export?format=csv" class="font-medium text-blue-600 hover:text-blue-900">CSV</a>\n            <a href="/api/v1/prospects/export?format=jsonl" class="font-medium text-blue-600 hover:text-blue-900">JSONL</a>\n        </div>\n    </form>\n\n    <!-- Tabla -->\n    <div class="flex flex-col">\n        <div class="-my-2 overflow-x-auto sm:-mx-6 lg:-mx-8">\n            <div class="py-2 align-middle inline-block min-w-full sm:px-6 lg:px-8">\n                <div class="shadow overflow-hidden border-b border-gray-200 sm:rounded-lg">\n                    <table class="min-w-full divide-y divide-gray-200">\n                        <thead class="bg-gray-50">\n                            <tr>\n                                <th scope="col"\n                                    class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">\n                                    Empresa</th>\n                                <th scope="col"\n                                    class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">\n                                    Rubro</th>\n                                <th scope="col"\n                                    class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">\n                                    Contacto</th>\n                                <th scope="col"\n                                    class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">\n                                    Estado</th>\n                                <th scope="col" class="relative px-6 py-3">\n                                    <span class="sr-only">Editar</span>\n                                </th>\n                            </tr>\n                        </thead>\n                        <tbody class="bg-white divide-y divide-gray-200">\n                            '
+    t_1 = 1
+    for l_1_prospect in (undefined(name='prospects') if l_0_prospects is missing else l_0_prospects):
+        l_1_prospect_row = resolve('prospect_row')
+        _loop_vars = {}
+        pass
+        yield '\n                            '
+        yield escape(context.call((undefined(name='prospect_row') if l_1_prospect_row is missing else l_1_prospect_row), l_1_prospect, _loop_vars=_loop_vars))
+        yield '\n                            '
+        t_1 = 0
+    l_1_prospect = l_1_prospect_row = missing
+    if t_1:
+        pass
+        yield '\n                            <tr>\n                                <td colspan="5" class="px-6 py-10 text-center text-sm text-gray-500">\n                                    No hay prospectos registrados. ¡Agrega el primero arriba!\n                                </td>\n                            </tr>\n                            '
+    yield '\n                        </tbody>\n                    </table>\n                </div>\n            </div>\n        </div>\n    </div>\n\n    <!-- Paginación -->\n    <div class="flex justify-between mt-4 text-sm">\n        '
+    if context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'query_params'), 'get'), 'after', _block_vars=_block_vars):
+        pass
+        yield '\n        <a href="'
+        yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'remove_query_params'), 'after', _block_vars=_block_vars))
+        yield '" class="text-gray-500 hover:text-gray-700">&larr; Primera página</a>\n        '
+    else:
+        pass
+        yield '\n        <span></span>\n        '
+    yield '\n        '
+    if (undefined(name='next_cursor') if l_0_next_cursor is missing else l_0_next_cursor):
+        pass
+        yield '\n        <a href="'
+        yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'include_query_params'), after=(undefined(name='next_cursor') if l_0_next_cursor is missing else l_0_next_cursor), _block_vars=_block_vars))
+        yield '"\n            class="font-medium text-blue-600 hover:text-blue-900">Siguiente &rarr;</a>\n        '
+    yield '\n    </div>\n</div>\n'
+
+blocks = {'content': block_content}
+debug_info = '1=13&2=16&4=24&61=40&62=44&68=54&73=56&111=59&112=64&129=72&130=75&134=81&135=84'
\ No newline at end of file
@@ -0,0 +1,35 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/subtask_card.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_sub = resolve('sub')
+    pass
+    yield '<div class="bg-white p-3 rounded shadow-sm border border-slate-200">\n    <div class="flex justify-between items-start mb-2">\n        <span class="text-sm font-medium text-slate-800">'
+    yield escape(environment.getattr((undefined(name='sub') if l_0_sub is missing else l_0_sub), 'title'))
+    yield '</span>\n        <form action="/subtasks/'
+    yield escape(environment.getattr((undefined(name='sub') if l_0_sub is missing else l_0_sub), 'id'))
+    yield '/delete" method="POST" onsubmit="return confirm(\'x\');">\n            <button type="submit" class="text-slate-300 hover:text-red-500 font-bold leading-none">&times;</button>\n        </form>\n    </div>\n\n    <div class="text-[10px] text-slate-500 mb-2 truncate">\n        ↳ '
+    yield escape(environment.getattr(environment.getattr((undefined(name='sub') if l_0_sub is missing else l_0_sub), 'parent_task'), 'title'))
+    yield '\n    </div>\n\n    <!-- Mini Controles de Estado -->\n    <form action="/subtasks/'
+    yield escape(environment.getattr((undefined(name='sub') if l_0_sub is missing else l_0_sub), 'id'))
+    yield '/update_status" method="POST" class="flex space-x-1">\n        <button type="submit" name="status" value="todo"\n            class="w-2 h-2 rounded-full bg-slate-200 hover:bg-slate-400 focus:ring-1 '
+    if (environment.getattr((undefined(name='sub') if l_0_sub is missing else l_0_sub), 'status') == 'todo'):
+        pass
+        yield 'ring-2 ring-slate-500'
+    yield '"\n            title="Pendiente"></button>\n        <button type="submit" name="status" value="in_progress"\n            class="w-2 h-2 rounded-full bg-indigo-200 hover:bg-indigo-400 focus:ring-1 '
+    if (environment.getattr((undefined(name='sub') if l_0_sub is missing else l_0_sub), 'status') == 'in_progress'):
+        pass
+        yield 'ring-2 ring-indigo-500'
+    yield '"\n            title="En Marcha"></button>\n        <button type="submit" name="status" value="done"\n            class="w-2 h-2 rounded-full bg-emerald-200 hover:bg-emerald-400 focus:ring-1 '
+    if (environment.getattr((undefined(name='sub') if l_0_sub is missing else l_0_sub), 'status') == 'done'):
+        pass
+        yield 'ring-2 ring-emerald-500'
+    yield '"\n            title="Listo"></button>\n    </form>\n</div>'
+
+blocks = {}
+debug_info = '3=13&4=15&10=17&14=19&16=21&19=25&22=29'
\ No newline at end of file
@@ -0,0 +1,115 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'search.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('layout.html', 'search.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_q = resolve('q')
+    l_0_kind = resolve('kind')
+    l_0_results = resolve('results')
+    l_0_page = resolve('page')
+    l_0_request = resolve('request')
+    l_0_has_more = resolve('has_more')
+    l_0_kind_labels = missing
+    pass
+    yield '\n<div class="px-4 py-6 sm:px-0">\n    <div class="mb-6">\n        <h1 class="text-3xl font-bold text-slate-900">Buscar</h1>\n        <p class="mt-2 text-sm text-slate-600">Prospectos, notas y tareas ordenados por relevancia.</p>\n    </div>\n\n    <form method="GET" action="/buscar" class="mb-6 flex flex-wrap items-end gap-3 text-sm">\n        <div class="flex-grow">\n            <label class="block text-xs font-medium text-gray-500">Términos</label>\n            <input type="search" name="q" value="'
+    yield escape((undefined(name='q') if l_0_q is missing else l_0_q))
+    yield '" autofocus\n                class="mt-1 w-full border border-gray-300 rounded-md py-1.5 px-2 text-black">\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-gray-500">Tipo</label>\n            <select name="kind" class="mt-1 border border-gray-300 rounded-md py-1.5 px-2">\n                <option value="">Todos</option>\n                <option value="prospect" '
+    if ((undefined(name='kind') if l_0_kind is missing else l_0_kind) == 'prospect'):
+        pass
+        yield 'selected'
+    yield '>Prospectos</option>\n                <option value="note" '
+    if ((undefined(name='kind') if l_0_kind is missing else l_0_kind) == 'note'):
+        pass
+        yield 'selected'
+    yield '>Notas</option>\n                <option value="task" '
+    if ((undefined(name='kind') if l_0_kind is missing else l_0_kind) == 'task'):
+        pass
+        yield 'selected'
+    yield '>Tareas</option>\n            </select>\n        </div>\n        <button type="submit"\n            class="px-3 py-1.5 border border-gray-300 rounded-md font-medium text-gray-700 bg-white hover:bg-gray-50">Buscar</button>\n    </form>\n\n    '
+    l_0_kind_labels = {'prospect': 'Prospecto', 'note': 'Nota', 'task': 'Tarea'}
+    _block_vars['kind_labels'] = l_0_kind_labels
+    yield '\n    <div class="bg-white shadow sm:rounded-lg divide-y divide-gray-200">\n        '
+    t_1 = 1
+    for l_1_r in (undefined(name='results') if l_0_results is missing else l_0_results):
+        _loop_vars = {}
+        pass
+        yield '\n        <div class="p-4">\n            <div class="flex items-center space-x-2">\n                <span class="px-2 inline-flex text-xs leading-5 font-semibold rounded-full bg-slate-100 text-slate-700">'
+        yield escape(environment.getitem((undefined(name='kind_labels') if l_0_kind_labels is missing else l_0_kind_labels), environment.getattr(l_1_r, 'kind')))
+        yield '</span>\n                '
+        if (environment.getattr(l_1_r, 'kind') == 'task'):
+            pass
+            yield '\n                <a href="#" onclick="openTaskModal('
+            yield escape(environment.getattr(l_1_r, 'ref_id'))
+            yield '); return false;"\n                    class="text-sm font-bold text-gray-900 hover:text-blue-600">'
+            yield escape(environment.getattr(l_1_r, 'title'))
+            yield '</a>\n                '
+        elif environment.getattr(l_1_r, 'prospect_id'):
+            pass
+            yield '\n                <a href="/prospectos/'
+            yield escape(environment.getattr(l_1_r, 'prospect_id'))
+            yield '" class="text-sm font-bold text-gray-900 hover:text-blue-600">'
+            yield escape((environment.getattr(l_1_r, 'title') or 'Nota del prospecto'))
+            yield '</a>\n                '
+        else:
+            pass
+            yield '\n                <span class="text-sm font-bold text-gray-900">'
+            yield escape(environment.getattr(l_1_r, 'title'))
+            yield '</span>\n                '
+        yield '\n            </div>\n            '
+        if environment.getattr(l_1_r, 'snippet'):
+            pass
+            yield '\n            <p class="mt-1 text-sm text-gray-600">'
+            yield escape(environment.getattr(l_1_r, 'snippet'))
+            yield '</p>\n            '
+        yield '\n        </div>\n        '
+        t_1 = 0
+    l_1_r = missing
+    if t_1:
+        pass
+        yield '\n        <div class="p-10 text-center text-sm text-gray-500">\n            '
+        if (undefined(name='q') if l_0_q is missing else l_0_q):
+            pass
+            yield 'Sin resultados para "'
+            yield escape((undefined(name='q') if l_0_q is missing else l_0_q))
+            yield '".'
+        else:
+            pass
+            yield 'Escribe algo para buscar.'
+        yield '\n        </div>\n        '
+    yield '\n    </div>\n\n    <!-- Paginación -->\n    <div class="flex justify-between mt-4 text-sm">\n        '
+    if ((undefined(name='page') if l_0_page is missing else l_0_page) > 1):
+        pass
+        yield '\n        <a href="'
+        yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'include_query_params'), page=((undefined(name='page') if l_0_page is missing else l_0_page) - 1), _block_vars=_block_vars))
+        yield '" class="text-gray-500 hover:text-gray-700">&larr; Anterior</a>\n        '
+    else:
+        pass
+        yield '\n        <span></span>\n        '
+    yield '\n        '
+    if (undefined(name='has_more') if l_0_has_more is missing else l_0_has_more):
+        pass
+        yield '\n        <a href="'
+        yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'url'), 'include_query_params'), page=((undefined(name='page') if l_0_page is missing else l_0_page) + 1), _block_vars=_block_vars))
+        yield '"\n            class="font-medium text-blue-600 hover:text-blue-900">Siguiente &rarr;</a>\n        '
+    yield '\n    </div>\n</div>\n'
+
+blocks = {'content': block_content}
+debug_info = '1=12&3=17&13=33&20=35&21=39&22=43&29=47&31=51&34=55&35=57&36=60&37=62&38=64&39=67&41=74&44=77&45=80&50=88&57=98&58=101&62=107&63=110'
\ No newline at end of file
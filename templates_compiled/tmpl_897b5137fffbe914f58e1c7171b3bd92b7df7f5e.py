@@ -0,0 +1,66 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'layout.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_title = resolve('title')
+    l_0_static_url = resolve('static_url')
+    l_0_active_tab = resolve('active_tab')
+    l_0_user = resolve('user')
+    try:
+        t_1 = environment.filters['default']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'default' found.")
+    try:
+        t_2 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="es" class="h-full bg-slate-50">\n\n<head>\n    <meta charset="UTF-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    <title>'
+    yield escape(t_1((undefined(name='title') if l_0_title is missing else l_0_title), 'CRM Agencia'))
+    yield '</title>\n    <script src="https://cdn.tailwindcss.com"></script>\n    <script>\n        tailwind.config = {\n            theme: {\n                extend: {\n                    colors: {\n                        primary: \'#0f172a\',\n                        secondary: \'#334155\',\n                        accent: \'#3b82f6\',\n                    },\n                    fontFamily: {\n                        sans: [\'Inter\', \'sans-serif\'],\n                    }\n                }\n            }\n        }\n    </script>\n    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n    <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'css/app.css'))
+    yield '" rel="stylesheet">\n</head>\n\n<body class="h-full flex flex-col">\n    <nav class="bg-primary text-white shadow-lg sticky top-0 z-50">\n        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">\n            <div class="flex items-center justify-between h-16">\n                <div class="flex items-center">\n                    <div class="flex-shrink-0">\n                        <a href="/"\n                            class="font-bold text-xl tracking-tight text-white hover:text-blue-100 transition-colors">CRM\n                            ADM TERRA</a>\n                    </div>\n                    <div class="hidden md:block">\n                        <div class="ml-10 flex items-baseline space-x-4">\n                            <a href="/"\n                                class="'
+    yield escape(('bg-slate-800 text-white' if ((undefined(name='active_tab') if l_0_active_tab is missing else l_0_active_tab) == 'dashboard') else 'text-slate-300 hover:bg-slate-700 hover:text-white'))
+    yield ' px-3 py-2 rounded-md text-sm font-medium transition-colors duration-200">Dashboard</a>\n                            <a href="/prospectos"\n                                class="'
+    yield escape(('bg-slate-800 text-white' if ((undefined(name='active_tab') if l_0_active_tab is missing else l_0_active_tab) == 'prospects') else 'text-slate-300 hover:bg-slate-700 hover:text-white'))
+    yield ' px-3 py-2 rounded-md text-sm font-medium transition-colors duration-200">Prospectos</a>\n                            <a href="/planning"\n                                class="'
+    yield escape(('bg-slate-800 text-white' if ((undefined(name='active_tab') if l_0_active_tab is missing else l_0_active_tab) == 'planning') else 'text-slate-300 hover:bg-slate-700 hover:text-white'))
+    yield ' px-3 py-2 rounded-md text-sm font-medium transition-colors duration-200">Planificación</a>\n                            <a href="/calendar"\n                                class="'
+    yield escape(('bg-slate-800 text-white' if ((undefined(name='active_tab') if l_0_active_tab is missing else l_0_active_tab) == 'calendar') else 'text-slate-300 hover:bg-slate-700 hover:text-white'))
+    yield ' px-3 py-2 rounded-md text-sm font-medium transition-colors duration-200">Calendario</a>\n                        </div>\n                    </div>\n                </div>\n                <div class="flex items-center">\n                    '
+    if (undefined(name='user') if l_0_user is missing else l_0_user):
+        pass
+        yield '\n                    <form method="GET" action="/buscar" class="hidden md:block">\n                        <input type="search" name="q" placeholder="Buscar..."\n                            class="w-48 rounded-md bg-slate-800 border border-slate-700 py-1.5 px-3 text-sm text-white placeholder-slate-400 focus:outline-none focus:border-accent">\n                    </form>\n                    <div class="relative ml-3">\n                        <button type="button"\n                            onclick="const menu = document.getElementById(\'user-menu\'); menu.classList.toggle(\'hidden\');"\n                            class="flex items-center space-x-3 text-sm focus:outline-none">\n                            <span class="text-slate-200 hidden sm:block">Hola, '
+        yield escape(environment.getattr((undefined(name='user') if l_0_user is missing else l_0_user), 'username'))
+        yield '</span>\n                            <div\n                                class="h-8 w-8 rounded-full bg-accent flex items-center justify-center text-white font-bold text-sm ring-2 ring-transparent hover:ring-white transition-all">\n                                '
+        yield escape(t_2(environment.getitem(environment.getattr((undefined(name='user') if l_0_user is missing else l_0_user), 'username'), 0)))
+        yield '\n                            </div>\n                        </button>\n\n                        <!-- Dropdown Menu -->\n                        <div id="user-menu"\n                            class="origin-top-right absolute right-0 mt-2 w-48 rounded-md shadow-lg py-1 bg-white ring-1 ring-black ring-opacity-5 hidden z-50">\n                            <a href="/profile" class="block px-4 py-2 text-sm text-gray-700 hover:bg-gray-100">Mi\n                                Perfil</a>\n                            <div class="border-t border-gray-100"></div>\n                            <a href="/logout" class="block px-4 py-2 text-sm text-red-600 hover:bg-red-50">Cerrar\n                                Sesión</a>\n                        </div>\n                    </div>\n                    '
+    else:
+        pass
+        yield '\n                    <a href="/login" class="text-sm text-white hover:text-blue-200">Iniciar Sesión</a>\n                    '
+    yield '\n                </div>\n            </div>\n        </div>\n    </nav>\n    <main class="flex-grow">\n        <div class="max-w-7xl mx-auto py-6 sm:px-6 lg:px-8">\n            '
+    yield from context.blocks['content'][0](context)
+    yield '\n        </div>\n    </main>\n    <!-- Contenedor de modales de tarea (se cargan bajo demanda) -->\n    <div id="task-modal-container"></div>\n    <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'js/app.js'))
+    yield '"></script>\n    <footer class="bg-white border-t border-slate-200 mt-auto">\n        <div class="max-w-7xl mx-auto py-4 px-4 sm:px-6 lg:px-8">\n            <p class="text-center text-sm text-slate-500">&copy; 2025 CRM ADM TERRA. Todos los derechos reservados.</p>\n        </div>\n    </footer>\n</body>\n\n</html>'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+
+blocks = {'content': block_content}
+debug_info = '7=28&26=30&42=32&44=34&46=36&48=38&53=40&62=43&65=45&88=51&93=53&88=56'
\ No newline at end of file
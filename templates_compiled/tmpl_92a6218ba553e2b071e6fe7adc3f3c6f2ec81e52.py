@@ -0,0 +1,130 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'prospect_detail.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('layout.html', 'prospect_detail.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_prospect = resolve('prospect')
+    l_0_users = resolve('users')
+    pass
+    yield '\n<div class="px-4 py-6 sm:px-0" data-live-events="/events?prospect_id='
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'id'))
+    yield '">\n    <!-- Breadcrumb -->\n    <nav class="flex mb-4" aria-label="Breadcrumb">\n        <ol class="inline-flex items-center space-x-1 md:space-x-3">\n            <li class="inline-flex items-center">\n                <a href="/prospectos" class="text-sm font-medium text-slate-500 hover:text-slate-700">Prospectos</a>\n            </li>\n            <li aria-current="page">\n                <div class="flex items-center">\n                    <svg class="w-6 h-6 text-slate-400" fill="currentColor" viewBox="0 0 20 20">\n                        <path fill-rule="evenodd"\n                            d="M7.293 14.707a1 1 0 010-1.414L10.586 10 7.293 6.707a1 1 0 011.414-1.414l4 4a1 1 0 010 1.414l-4 4a1 1 0 01-1.414 0z"\n                            clip-rule="evenodd"></path>\n                    </svg>\n                    <span class="ml-1 text-sm font-medium text-slate-800 md:ml-2">'
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'name'))
+    yield '</span>\n                </div>\n            </li>\n        </ol>\n    </nav>\n\n    <div class="bg-white shadow overflow-hidden sm:rounded-lg mb-8">\n        <div class="px-4 py-5 sm:px-6 flex justify-between items-center bg-slate-50 border-b border-gray-200">\n            <div>\n                <h3 class="text-lg leading-6 font-bold text-gray-900">Información del Prospecto</h3>\n                <p class="mt-1 max-w-2xl text-sm text-gray-500">Detalles de la empresa y contacto.</p>\n            </div>\n            <div class="flex space-x-2">\n                <!-- Botón de Edición -->\n                <button id="toggleEditBtn" onclick="toggleEditMode()"\n                    class="inline-flex items-center px-3 py-2 border border-gray-300 shadow-sm text-sm leading-4 font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none">\n                    ✏️ Editar\n                </button>\n\n                <!-- Botón de Eliminar -->\n                <form action="/prospectos/'
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'id'))
+    yield '/delete" method="POST"\n                    onsubmit="return confirm(\'¿Estás seguro de eliminar este prospecto?\');">\n                    <button type="submit"\n                        class="inline-flex items-center px-3 py-2 border border-transparent text-sm leading-4 font-medium rounded-md text-red-700 bg-red-100 hover:bg-red-200 focus:outline-none">\n                        🗑️ Eliminar\n                    </button>\n                </form>\n            </div>\n        </div>\n\n        <!-- Formulario (Modo Lectura por defecto, campos disabled) -->\n        <div class="border-t border-gray-200 px-4 py-5 sm:p-0">\n            <form id="prospectForm" action="/prospectos/'
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'id'))
+    yield '/update" method="POST">\n                <dl class="sm:divide-y sm:divide-gray-200">\n                    <!-- Nombre -->\n                    <div class="py-4 sm:py-5 sm:grid sm:grid-cols-3 sm:gap-4 sm:px-6">\n                        <dt class="text-sm font-medium text-gray-500">Nombre Empresa</dt>\n                        <dd class="mt-1 text-sm text-gray-900 sm:mt-0 sm:col-span-2">\n                            <input type="text" name="name" value="'
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'name'))
+    yield '" disabled\n                                class="editable-field bg-transparent border-none w-full text-gray-900 focus:ring-0 p-0 disabled:bg-transparent">\n                        </dd>\n                    </div>\n\n                    <!-- Estado -->\n                    <div class="py-4 sm:py-5 sm:grid sm:grid-cols-3 sm:gap-4 sm:px-6">\n                        <dt class="text-sm font-medium text-gray-500">Estado</dt>\n                        <dd class="mt-1 text-sm text-gray-900 sm:mt-0 sm:col-span-2">\n                            <select name="status" disabled\n                                class="editable-field bg-transparent border-none w-full text-gray-900 focus:ring-0 p-0 disabled:opacity-100">\n                                <option value="Nuevo" '
+    if (environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'status') == 'Nuevo'):
+        pass
+        yield 'selected'
+    yield '>Nuevo\n                                </option>\n                                <option value="Contactado" '
+    if (environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'status') == 'Contactado'):
+        pass
+        yield 'selected'
+    yield '>\n                                    Contactado</option>\n                                <option value="Interesado" '
+    if (environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'status') == 'Interesado'):
+        pass
+        yield 'selected'
+    yield '>\n                                    Interesado</option>\n                                <option value="Cliente" '
+    if (environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'status') == 'Cliente'):
+        pass
+        yield 'selected'
+    yield '>Cliente\n                                </option>\n                                <option value="Perdido" '
+    if (environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'status') == 'Perdido'):
+        pass
+        yield 'selected'
+    yield '>Perdido\n                                </option>\n                            </select>\n                        </dd>\n                    </div>\n\n                    <!-- Datos de Contacto -->\n                    <div class="py-4 sm:py-5 sm:grid sm:grid-cols-3 sm:gap-4 sm:px-6">\n                        <dt class="text-sm font-medium text-gray-500">Contacto</dt>\n                        <dd class="mt-1 text-sm text-gray-900 sm:mt-0 sm:col-span-2 space-y-2">\n                            <input type="text" name="contact_name" value="'
+    yield escape((environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'contact_name') or ''))
+    yield '" disabled\n                                placeholder="Nombre Contacto"\n                                class="editable-field block w-full bg-transparent border-none p-0 focus:ring-0 disabled:bg-transparent">\n                            <input type="text" name="phone" value="'
+    yield escape((environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'phone') or ''))
+    yield '" disabled\n                                placeholder="Teléfono"\n                                class="editable-field block w-full bg-transparent border-none p-0 focus:ring-0 disabled:bg-transparent">\n                            <input type="email" name="email" value="'
+    yield escape((environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'email') or ''))
+    yield '" disabled\n                                placeholder="Email"\n                                class="editable-field block w-full bg-transparent border-none p-0 focus:ring-0 disabled:bg-transparent">\n                        </dd>\n                    </div>\n\n                    <!-- Rubro y Dirección -->\n                    <div class="py-4 sm:py-5 sm:grid sm:grid-cols-3 sm:gap-4 sm:px-6">\n                        <dt class="text-sm font-medium text-gray-500">Detalles Adicionales</dt>\n                        <dd class="mt-1 text-sm text-gray-900 sm:mt-0 sm:col-span-2 space-y-2">\n                            <input type="text" name="industry" value="'
+    yield escape((environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'industry') or ''))
+    yield '" disabled\n                                placeholder="Rubro"\n                                class="editable-field block w-full bg-transparent border-none p-0 focus:ring-0 disabled:bg-transparent">\n                            <textarea name="address" rows="2" disabled placeholder="Dirección"\n                                class="editable-field block w-full bg-transparent border-none p-0 focus:ring-0 disabled:bg-transparent resize-none">'
+    yield escape((environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'address') or ''))
+    yield '</textarea>\n                        </dd>\n                    </div>\n                </dl>\n\n                <!-- Botón Guardar (Oculto por defecto) -->\n                <div id="saveBtnContainer"\n                    class="hidden px-4 py-3 bg-gray-50 text-right sm:px-6 border-t border-gray-200">\n                    <button type="submit"\n                        class="inline-flex justify-center py-2 px-4 border border-transparent shadow-sm text-sm font-medium rounded-md text-white bg-blue-600 hover:bg-blue-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-blue-500">\n                        Guardar Cambios\n                    </button>\n                    <button type="button" onclick="cancelEditMode()"\n                        class="ml-2 inline-flex justify-center py-2 px-4 border border-gray-300 shadow-sm text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none">\n                        Cancelar\n                    </button>\n                </div>\n            </form>\n        </div>\n    </div>\n\n    <!-- Sección de Tareas (Kanban Integrado) -->\n    <div class="mt-8">\n        <div class="flex justify-between items-center mb-4">\n            <h3 class="text-xl font-bold text-gray-900">Tablero de Tareas</h3>\n            <button onclick="document.getElementById(\'newLinkedTaskModal\').classList.remove(\'hidden\')"\n                class="inline-flex items-center px-3 py-2 border border-transparent shadow-sm text-sm leading-4 font-medium rounded-md text-white bg-blue-600 hover:bg-blue-700">\n                + Nueva Tarea\n            </button>\n        </div>\n\n        <div class="flex space-x-4 overflow-x-auto pb-4">\n            <!-- Column TODO -->\n            <div class="flex-1 min-w-[250px] bg-slate-100 rounded-lg p-3">\n                <h4 class="text-xs font-bold text-slate-500 uppercase tracking-widest mb-3">Pendiente</h4>\n                <div class="space-y-3" data-column="todo">\n                    '
+    def t_1(fiter):
+        for l_1_task in fiter:
+            if (environment.getattr(l_1_task, 'status') == 'todo'):
+                yield l_1_task
+    t_2 = 1
+    for l_1_task in t_1(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'tasks')):
+        l_1_task_card = resolve('task_card')
+        _loop_vars = {}
+        pass
+        yield '\n                    '
+        yield escape(context.call((undefined(name='task_card') if l_1_task_card is missing else l_1_task_card), l_1_task, _loop_vars=_loop_vars))
+        yield '\n                    '
+        t_2 = 0
+    l_1_task = l_1_task_card = missing
+    if t_2:
+        pass
+        yield '\n                    <p class="text-xs text-slate-400 italic text-center py-2">Nada pendiente</p>\n                    '
+    yield '\n                </div>\n            </div>\n\n            <!-- Column IN PROGRESS -->\n            <div class="flex-1 min-w-[250px] bg-blue-50 rounded-lg p-3">\n                <h4 class="text-xs font-bold text-blue-500 uppercase tracking-widest mb-3">En Progreso</h4>\n                <div class="space-y-3" data-column="in_progress">\n                    '
+    def t_3(fiter):
+        for l_1_task in fiter:
+            if (environment.getattr(l_1_task, 'status') == 'in_progress'):
+                yield l_1_task
+    for l_1_task in t_3(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'tasks')):
+        l_1_task_card = resolve('task_card')
+        _loop_vars = {}
+        pass
+        yield '\n                    '
+        yield escape(context.call((undefined(name='task_card') if l_1_task_card is missing else l_1_task_card), l_1_task, _loop_vars=_loop_vars))
+        yield '\n                    '
+    l_1_task = l_1_task_card = missing
+    yield '\n                </div>\n            </div>\n\n            <!-- Column DONE -->\n            <div class="flex-1 min-w-[250px] bg-green-50 rounded-lg p-3">\n                <div class="flex justify-between items-baseline mb-3">\n                    <h4 class="text-xs font-bold text-green-500 uppercase tracking-widest">Completado</h4>\n                    <a href="/planning/archivo?prospect_id='
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'id'))
+    yield '" class="text-xs text-green-600 hover:text-green-800">Archivo &rarr;</a>\n                </div>\n                <div class="space-y-3" data-column="done">\n                    '
+    def t_4(fiter):
+        for l_1_task in fiter:
+            if (environment.getattr(l_1_task, 'status') == 'done'):
+                yield l_1_task
+    for l_1_task in t_4(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'tasks')):
+        l_1_task_card = resolve('task_card')
+        _loop_vars = {}
+        pass
+        yield '\n                    '
+        yield escape(context.call((undefined(name='task_card') if l_1_task_card is missing else l_1_task_card), l_1_task, _loop_vars=_loop_vars))
+        yield '\n                    '
+    l_1_task = l_1_task_card = missing
+    yield '\n                </div>\n            </div>\n        </div>\n    </div>\n</div>\n\n<!-- Modal Nueva Tarea Vinculada -->\n<div id="newLinkedTaskModal"\n    class="hidden fixed inset-0 bg-gray-500 bg-opacity-75 flex items-center justify-center z-50">\n    <div class="bg-white rounded-lg p-6 w-full max-w-md">\n        <h3 class="text-lg font-medium text-gray-900 mb-4">Nueva Tarea para '
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'name'))
+    yield '</h3>\n        <form action="/tasks/create" method="POST">\n            <!-- ID del prospecto oculto -->\n            <input type="hidden" name="prospect_id" value="'
+    yield escape(environment.getattr((undefined(name='prospect') if l_0_prospect is missing else l_0_prospect), 'id'))
+    yield '">\n\n            <div class="space-y-4">\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Título</label>\n                    <input type="text" name="title" required\n                        class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                </div>\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Descripción</label>\n                    <textarea name="description" rows="3"\n                        class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm"></textarea>\n                </div>\n                <!-- Asignación -->\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Asignar a</label>\n                    <!-- Necesitamos pasar la lista de usuarios al template -->\n                    <!-- NOTA: Como \'users\' no se pasa por defecto a prospect_detail, debemos asumir que el backend lo envíe o usar una solución simple. \n                         Por ahora, enviaré la lista de usuarios desde el backend. -->\n                    <select name="assignee_ids" multiple\n                        class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm h-20">\n                        '
+    for l_1_u in (undefined(name='users') if l_0_users is missing else l_0_users):
+        _loop_vars = {}
+        pass
+        yield '\n                        <option value="'
+        yield escape(environment.getattr(l_1_u, 'id'))
+        yield '">'
+        yield escape(environment.getattr(l_1_u, 'username'))
+        yield '</option>\n                        '
+    l_1_u = missing
+    yield '\n                    </select>\n                </div>\n                <div class="grid grid-cols-2 gap-4">\n                    <div>\n                        <label class="block text-sm font-medium text-gray-700">Inicio</label>\n                        <input type="date" name="start_date"\n                            class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                    </div>\n                    <div>\n                        <label class="block text-sm font-medium text-gray-700">Fin</label>\n                        <input type="date" name="end_date"\n                            class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                    </div>\n                </div>\n            </div>\n            <div class="mt-5 flex justify-end space-x-3">\n                <button type="button" onclick="document.getElementById(\'newLinkedTaskModal\').classList.add(\'hidden\')"\n                    class="px-4 py-2 border border-gray-300 rounded-md text-sm font-medium text-gray-700 hover:bg-gray-50">Cancelar</button>\n                <button type="submit"\n                    class="px-4 py-2 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-blue-600 hover:bg-blue-700">Crear\n                    Tarea</button>\n            </div>\n        </form>\n    </div>\n</div>\n\n<script>\n    function toggleEditMode() {\n        const fields = document.querySelectorAll(\'.editable-field\');\n        const saveContainer = document.getElementById(\'saveBtnContainer\');\n        const editBtn = document.getElementById(\'toggleEditBtn\');\n\n        fields.forEach(field => {\n            field.disabled = false;\n            field.classList.remove(\'bg-transparent\', \'border-none\');\n            field.classList.add(\'bg-white\', \'border\', \'border-gray-300\', \'rounded\', \'px-2\', \'py-1\');\n        });\n\n        saveContainer.classList.remove(\'hidden\');\n        editBtn.classList.add(\'hidden\');\n    }\n\n    function cancelEditMode() {\n        // Recargar para descartar cambios\n        window.location.reload();\n    }\n</script>\n'
+
+blocks = {'content': block_content}
+debug_info = '1=12&3=17&4=28&18=30&38=32&50=34&56=36&67=38&69=42&71=46&73=50&75=54&85=58&88=60&91=62&101=64&105=66&141=68&142=78&153=86&154=95&163=99&166=101&167=110&179=114&182=116&203=118&204=122'
\ No newline at end of file
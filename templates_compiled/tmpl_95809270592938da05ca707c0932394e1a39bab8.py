@@ -0,0 +1,108 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/task_modal.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_task = resolve('task')
+    l_0_users = resolve('users')
+    pass
+    yield '<!-- Modal de Detalle: se pide bajo demanda a /tasks/{id}/modal al abrir una tarjeta -->\n<div id="task-modal-'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '" class="task-modal fixed inset-0 z-50 overflow-y-auto"\n    onclick="closeTaskModal(event, \'task-modal-'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '\')">\n    <!-- Backdrop -->\n    <div class="fixed inset-0 bg-black bg-opacity-50 transition-opacity"></div>\n\n    <!-- Modal Content -->\n    <div class="relative bg-white rounded-lg max-w-lg w-full mx-auto mt-20 p-6 shadow-xl transform transition-all"\n        onclick="event.stopPropagation()">\n\n        <!-- Header: Título y Botón Cerrar -->\n        <div class="flex justify-between items-start mb-4">\n            <h3 class="text-xl font-bold text-gray-900 pr-4">'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'title'))
+    yield '</h3>\n            <button onclick="closeTaskModalById(\'task-modal-'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '\')" class="text-gray-400 hover:text-gray-600">\n                <svg class="h-6 w-6" fill="none" viewBox="0 0 24 24" stroke="currentColor">\n                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M6 18L18 6M6 6l12 12" />\n                </svg>\n            </button>\n        </div>\n\n        <!-- Vista de Lectura (Default) -->\n        <div id="view-mode-'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '">\n            <!-- Estado (Botones de categoría) -->\n            <div class="mb-6 bg-slate-50 p-3 rounded-lg border border-slate-100">\n                <p class="text-xs font-semibold text-slate-500 uppercase tracking-wider mb-2">Estado Actual:\n                    '
+    if (environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'status') == 'todo'):
+        pass
+        yield 'Pendiente\n                    '
+    elif (environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'status') == 'in_progress'):
+        pass
+        yield 'En Progreso\n                    '
+    else:
+        pass
+        yield 'Completado'
+    yield '\n                </p>\n                <form action="/tasks/'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '/update_status" method="POST" class="flex space-x-2"\n                    onsubmit="return moveTaskFromModal(event, '
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield ')">\n                    <button type="submit" name="status" value="todo"\n                        class="'
+    yield escape(('bg-slate-700 text-white ring-2 ring-offset-1 ring-slate-700' if (environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'status') == 'todo') else 'bg-white text-slate-600 border border-slate-200 hover:bg-slate-50'))
+    yield ' flex-1 py-1.5 rounded text-xs font-medium transition-all">\n                        Pendiente\n                    </button>\n                    <button type="submit" name="status" value="in_progress"\n                        class="'
+    yield escape(('bg-blue-600 text-white ring-2 ring-offset-1 ring-blue-600' if (environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'status') == 'in_progress') else 'bg-white text-slate-600 border border-slate-200 hover:bg-blue-50'))
+    yield ' flex-1 py-1.5 rounded text-xs font-medium transition-all">\n                        En Progreso\n                    </button>\n                    <button type="submit" name="status" value="done"\n                        class="'
+    yield escape(('bg-green-600 text-white ring-2 ring-offset-1 ring-green-600' if (environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'status') == 'done') else 'bg-white text-slate-600 border border-slate-200 hover:bg-green-50'))
+    yield ' flex-1 py-1.5 rounded text-xs font-medium transition-all">\n                        Completado\n                    </button>\n                </form>\n            </div>\n\n            <div class="space-y-4 mb-6">\n                <div>\n                    <span class="block text-xs font-medium text-gray-500">Descripción</span>\n                    <p class="text-sm text-gray-800 whitespace-pre-line mt-1">'
+    yield escape((environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'description') or 'Sin descripción'))
+    yield '</p>\n                </div>\n\n                <div class="grid grid-cols-2 gap-4">\n                    <div>\n                        <span class="block text-xs font-medium text-gray-500">Prospecto Vinculado</span>\n                        <p class="text-sm font-medium text-blue-700 mt-1">\n                            '
+    if environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'prospect'):
+        pass
+        yield escape(environment.getattr(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'prospect'), 'name'))
+    else:
+        pass
+        yield '-'
+    yield '\n                        </p>\n                    </div>\n                    <div>\n                        <span class="block text-xs font-medium text-gray-500">Asignado a</span>\n                        <div class="flex items-center mt-1">\n                            '
+    t_1 = 1
+    for l_1_assignee in environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'assignees'):
+        _loop_vars = {}
+        pass
+        yield '\n                            <span\n                                class="inline-flex items-center px-2 py-0.5 rounded text-xs font-medium bg-gray-100 text-gray-800 mr-1">\n                                '
+        yield escape(environment.getattr(l_1_assignee, 'username'))
+        yield '\n                            </span>\n                            '
+        t_1 = 0
+    l_1_assignee = missing
+    if t_1:
+        pass
+        yield '\n                            <span class="text-sm text-gray-400">-</span>\n                            '
+    yield '\n                        </div>\n                    </div>\n                </div>\n\n                <div class="grid grid-cols-2 gap-4">\n                    <div>\n                        <span class="block text-xs font-medium text-gray-500">Fecha Inicio</span>\n                        <p class="text-sm text-gray-800 mt-1">'
+    yield escape((context.call(environment.getattr(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'start_date'), 'strftime'), '%d/%m/%Y') if environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'start_date') else '-'))
+    yield '</p>\n                    </div>\n                    <div>\n                        <span class="block text-xs font-medium text-gray-500">Fecha Fin</span>\n                        <p class="text-sm text-gray-800 mt-1">'
+    yield escape((context.call(environment.getattr(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'end_date'), 'strftime'), '%d/%m/%Y') if environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'end_date') else '-'))
+    yield '</p>\n                    </div>\n                </div>\n            </div>\n\n            <!-- Footer Acciones -->\n            <div class="flex justify-between items-center pt-4 border-t border-gray-100">\n                <form action="/tasks/'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '/delete" method="POST"\n                    onsubmit="return confirm(\'¿Borrar tarea definitivamente?\');">\n                    <button type="submit" class="text-red-500 hover:text-red-700 text-sm font-medium flex items-center">\n                        <svg class="w-4 h-4 mr-1" fill="none" stroke="currentColor" viewBox="0 0 24 24">\n                            <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"\n                                d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16">\n                            </path>\n                        </svg>\n                        Eliminar\n                    </button>\n                </form>\n                <button\n                    onclick="document.getElementById(\'view-mode-'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield "').classList.add('hidden'); document.getElementById('edit-mode-"
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '\').classList.remove(\'hidden\');"\n                    class="bg-white border border-gray-300 text-gray-700 hover:bg-gray-50 px-4 py-2 rounded-md text-sm font-medium transition-colors">\n                    Editar Información\n                </button>\n            </div>\n        </div>\n\n        <!-- Vista de Edición (Hidden) -->\n        <div id="edit-mode-'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '" class="hidden">\n            <h4 class="text-sm font-semibold text-gray-900 mb-4 uppercase tracking-wider">Modificar Tarea</h4>\n            <form action="/tasks/'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '/update" method="POST">\n                <div class="space-y-4">\n                    <div>\n                        <label class="block text-sm font-medium text-gray-700">Título</label>\n                        <input type="text" name="title" value="'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'title'))
+    yield '" required\n                            class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                    </div>\n                    <div>\n                        <label class="block text-sm font-medium text-gray-700">Descripción</label>\n                        <textarea name="description" rows="3"\n                            class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">'
+    yield escape((environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'description') or ''))
+    yield '</textarea>\n                    </div>\n                    <div class="grid grid-cols-2 gap-4">\n                        <div>\n                            <label class="block text-sm font-medium text-gray-700">Inicio</label>\n                            <input type="date" name="start_date"\n                                value="'
+    yield escape((context.call(environment.getattr(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'start_date'), 'strftime'), '%Y-%m-%d') if environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'start_date') else ''))
+    yield '"\n                                class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                        </div>\n                        <div>\n                            <label class="block text-sm font-medium text-gray-700">Fin</label>\n                            <input type="date" name="end_date"\n                                value="'
+    yield escape((context.call(environment.getattr(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'end_date'), 'strftime'), '%Y-%m-%d') if environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'end_date') else ''))
+    yield '"\n                                class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                        </div>\n                    </div>\n                    <div>\n                        <label class="block text-sm font-medium text-gray-700">Asignar a (Control + Click)</label>\n                        <select name="assignee_ids" multiple\n                            class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm h-24">\n                            '
+    for l_1_u in (undefined(name='users') if l_0_users is missing else l_0_users):
+        _loop_vars = {}
+        pass
+        yield '\n                            <option value="'
+        yield escape(environment.getattr(l_1_u, 'id'))
+        yield '" '
+        if (l_1_u in environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'assignees')):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(environment.getattr(l_1_u, 'username'))
+        yield '\n                            </option>\n                            '
+    l_1_u = missing
+    yield '\n                        </select>\n                    </div>\n                </div>\n                <div class="mt-6 flex justify-end space-x-3 pt-4 border-t border-gray-100">\n                    <button type="button"\n                        onclick="document.getElementById(\'edit-mode-'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield "').classList.add('hidden'); document.getElementById('view-mode-"
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '\').classList.remove(\'hidden\');"\n                        class="px-4 py-2 border border-gray-300 rounded-md text-sm font-medium text-gray-700 hover:bg-gray-50">\n                        Cancelar\n                    </button>\n                    <button type="submit"\n                        class="px-4 py-2 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-blue-600 hover:bg-blue-700">\n                        Guardar Cambios\n                    </button>\n                </div>\n            </form>\n        </div>\n\n    </div>\n</div>'
+
+blocks = {}
+debug_info = '2=14&3=16&13=18&14=20&22=22&26=24&27=27&30=34&31=36&33=38&37=40&41=42&50=44&58=46&64=54&67=58&79=66&84=68&92=70&104=72&112=76&114=78&118=80&124=82&130=84&136=86&144=88&145=92&153=102'
\ No newline at end of file
@@ -0,0 +1,56 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/choice_select.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_choice_select = missing
+    pass
+    yield '<!-- <select> de prospecto/usuario sin la lista completa: solo la opción elegida;\n     static/js/app.js agrega un buscador que pide las demás a source (/api/v1/.../choices) -->\n'
+    def macro(l_1_name, l_1_source, l_1_selected, l_1_label, l_1_empty, l_1_classes):
+        t_1 = []
+        if l_1_name is missing:
+            l_1_name = undefined("parameter 'name' was not provided", name='name')
+        if l_1_source is missing:
+            l_1_source = undefined("parameter 'source' was not provided", name='source')
+        if l_1_selected is missing:
+            l_1_selected = None
+        if l_1_label is missing:
+            l_1_label = 'name'
+        if l_1_empty is missing:
+            l_1_empty = 'Todos'
+        if l_1_classes is missing:
+            l_1_classes = 'mt-1 border border-gray-300 rounded-md py-1.5 px-2'
+        pass
+        t_1.extend((
+            '\n<select name="',
+            escape(l_1_name),
+            '" data-choices="',
+            escape(l_1_source),
+            '" class="',
+            escape(l_1_classes),
+            '">\n    <option value="">',
+            escape(l_1_empty),
+            '</option>\n    ',
+        ))
+        if l_1_selected:
+            pass
+            t_1.extend((
+                '\n    <option value="',
+                escape(environment.getattr(l_1_selected, 'id')),
+                '" selected>',
+                escape(environment.getitem(l_1_selected, l_1_label)),
+                '</option>\n    ',
+            ))
+        t_1.append(
+            '\n</select>\n',
+        )
+        return concat(t_1)
+    context.exported_vars.add('choice_select')
+    context.vars['choice_select'] = l_0_choice_select = Macro(environment, macro, 'choice_select', ('name', 'source', 'selected', 'label', 'empty', 'classes'), False, False, False, context.eval_ctx.autoescape)
+
+blocks = {}
+debug_info = '3=13&4=30&5=36&6=39&7=43'
\ No newline at end of file
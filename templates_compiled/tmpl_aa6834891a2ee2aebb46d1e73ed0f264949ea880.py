@@ -0,0 +1,104 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'archive.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    l_0_choice_select = missing
+    pass
+    parent_template = environment.get_template('layout.html', 'archive.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    included_template = environment.get_template('components/choice_select.html', 'archive.html')._get_default_module(context)
+    l_0_choice_select = getattr(included_template, 'choice_select', missing)
+    if l_0_choice_select is missing:
+        l_0_choice_select = undefined(f"the template {included_template.__name__!r} (imported on line 2 in 'archive.html') does not export the requested name 'choice_select'", name='choice_select')
+    context.vars['choice_select'] = l_0_choice_select
+    context.exported_vars.discard('choice_select')
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_archive_after_days = resolve('archive_after_days')
+    l_0_choice_select = resolve('choice_select')
+    l_0_selected_prospect = resolve('selected_prospect')
+    l_0_assignee = resolve('assignee')
+    l_0_tasks = resolve('tasks')
+    try:
+        t_1 = environment.filters['join']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'join' found.")
+    try:
+        t_2 = environment.filters['map']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'map' found.")
+    pass
+    yield '\n<div class="px-4 py-6 sm:px-0">\n    <div class="mb-6 flex justify-between items-center">\n        <div>\n            <h1 class="text-3xl font-bold text-slate-900">Archivo</h1>\n            <p class="mt-2 text-sm text-slate-600">Tareas completadas hace más de '
+    yield escape((undefined(name='archive_after_days') if l_0_archive_after_days is missing else l_0_archive_after_days))
+    yield ' días. Ya no aparecen en el tablero.</p>\n        </div>\n        <a href="/planning" class="text-sm font-medium text-blue-600 hover:text-blue-800">&larr; Volver al tablero</a>\n    </div>\n\n    <!-- Filtros -->\n    <form method="GET" action="/planning/archivo" class="mb-4 flex flex-wrap items-end gap-3 text-sm">\n        <div>\n            <label class="block text-xs font-medium text-slate-500">Prospecto</label>\n            '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'prospect_id', '/api/v1/prospects/choices', (undefined(name='selected_prospect') if l_0_selected_prospect is missing else l_0_selected_prospect), _block_vars=_block_vars))
+    yield '\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-slate-500">Asignado a</label>\n            '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'assignee_id', '/api/v1/users/choices', (undefined(name='assignee') if l_0_assignee is missing else l_0_assignee), label='username', _block_vars=_block_vars))
+    yield '\n        </div>\n        <button type="submit"\n            class="px-3 py-1.5 border border-gray-300 rounded-md font-medium text-gray-700 bg-white hover:bg-gray-50">Filtrar</button>\n        <a href="/planning/archivo" class="px-3 py-1.5 text-slate-500 hover:text-slate-700">Limpiar</a>\n    </form>\n\n    <div class="bg-white shadow overflow-hidden sm:rounded-lg">\n        <table class="min-w-full divide-y divide-gray-200 text-sm">\n            <thead class="bg-gray-50">\n                <tr>\n                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Tarea</th>\n                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Prospecto</th>\n                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Asignados</th>\n                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Entrega</th>\n                    <th class="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Completada</th>\n                </tr>\n            </thead>\n            <tbody class="bg-white divide-y divide-gray-200">\n                '
+    t_3 = 1
+    for l_1_task in (undefined(name='tasks') if l_0_tasks is missing else l_0_tasks):
+        _loop_vars = {}
+        pass
+        yield '\n                <tr>\n                    <td class="px-6 py-3">\n                        <div class="font-medium text-gray-900">'
+        yield escape(environment.getattr(l_1_task, 'title'))
+        yield '</div>\n                        '
+        if environment.getattr(l_1_task, 'description'):
+            pass
+            yield '\n                        <div class="text-xs text-gray-500 line-clamp-1">'
+            yield escape(environment.getattr(l_1_task, 'description'))
+            yield '</div>\n                        '
+        yield '\n                    </td>\n                    <td class="px-6 py-3 text-gray-600">\n                        '
+        if environment.getattr(l_1_task, 'prospect'):
+            pass
+            yield '<a href="/prospectos/'
+            yield escape(environment.getattr(environment.getattr(l_1_task, 'prospect'), 'id'))
+            yield '" class="hover:text-blue-600">'
+            yield escape(environment.getattr(environment.getattr(l_1_task, 'prospect'), 'name'))
+            yield '</a>'
+        else:
+            pass
+            yield '-'
+        yield '\n                    </td>\n                    <td class="px-6 py-3 text-gray-600">'
+        yield escape((t_1(context.eval_ctx, t_2(context, environment.getattr(l_1_task, 'assignees'), attribute='username'), ', ') or '-'))
+        yield '</td>\n                    <td class="px-6 py-3 text-gray-600">'
+        yield escape((context.call(environment.getattr(environment.getattr(l_1_task, 'end_date'), 'strftime'), '%d/%m/%Y', _loop_vars=_loop_vars) if environment.getattr(l_1_task, 'end_date') else '-'))
+        yield '</td>\n                    <td class="px-6 py-3 text-gray-600">'
+        yield escape((context.call(environment.getattr(environment.getattr(l_1_task, 'updated_at'), 'strftime'), '%d/%m/%Y', _loop_vars=_loop_vars) if environment.getattr(l_1_task, 'updated_at') else '-'))
+        yield '</td>\n                </tr>\n                '
+        t_3 = 0
+    l_1_task = missing
+    if t_3:
+        pass
+        yield '\n                <tr>\n                    <td colspan="5" class="px-6 py-10 text-center text-gray-500">No hay tareas archivadas.</td>\n                </tr>\n                '
+    yield '\n            </tbody>\n        </table>\n    </div>\n\n    '
+    l_1_param = 'after'
+    pass
+    template = environment.get_template('components/column_pager.html', 'archive.html')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {'param': l_1_param}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    l_1_param = missing
+    yield '\n</div>\n'
+
+blocks = {'content': block_content}
+debug_info = '1=13&2=16&4=24&9=50&18=52&22=54&41=57&44=61&45=63&46=66&50=69&52=80&53=82&54=84&65=94'
\ No newline at end of file
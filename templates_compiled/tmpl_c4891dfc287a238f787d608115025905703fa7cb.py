@@ -0,0 +1,121 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'profile.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('layout.html', 'profile.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_user = resolve('user')
+    l_0_feed_url = resolve('feed_url')
+    l_0_tasks = resolve('tasks')
+    l_0_subtasks = resolve('subtasks')
+    try:
+        t_1 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    pass
+    yield '\n<div class="max-w-4xl mx-auto px-4 py-8 sm:px-0">\n    <!-- Encabezado de Perfil -->\n    <div class="bg-white shadow overflow-hidden sm:rounded-lg mb-8">\n        <div class="px-4 py-5 sm:px-6 flex items-center justify-between">\n            <div class="flex items-center">\n                <div\n                    class="h-20 w-20 rounded-full bg-blue-600 flex items-center justify-center text-white text-3xl font-bold">\n                    '
+    yield escape(t_1(environment.getitem(environment.getattr((undefined(name='user') if l_0_user is missing else l_0_user), 'username'), 0)))
+    yield '\n                </div>\n                <div class="ml-6">\n                    <h3 class="text-2xl leading-6 font-bold text-gray-900">'
+    yield escape(environment.getattr((undefined(name='user') if l_0_user is missing else l_0_user), 'username'))
+    yield '</h3>\n                    <p class="mt-1 text-sm text-gray-500">'
+    yield escape((environment.getattr((undefined(name='user') if l_0_user is missing else l_0_user), 'email') or 'Sin correo registrado'))
+    yield '</p>\n                    <span\n                        class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-green-100 text-green-800 mt-2">\n                        Activo\n                    </span>\n                </div>\n            </div>\n            <!-- Botón Editar (Placeholder para futura implementación si se desea) -->\n            <!-- <button class="text-sm text-blue-600 hover:text-blue-900 border border-blue-600 rounded px-3 py-1">Editar Perfil</button> -->\n        </div>\n    </div>\n\n    <!-- Feed de calendario (.ics) -->\n    <div class="bg-white shadow overflow-hidden sm:rounded-lg mb-8">\n        <div class="px-4 py-5 sm:px-6">\n            <h3 class="text-lg leading-6 font-medium text-gray-900">Calendario (.ics)</h3>\n            <p class="mt-1 text-sm text-gray-500">Enlace privado para suscribirte desde tu cliente de calendario.\n                Si se filtró, regenéralo: los enlaces anteriores dejan de funcionar.</p>\n            <div class="mt-3 flex items-center gap-3">\n                <input type="text" readonly value="'
+    yield escape((undefined(name='feed_url') if l_0_feed_url is missing else l_0_feed_url))
+    yield '" onclick="this.select()"\n                    class="flex-1 text-xs text-gray-600 border border-gray-300 rounded-md px-2 py-1.5 bg-gray-50">\n                <form action="/profile/feed/regenerate" method="POST">\n                    <button type="submit"\n                        class="px-3 py-1.5 text-sm border border-gray-300 rounded-md font-medium text-gray-700 bg-white hover:bg-gray-50">Regenerar enlace</button>\n                </form>\n            </div>\n        </div>\n    </div>\n\n    <!-- Tareas Asignadas -->\n    <div class="bg-white shadow overflow-hidden sm:rounded-lg">\n        <div class="px-4 py-5 sm:px-6 border-b border-gray-200">\n            <h3 class="text-lg leading-6 font-medium text-gray-900">Mis Tareas Asignadas</h3>\n            <p class="mt-1 text-sm text-gray-500">Resumen de responsabilidades pendientes.</p>\n        </div>\n        <div class="p-4 bg-slate-50 min-h-[200px]">\n            '
+    if (undefined(name='tasks') if l_0_tasks is missing else l_0_tasks):
+        pass
+        yield '\n            <div class="grid grid-cols-1 gap-4 sm:grid-cols-2">\n                '
+        for l_1_task in (undefined(name='tasks') if l_0_tasks is missing else l_0_tasks):
+            l_1_task_card = resolve('task_card')
+            _loop_vars = {}
+            pass
+            yield '\n                '
+            yield escape(context.call((undefined(name='task_card') if l_1_task_card is missing else l_1_task_card), l_1_task, redirect_mode=True, _loop_vars=_loop_vars))
+            yield '\n                '
+        l_1_task = l_1_task_card = missing
+        yield '\n            </div>\n            '
+    else:
+        pass
+        yield '\n            <div class="text-center py-10">\n                <svg class="mx-auto h-12 w-12 text-gray-300" fill="none" viewBox="0 0 24 24" stroke="currentColor">\n                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2"\n                        d="M9 5H7a2 2 0 00-2 2v12a2 2 0 002 2h10a2 2 0 002-2V7a2 2 0 00-2-2h-2M9 5a2 2 0 002 2h2a2 2 0 002-2M9 5a2 2 0 012-2h2a2 2 0 012 2" />\n                </svg>\n                <h3 class="mt-2 text-sm font-medium text-gray-900">Sin tareas asignadas</h3>\n                <p class="mt-1 text-sm text-gray-500">¡Buen trabajo! No tienes pendientes.</p>\n            </div>\n            '
+    yield '\n        </div>\n    </div>\n\n    <!-- Personal Kanban (Subtareas) -->\n    <div class="mt-8">\n        <div class="flex justify-between items-center mb-4">\n            <h3 class="text-xl font-bold text-gray-900">Mi Espacio Personal</h3>\n            <button onclick="document.getElementById(\'newSubTaskModal\').classList.remove(\'hidden\')"\n                class="inline-flex items-center px-3 py-2 border border-transparent shadow-sm text-sm leading-4 font-medium rounded-md text-white bg-indigo-600 hover:bg-indigo-700">\n                + Nueva Subtarea\n            </button>\n        </div>\n\n        <div class="flex space-x-4 overflow-x-auto pb-4">\n            <!-- Columna TODO -->\n            <div class="flex-1 min-w-[250px] bg-slate-100 rounded-lg p-3 border border-slate-200">\n                <h4 class="text-xs font-bold text-slate-500 uppercase tracking-widest mb-3">Por Hacer</h4>\n                <div class="space-y-2">\n                    '
+    def t_2(fiter):
+        for l_1_sub in fiter:
+            if (environment.getattr(l_1_sub, 'status') == 'todo'):
+                yield l_1_sub
+    t_3 = 1
+    for l_1_sub in t_2((undefined(name='subtasks') if l_0_subtasks is missing else l_0_subtasks)):
+        l_1_subtask_card = resolve('subtask_card')
+        _loop_vars = {}
+        pass
+        yield '\n                    '
+        yield escape(context.call((undefined(name='subtask_card') if l_1_subtask_card is missing else l_1_subtask_card), l_1_sub, _loop_vars=_loop_vars))
+        yield '\n                    '
+        t_3 = 0
+    l_1_sub = l_1_subtask_card = missing
+    if t_3:
+        pass
+        yield '\n                    <p class="text-xs text-slate-400 italic text-center">Vacío</p>\n                    '
+    yield '\n                </div>\n            </div>\n\n            <!-- Columna DOING -->\n            <div class="flex-1 min-w-[250px] bg-indigo-50 rounded-lg p-3 border border-indigo-100">\n                <h4 class="text-xs font-bold text-indigo-500 uppercase tracking-widest mb-3">En Marcha</h4>\n                <div class="space-y-2">\n                    '
+    def t_4(fiter):
+        for l_1_sub in fiter:
+            if (environment.getattr(l_1_sub, 'status') == 'in_progress'):
+                yield l_1_sub
+    for l_1_sub in t_4((undefined(name='subtasks') if l_0_subtasks is missing else l_0_subtasks)):
+        l_1_subtask_card = resolve('subtask_card')
+        _loop_vars = {}
+        pass
+        yield '\n                    '
+        yield escape(context.call((undefined(name='subtask_card') if l_1_subtask_card is missing else l_1_subtask_card), l_1_sub, _loop_vars=_loop_vars))
+        yield '\n                    '
+    l_1_sub = l_1_subtask_card = missing
+    yield '\n                </div>\n            </div>\n\n            <!-- Columna DONE -->\n            <div class="flex-1 min-w-[250px] bg-emerald-50 rounded-lg p-3 border border-emerald-100">\n                <h4 class="text-xs font-bold text-emerald-500 uppercase tracking-widest mb-3">Listo</h4>\n                <div class="space-y-2">\n                    '
+    def t_5(fiter):
+        for l_1_sub in fiter:
+            if (environment.getattr(l_1_sub, 'status') == 'done'):
+                yield l_1_sub
+    for l_1_sub in t_5((undefined(name='subtasks') if l_0_subtasks is missing else l_0_subtasks)):
+        l_1_subtask_card = resolve('subtask_card')
+        _loop_vars = {}
+        pass
+        yield '\n                    '
+        yield escape(context.call((undefined(name='subtask_card') if l_1_subtask_card is missing else l_1_subtask_card), l_1_sub, _loop_vars=_loop_vars))
+        yield '\n                    '
+    l_1_sub = l_1_subtask_card = missing
+    yield '\n                </div>\n            </div>\n        </div>\n    </div>\n</div>\n\n<!-- Modal Nueva Subtarea -->\n<div id="newSubTaskModal" class="hidden fixed inset-0 bg-gray-500 bg-opacity-75 flex items-center justify-center z-50">\n    <div class="bg-white rounded-lg p-6 w-full max-w-sm">\n        <h3 class="text-lg font-medium text-gray-900 mb-4">Nueva Subtarea Personal</h3>\n        <form action="/subtasks/create" method="POST">\n            <div class="space-y-4">\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Título</label>\n                    <input type="text" name="title" required\n                        class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm">\n                </div>\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Vincular a Tarea Padre</label>\n                    <select name="task_id" required\n                        class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm">\n                        '
+    t_6 = 1
+    for l_1_task in (undefined(name='tasks') if l_0_tasks is missing else l_0_tasks):
+        _loop_vars = {}
+        pass
+        yield '\n                        <option value="'
+        yield escape(environment.getattr(l_1_task, 'id'))
+        yield '">'
+        yield escape(environment.getattr(l_1_task, 'title'))
+        yield '</option>\n                        '
+        t_6 = 0
+    l_1_task = missing
+    if t_6:
+        pass
+        yield '\n                        <option value="" disabled selected>No tienes tareas asignadas</option>\n                        '
+    yield '\n                    </select>\n                    <p class="mt-1 text-xs text-gray-500">Solo puedes crear subtareas de tareas asignadas a ti.</p>\n                </div>\n            </div>\n            <div class="mt-5 flex justify-end space-x-3">\n                <button type="button" onclick="document.getElementById(\'newSubTaskModal\').classList.add(\'hidden\')"\n                    class="px-4 py-2 border border-gray-300 rounded-md text-sm font-medium text-gray-700 hover:bg-gray-50">Cancelar</button>\n                <button type="submit"\n                    class="px-4 py-2 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-indigo-600 hover:bg-indigo-700">Crear</button>\n            </div>\n        </form>\n    </div>\n</div>\n'
+
+blocks = {'content': block_content}
+debug_info = '1=12&3=17&11=36&14=38&15=40&34=42&51=44&53=47&54=52&85=60&86=70&97=78&98=87&107=91&108=100&131=105&132=109'
\ No newline at end of file
@@ -0,0 +1,153 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'planning.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    l_0_choice_select = missing
+    pass
+    parent_template = environment.get_template('layout.html', 'planning.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    included_template = environment.get_template('components/choice_select.html', 'planning.html')._get_default_module(context)
+    l_0_choice_select = getattr(included_template, 'choice_select', missing)
+    if l_0_choice_select is missing:
+        l_0_choice_select = undefined(f"the template {included_template.__name__!r} (imported on line 2 in 'planning.html') does not export the requested name 'choice_select'", name='choice_select')
+    context.vars['choice_select'] = l_0_choice_select
+    context.exported_vars.discard('choice_select')
+    yield from parent_template.root_render_func(context)
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_live_events_url = resolve('live_events_url')
+    l_0_filters = resolve('filters')
+    l_0_user = resolve('user')
+    l_0_choice_select = resolve('choice_select')
+    l_0_selected_prospect = resolve('selected_prospect')
+    l_0_assignee = resolve('assignee')
+    l_0_creator = resolve('creator')
+    l_0_columns = resolve('columns')
+    l_0_users = resolve('users')
+    l_0_column = missing
+    try:
+        t_1 = environment.filters['urlencode']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'urlencode' found.")
+    pass
+    yield '\n<div class="px-4 py-6 sm:px-0 h-full flex flex-col"\n    data-live-events="'
+    yield escape((undefined(name='live_events_url') if l_0_live_events_url is missing else l_0_live_events_url))
+    yield '"\n    '
+    if ((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'industry') or environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'creator_id')) or (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'assignee_id') and (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'assignee_id') != environment.getattr((undefined(name='user') if l_0_user is missing else l_0_user), 'id')))):
+        pass
+        yield 'data-live-new="0"'
+    yield '>\n    <div class="mb-6 flex justify-between items-center">\n        <div>\n            <h1 class="text-3xl font-bold text-slate-900">Planificación</h1>\n            <p class="mt-2 text-sm text-slate-600">Tablero de tareas del equipo.</p>\n        </div>\n\n        <!-- Button trigger modal -->\n        <button onclick="document.getElementById(\'newTaskModal\').classList.remove(\'hidden\')"\n            class="inline-flex items-center px-4 py-2 border border-transparent shadow-sm text-sm font-medium rounded-md text-white bg-blue-600 hover:bg-blue-700">\n            + Nueva Tarea\n        </button>\n    </div>\n\n    <!-- Filtros -->\n    <form method="GET" action="/planning" class="mb-4 flex flex-wrap items-end gap-3 text-sm">\n        <div>\n            <label class="block text-xs font-medium text-slate-500">Prospecto</label>\n            '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'prospect_id', '/api/v1/prospects/choices', (undefined(name='selected_prospect') if l_0_selected_prospect is missing else l_0_selected_prospect), _block_vars=_block_vars))
+    yield '\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-slate-500">Asignado a</label>\n            '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'assignee_id', '/api/v1/users/choices', (undefined(name='assignee') if l_0_assignee is missing else l_0_assignee), label='username', _block_vars=_block_vars))
+    yield '\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-slate-500">Rubro</label>\n            <input type="text" name="industry" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'industry') or ''))
+    yield '"\n                class="mt-1 border border-gray-300 rounded-md py-1.5 px-2">\n        </div>\n        <div>\n            <label class="block text-xs font-medium text-slate-500">Creador del prospecto</label>\n            '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'creator_id', '/api/v1/users/choices', (undefined(name='creator') if l_0_creator is missing else l_0_creator), label='username', _block_vars=_block_vars))
+    yield '\n        </div>\n        <button type="submit"\n            class="px-3 py-1.5 border border-gray-300 rounded-md font-medium text-gray-700 bg-white hover:bg-gray-50">Filtrar</button>\n        <a href="/planning" class="px-3 py-1.5 text-slate-500 hover:text-slate-700">Limpiar</a>\n    </form>\n\n    <!-- Kanban Board -->\n    <div class="flex-grow flex space-x-4 overflow-x-auto pb-4">\n\n        <!-- Column TODO -->\n        '
+    l_0_column = environment.getitem((undefined(name='columns') if l_0_columns is missing else l_0_columns), 'todo')
+    _block_vars['column'] = l_0_column
+    yield '\n        <div class="flex-1 min-w-[300px] bg-slate-100 rounded-lg p-4">\n            <h3 class="text-sm font-semibold text-slate-700 uppercase tracking-wider mb-4">Pendiente</h3>\n            <div class="space-y-3" data-column="todo">\n                '
+    t_2 = 1
+    for l_1_task in environment.getattr((undefined(name='column') if l_0_column is missing else l_0_column), 'tasks'):
+        l_1_task_card = resolve('task_card')
+        _loop_vars = {}
+        pass
+        yield '\n                '
+        yield escape(context.call((undefined(name='task_card') if l_1_task_card is missing else l_1_task_card), l_1_task, _loop_vars=_loop_vars))
+        yield '\n                '
+        t_2 = 0
+    l_1_task = l_1_task_card = missing
+    if t_2:
+        pass
+        yield '\n                <p class="text-sm text-slate-400 text-center italic">Sin tareas pendientes</p>\n                '
+    yield '\n            </div>\n            '
+    l_1_param = 'todo_after'
+    pass
+    template = environment.get_template('components/column_pager.html', 'planning.html')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {'param': l_1_param, 'column': l_0_column}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    l_1_param = missing
+    yield '\n        </div>\n\n        <!-- Column IN PROGRESS -->\n        '
+    l_0_column = environment.getitem((undefined(name='columns') if l_0_columns is missing else l_0_columns), 'in_progress')
+    _block_vars['column'] = l_0_column
+    yield '\n        <div class="flex-1 min-w-[300px] bg-blue-50 rounded-lg p-4">\n            <h3 class="text-sm font-semibold text-blue-700 uppercase tracking-wider mb-4">En Progreso</h3>\n            <div class="space-y-3" data-column="in_progress">\n                '
+    for l_1_task in environment.getattr((undefined(name='column') if l_0_column is missing else l_0_column), 'tasks'):
+        l_1_task_card = resolve('task_card')
+        _loop_vars = {}
+        pass
+        yield '\n                '
+        yield escape(context.call((undefined(name='task_card') if l_1_task_card is missing else l_1_task_card), l_1_task, _loop_vars=_loop_vars))
+        yield '\n                '
+    l_1_task = l_1_task_card = missing
+    yield '\n            </div>\n            '
+    l_1_param = 'in_progress_after'
+    pass
+    template = environment.get_template('components/column_pager.html', 'planning.html')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {'param': l_1_param, 'column': l_0_column}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    l_1_param = missing
+    yield '\n        </div>\n\n        <!-- Column DONE -->\n        '
+    l_0_column = environment.getitem((undefined(name='columns') if l_0_columns is missing else l_0_columns), 'done')
+    _block_vars['column'] = l_0_column
+    yield '\n        <div class="flex-1 min-w-[300px] bg-green-50 rounded-lg p-4">\n            <div class="flex justify-between items-baseline mb-4">\n                <h3 class="text-sm font-semibold text-green-700 uppercase tracking-wider">Completado</h3>\n                <a href="/planning/archivo'
+    if (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'prospect_id') or environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'assignee_id')):
+        pass
+        yield '?'
+        yield escape(t_1({'prospect_id': (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'prospect_id') or ''), 'assignee_id': (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'assignee_id') or '')}))
+    yield '"\n                    class="text-xs text-green-700 hover:text-green-900">Archivo &rarr;</a>\n            </div>\n            <div class="space-y-3" data-column="done">\n                '
+    for l_1_task in environment.getattr((undefined(name='column') if l_0_column is missing else l_0_column), 'tasks'):
+        l_1_task_card = resolve('task_card')
+        _loop_vars = {}
+        pass
+        yield '\n                '
+        yield escape(context.call((undefined(name='task_card') if l_1_task_card is missing else l_1_task_card), l_1_task, _loop_vars=_loop_vars))
+        yield '\n                '
+    l_1_task = l_1_task_card = missing
+    yield '\n            </div>\n            '
+    l_1_param = 'done_after'
+    pass
+    template = environment.get_template('components/column_pager.html', 'planning.html')
+    gen = template.root_render_func(template.new_context(context.get_all(), True, {'param': l_1_param, 'column': l_0_column}))
+    try:
+        for event in gen:
+            yield event
+    finally: gen.close()
+    l_1_param = missing
+    yield '\n        </div>\n    </div>\n</div>\n\n<!-- Modal Nueva Tarea -->\n<div id="newTaskModal" class="hidden fixed inset-0 bg-gray-500 bg-opacity-75 flex items-center justify-center z-50">\n    <div class="bg-white rounded-lg p-6 w-full max-w-md">\n        <h3 class="text-lg font-medium text-gray-900 mb-4">Crear Nueva Tarea</h3>\n        <form action="/tasks/create" method="POST">\n            <div class="space-y-4">\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Título</label>\n                    <input type="text" name="title" required\n                        class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                </div>\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Descripción</label>\n                    <textarea name="description" rows="3"\n                        class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm"></textarea>\n                </div>\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Vincular a Prospecto (Opcional)</label>\n                    '
+    yield escape(context.call((undefined(name='choice_select') if l_0_choice_select is missing else l_0_choice_select), 'prospect_id', '/api/v1/prospects/choices', empty='-- Ninguno --', classes='mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm', _block_vars=_block_vars))
+    yield '\n                </div>\n                <div>\n                    <label class="block text-sm font-medium text-gray-700">Asignar a (Control + Click para\n                        múltiple)</label>\n                    <select name="assignee_ids" multiple\n                        class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm h-24">\n                        '
+    for l_1_u in (undefined(name='users') if l_0_users is missing else l_0_users):
+        _loop_vars = {}
+        pass
+        yield '\n                        <option value="'
+        yield escape(environment.getattr(l_1_u, 'id'))
+        yield '">'
+        yield escape(environment.getattr(l_1_u, 'username'))
+        yield '</option>\n                        '
+    l_1_u = missing
+    yield '\n                    </select>\n                </div>\n\n                <div class="grid grid-cols-2 gap-4">\n                    <div>\n                        <label class="block text-sm font-medium text-gray-700">Inicio (Opcional)</label>\n                        <input type="date" name="start_date"\n                            class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                    </div>\n                    <div>\n                        <label class="block text-sm font-medium text-gray-700">Fin (Opcional)</label>\n                        <input type="date" name="end_date"\n                            class="mt-1 block w-full border border-gray-300 rounded-md shadow-sm py-2 px-3 focus:outline-none focus:ring-blue-500 focus:border-blue-500 sm:text-sm">\n                    </div>\n                </div>\n            </div>\n            <div class="mt-5 flex justify-end space-x-3">\n                <button type="button" onclick="document.getElementById(\'newTaskModal\').classList.add(\'hidden\')"\n                    class="px-4 py-2 border border-gray-300 rounded-md text-sm font-medium text-gray-700 hover:bg-gray-50">Cancelar</button>\n                <button type="submit"\n                    class="px-4 py-2 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-blue-600 hover:bg-blue-700">Crear\n                    Tarea</button>\n            </div>\n        </form>\n    </div>\n</div>\n</div>\n\n<script>\n    // Auto-open modal if param exists\n    document.addEventListener("DOMContentLoaded", function () {\n        const urlParams = new URLSearchParams(window.location.search);\n        const taskId = urlParams.get(\'task_id\');\n        if (taskId) {\n            openTaskModal(taskId);\n            // Limpiar URL para no reabrir al refrescar (opcional pero recomendado)\n            window.history.replaceState({}, document.title, window.location.pathname);\n        }\n    });\n</script>\n'
+
+blocks = {'content': block_content}
+debug_info = '1=13&2=16&4=24&6=49&7=51&25=55&29=57&33=59&38=61&49=63&53=67&54=72&59=82&63=90&67=93&68=98&71=104&75=112&79=115&83=120&84=125&87=131&110=139&118=141&119=145'
\ No newline at end of file
@@ -0,0 +1,62 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'components/task_card.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_task = resolve('task')
+    l_0_redirect_mode = resolve('redirect_mode')
+    try:
+        t_1 = environment.filters['upper']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'upper' found.")
+    pass
+    yield '<!-- Task Card Minimalista -->\n<div data-task-id="'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+    yield '" data-position="'
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'position'))
+    yield '" '
+    if (undefined(name='redirect_mode') if l_0_redirect_mode is missing else l_0_redirect_mode):
+        pass
+        yield ' onclick="window.location.href=\'/planning?task_id='
+        yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+        yield '\'" '
+    else:
+        pass
+        yield '\n    onclick="openTaskModal('
+        yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'id'))
+        yield ')" '
+    yield '\n    class="bg-white p-4 rounded-lg shadow-sm border border-slate-200 cursor-pointer hover:shadow-md hover:border-blue-300 transition-all group">\n\n    <!-- Título -->\n    <h4\n        class="font-semibold text-slate-800 text-sm mb-3 line-clamp-2 leading-tight group-hover:text-blue-600 transition-colors">\n        '
+    yield escape(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'title'))
+    yield '\n    </h4>\n\n    <!-- Meta Info (Bottom) -->\n    <div class="flex items-center justify-between mt-auto">\n        <!-- Prospecto Tag -->\n        '
+    if environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'prospect'):
+        pass
+        yield '\n        <span\n            class="inline-flex items-center px-2 py-0.5 rounded text-[10px] font-medium bg-slate-100 text-slate-600 border border-slate-200 truncate max-w-[120px]">\n            🏢 '
+        yield escape(environment.getattr(environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'prospect'), 'name'))
+        yield '\n        </span>\n        '
+    else:
+        pass
+        yield '\n        <span></span> <!-- Spacer -->\n        '
+    yield '\n\n        <!-- Assignees Avatars -->\n        <div class="flex -space-x-1.5 ml-2">\n            '
+    for l_1_assignee in environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'assignees'):
+        _loop_vars = {}
+        pass
+        yield '\n            <div class="h-6 w-6 rounded-full bg-slate-100 border-2 border-white flex items-center justify-center text-[9px] font-bold text-slate-500 ring-1 ring-slate-100"\n                title="'
+        yield escape(environment.getattr(l_1_assignee, 'username'))
+        yield '">\n                '
+        yield escape(t_1(environment.getitem(environment.getattr(l_1_assignee, 'username'), 0)))
+        yield '\n            </div>\n            '
+    l_1_assignee = missing
+    yield '\n            '
+    if (not environment.getattr((undefined(name='task') if l_0_task is missing else l_0_task), 'assignees')):
+        pass
+        yield '\n            <div\n                class="h-6 w-6 rounded-full bg-slate-50 border-2 border-white flex items-center justify-center text-[9px] text-slate-300">\n                ?\n            </div>\n            '
+    yield '\n        </div>\n    </div>\n</div>'
+
+blocks = {}
+debug_info = '2=20&3=32&9=35&15=37&18=40&26=46&28=50&29=52&32=56'
\ No newline at end of file
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+from database import IS_SERVERLESS
+
+# Entorno de Jinja de la app.
+# - Se crea en el primer render (LazyTemplates): en serverless, un cold start
+#   que no renderiza HTML no paga el import de jinja2.
+# - Plantillas precompiladas a módulos Python (python templating.py build):
+#   si la salida corresponde a las plantillas actuales se cargan con
+#   ModuleLoader y no se parsea/compila nada en la primera petición. Si falta o
+#   quedó vieja, se usan las plantillas fuente.
+# - templates_compiled/ se versiona en el repo: el despliegue de Vercel
+#   (builder @vercel/python de vercel.json) no corre un paso de build propio,
+#   así que se sube tal cual. Al cambiar una plantilla o la versión de jinja2
+#   (fijada en requirements.txt) hay que correr python templating.py build y
+#   commitear la salida; tests/test_templates_compiled.py falla si quedó vieja.
+# - Con plantillas fuente, el código compilado se guarda en una caché de
+#   bytecode en disco: los procesos nuevos no vuelven a parsear/compilar.
+# - En producción auto_reload va apagado: las plantillas cargadas (y toda la
+#   cadena layout -> página -> componentes) se resuelven del caché del entorno
+#   sin revisar el mtime de cada archivo en cada render.
+
+BASE_DIR = Path(__file__).resolve().parent
+TEMPLATES_DIR = BASE_DIR / "templates"
+COMPILED_DIR = Path(os.getenv("TEMPLATES_COMPILED_DIR", BASE_DIR / "templates_compiled"))
+MANIFEST_NAME = "manifest.json"
+
+PRODUCTION = os.getenv("APP_ENV") == "production" or IS_SERVERLESS
+TEMPLATES_AUTO_RELOAD = os.getenv("TEMPLATES_AUTO_RELOAD", "0" if PRODUCTION else "1") == "1"
+# Directorio de la caché de bytecode: vacío = el temporal por defecto de Jinja
+# (escribible también en serverless), "off" = sin caché
+TEMPLATES_BYTECODE_DIR = os.getenv("TEMPLATES_BYTECODE_DIR", "")
+# Plantillas compiladas que guarda el entorno en memoria
+TEMPLATES_CACHE_SIZE = int(os.getenv("TEMPLATES_CACHE_SIZE", "400"))
+
+
+def _fingerprint() -> dict:
+    # Contenido de cada plantilla + versión de Jinja (el código generado depende de ella)
+    import jinja2
+
+    sources = {
+        path.relative_to(TEMPLATES_DIR).as_posix(): hashlib.sha1(path.read_bytes()).hexdigest()
+        for path in sorted(TEMPLATES_DIR.rglob("*.html"))
+    }
+    return {"jinja2": jinja2.__version__, "templates": sources}
+
+
+def _loader():
+    import jinja2
+
+    source_loader = jinja2.FileSystemLoader(TEMPLATES_DIR)
+    manifest_path = COMPILED_DIR / MANIFEST_NAME
+    if not manifest_path.exists():
+        return source_loader
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except ValueError:
+        manifest = None
+    if manifest != _fingerprint():
+        print(f"WARNING: Precompiled templates in {COMPILED_DIR} are stale. Using template sources.")
+        return source_loader
+    return jinja2.ModuleLoader(str(COMPILED_DIR))
+
+
+def _bytecode_cache():
+    if TEMPLATES_BYTECODE_DIR == "off":
+        return None
+    from jinja2 import FileSystemBytecodeCache
+
+    class BytecodeCache(FileSystemBytecodeCache):
+        # Un directorio de solo lectura (p. ej. la caché generada en el build y
+        # desplegada junto al código) se sigue leyendo; solo se omite escribir
+        def dump_bytecode(self, bucket):
+            try:
+                super().dump_bytecode(bucket)
+            except OSError:
+                pass
+
+    if TEMPLATES_BYTECODE_DIR:
+        Path(TEMPLATES_BYTECODE_DIR).mkdir(parents=True, exist_ok=True)
+        return BytecodeCache(TEMPLATES_BYTECODE_DIR)
+    return BytecodeCache()
+
+
+def make_environment(loader=None):
+    import jinja2
+
+    loader = loader or _loader()
+    # autoescape como el entorno por defecto de Jinja2Templates. Las plantillas
+    # precompiladas ya son código: ni bytecode ni comprobación de cambios.
+    precompiled = isinstance(loader, jinja2.ModuleLoader)
+    return jinja2.Environment(
+        loader=loader,
+        autoescape=True,
+        auto_reload=TEMPLATES_AUTO_RELOAD and not precompiled,
+        bytecode_cache=None if precompiled else _bytecode_cache(),
+        cache_size=TEMPLATES_CACHE_SIZE,
+    )
+
+
+def build():
+    """Precompila todas las plantillas en COMPILED_DIR (paso de build/deploy)."""
+    import jinja2
+
+    if COMPILED_DIR.exists():
+        shutil.rmtree(COMPILED_DIR)
+    COMPILED_DIR.mkdir(parents=True)
+    env = make_environment(jinja2.FileSystemLoader(TEMPLATES_DIR))
+    env.compile_templates(str(COMPILED_DIR), zip=None, ignore_errors=False)
+    (COMPILED_DIR / MANIFEST_NAME).write_text(json.dumps(_fingerprint(), indent=2, sort_keys=True), encoding="utf-8")
+    print(f"INFO: Compiled {len(env.list_templates())} templates into {COMPILED_DIR}.")
+    # Con un directorio de bytecode configurado se llena también, para el caso
+    # en que el proceso termine usando las plantillas fuente
+    if TEMPLATES_BYTECODE_DIR and TEMPLATES_BYTECODE_DIR != "off":
+        for name in env.list_templates():
+            env.get_template(name)
+        print(f"INFO: Template bytecode cache written to {TEMPLATES_BYTECODE_DIR}.")
+
+
+class LazyTemplates:
+    """Jinja2Templates que se construye en el primer uso.
+
+    setup: funciones que reciben el Environment recién creado (instrumentación,
+    globals), aplicadas una sola vez.
+    """
+
+    def __init__(self, setup=()):
+        self._setup = setup
+        self._templates = None
+        self._lock = threading.Lock()
+
+    def _get(self):
+        if self._templates is None:
+            with self._lock:
+                if self._templates is None:
+                    from fastapi.templating import Jinja2Templates
+
+                    templates = Jinja2Templates(env=make_environment())
+                    for setup in self._setup:
+                        setup(templates.env)
+                    self._templates = templates
+        return self._templates
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["build"]:
+        print("Uso: python templating.py build")
+        sys.exit(1)
+    build()
@@ -0,0 +1,137 @@
+"""Regresión de consultas SQL por petición en las páginas principales.
+
+Cada página debe hacer un número fijo de consultas, sin importar cuántos
+prospectos, tareas o asignados haya (sin N+1). Se mide con la cabecera
+Server-Timing (metrics.py) sobre una base SQLite temporal, con pocos datos y
+de nuevo después de multiplicarlos.
+
+Uso:
+    python -m pytest -q tests
+"""
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/query_counts.db"
+os.environ.pop("DATABASE_REPLICA_URLS", None)
+# Sin hilos en segundo plano que consulten la base durante la medición
+os.environ["ARCHIVE_INTERVAL"] = "0"
+os.environ["JOBS_WORKERS"] = "0"
+os.environ.setdefault("SLOW_REQUEST_MS", "60000")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import func, insert, select  # noqa: E402
+
+import auth  # noqa: E402
+import database  # noqa: E402
+import main  # noqa: E402
+import models  # noqa: E402
+import stats  # noqa: E402
+
+QUERIES_RE = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+# Consultas esperadas por página (con las cachés de identidad ya cargadas)
+EXPECTED = {
+    "/": 1,
+    "/prospectos": 1,
+    "/planning": 7,
+    "/calendar": 3,  # incluye la versión del token del feed .ics
+    "/profile": 3,
+}
+
+USERS = 5
+STATUSES = ["Nuevo", "Contactado", "Interesado", "Cliente", "Perdido"]
+TASK_STATUSES = [status.value for status in models.TaskStatus]
+
+
+def _grow(prospects: int):
+    """Agrega prospectos con notas, tareas (con asignados y subtareas) e historial."""
+    db = database.SessionLocal()
+    try:
+        now = datetime.utcnow()
+        start = db.scalar(select(func.count()).select_from(models.Prospect))
+        for i in range(start, start + prospects):
+            prospect = models.Prospect(name=f"Prospecto {i}", industry="retail", status=STATUSES[i % len(STATUSES)],
+                                       created_by_id=i % USERS + 1)
+            db.add(prospect)
+            db.flush()
+            db.add(models.Note(content=f"Nota {i}", prospect_id=prospect.id))
+            task = models.Task(title=f"Tarea {i}", status=TASK_STATUSES[i % len(TASK_STATUSES)],
+                               prospect_id=prospect.id, start_date=now, end_date=now + timedelta(days=i % 20),
+                               position=i)
+            db.add(task)
+            db.flush()
+            # Siempre el usuario 1 (el de las peticiones) y otro más
+            assignees = {1, i % USERS + 1}
+            db.execute(insert(models.task_assignments), [{"task_id": task.id, "user_id": u} for u in assignees])
+            db.add(models.SubTask(title=f"Subtarea {i}", status=TASK_STATUSES[i % len(TASK_STATUSES)],
+                                  user_id=1, task_id=task.id))
+        db.commit()
+        stats.rebuild(db)
+    finally:
+        db.close()
+
+
+def _queries(client, path: str) -> int:
+    response = client.get(path)
+    assert response.status_code == 200, (path, response.status_code)
+    match = QUERIES_RE.search(response.headers.get("server-timing", ""))
+    assert match, (path, response.headers.get("server-timing"))
+    return int(match.group(1))
+
+
+def _measure(client) -> dict:
+    for path in EXPECTED:  # calienta la caché de identidad y los fragmentos
+        client.get(path)
+    return {path: _queries(client, path) for path in EXPECTED}
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as client:
+        db = database.SessionLocal()
+        db.execute(insert(models.User), [
+            {"id": i, "username": f"user{i}", "email": f"user{i}@crm.test", "hashed_password": "x", "is_active": True}
+            for i in range(1, USERS + 1)
+        ])
+        db.commit()
+        db.close()
+        client.cookies.set("access_token", auth.create_access_token({"sub": "user1"}))
+        yield client
+
+
+def test_query_counts_do_not_grow_with_data(client):
+    _grow(10)
+    small = _measure(client)
+    _grow(200)
+    large = _measure(client)
+    assert small == EXPECTED
+    assert large == EXPECTED
+
+
+def test_choice_selects_are_bounded(client):
+    # Los <select> de prospecto/usuario traen solo la opción elegida (una
+    # consulta más, a lo sumo, por filtro aplicado); el resto se pide por nombre a la API
+    _grow(30)
+    page = client.get("/planning")
+    assert "Prospecto 1<" not in page.text
+    assert _queries(client, "/calendar?prospect_id=3&assignee_id=2") <= EXPECTED["/calendar"] + 2
+    assert ">Prospecto 2</option>" in client.get("/calendar?prospect_id=3").text
+
+    first = client.get("/api/v1/prospects/choices", params={"limit": 5}).json()
+    assert len(first["items"]) == 5 and first["next_cursor"]
+    following = client.get("/api/v1/prospects/choices", params={"limit": 5, "after": first["next_cursor"]}).json()
+    assert not {item["id"] for item in first["items"]} & {item["id"] for item in following["items"]}
+
+    found = client.get("/api/v1/prospects/choices", params={"q": "ecto 1"}).json()["items"]
+    assert found and all("ecto 1" in item["name"] for item in found)
+    assert client.get("/api/v1/prospects/choices", params={"q": "%"}).json()["items"] == []
+    users = client.get("/api/v1/users/choices", params={"q": "USER"}).json()["items"]
+    assert [user["name"] for user in users] == [f"user{i}" for i in range(1, USERS + 1)]
@@ -0,0 +1,32 @@
+"""Las plantillas precompiladas versionadas (templates_compiled/) están al día.
+
+En Vercel no hay paso de build: se despliega la salida commiteada de
+python templating.py build. Si una plantilla cambió sin volver a compilar, la
+app cae a las plantillas fuente y el cold start vuelve a parsear/compilar.
+
+Uso:
+    python -m pytest -q tests
+"""
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/templates_compiled.db")
+
+import templating  # noqa: E402
+from jinja2 import ModuleLoader  # noqa: E402
+
+SHIPPED_DIR = ROOT / "templates_compiled"
+
+
+def test_shipped_templates_match_sources():
+    manifest_path = SHIPPED_DIR / templating.MANIFEST_NAME
+    assert manifest_path.exists(), "Falta templates_compiled/: correr python templating.py build"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert manifest == templating._fingerprint(), "templates_compiled/ vieja: correr python templating.py build"
+    for name in manifest["templates"]:
+        assert (SHIPPED_DIR / ModuleLoader.get_module_filename(name)).exists(), name